@@ -13,6 +13,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/waterSu1031/trade",
     packages=find_packages(),
+    package_data={"tradelib": ["strategies.json"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from tradelib.ibkr.scheduler import (
+    IBKRRequestScheduler, TokenBucket, PRIORITY_HIGH, PRIORITY_LOW, REQUEST_HISTORICAL, gather_limited
+)
+
+
+def test_token_bucket_burst_and_refill():
+    """토큰 버킷 버스트/충전 테스트"""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    now = bucket.updated
+    assert bucket.try_acquire(now) == 0
+    assert bucket.try_acquire(now) == 0
+    assert bucket.try_acquire(now) == pytest.approx(1.0)
+    assert bucket.try_acquire(now + 1.0) == 0
+
+
+def test_token_bucket_penalize():
+    """pacing 위반 시 차단 테스트"""
+    bucket = TokenBucket(rate=10.0, capacity=10)
+    now = bucket.updated
+    bucket.penalize(5.0, now)
+    assert bucket.try_acquire(now + 1.0) == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priority_order():
+    """우선순위가 높은 요청이 먼저 실행되는지 테스트"""
+    scheduler = IBKRRequestScheduler(limits={REQUEST_HISTORICAL: (100.0, 1)},
+                                     max_in_flight={REQUEST_HISTORICAL: 1})
+    order = []
+
+    def request(name):
+        async def run():
+            order.append(name)
+            return name
+        return run
+
+    first = asyncio.create_task(scheduler.submit(REQUEST_HISTORICAL, request("first")))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(scheduler.submit(REQUEST_HISTORICAL, request("low"), PRIORITY_LOW))
+    high = asyncio.create_task(scheduler.submit(REQUEST_HISTORICAL, request("high"), PRIORITY_HIGH))
+    assert await asyncio.gather(first, low, high) == ["first", "low", "high"]
+    assert order == ["first", "high", "low"]
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_after_pacing_violation():
+    """pacing 위반 보고 후 빈 결과는 백오프 뒤 재시도"""
+    scheduler = IBKRRequestScheduler(limits={REQUEST_HISTORICAL: (100.0, 10)}, base_backoff=0.01)
+    calls = []
+
+    async def request():
+        calls.append(1)
+        if len(calls) == 1:
+            scheduler.on_ib_error(1, 162, "Historical Market Data Service error message: pacing violation")
+            return []
+        return ["bar"]
+
+    assert await scheduler.submit(REQUEST_HISTORICAL, request) == ["bar"]
+    assert len(calls) == 2
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_bounds_concurrency():
+    """동시 실행 수 제한 및 입력 순서대로 결과 반환 테스트"""
+    running = 0
+    peak = 0
+
+    async def work(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (x % 3))
+        running -= 1
+        return x * 2
+
+    results = await gather_limited(work, range(20), limit=4)
+    assert results == [x * 2 for x in range(20)]
+    assert peak == 4
+    assert await gather_limited(work, [], limit=4) == []
+
+
+@pytest.mark.asyncio
+async def test_manager_requeues_on_pacing_error_event():
+    """ib.errorEvent 로 162(pacing 위반)가 오면 IBKRManager 요청이 백오프 후 다시 실행"""
+    from ib_insync import BarData
+    from tradelib.ibkr import IBKRManager
+
+    scheduler = IBKRRequestScheduler(limits={REQUEST_HISTORICAL: (100.0, 10)}, base_backoff=0.2)
+    manager = IBKRManager(scheduler)
+    calls = []
+
+    async def req_historical(contract, **kwargs):
+        calls.append(asyncio.get_running_loop().time())
+        if len(calls) == 1:
+            # IB 가 요청 도중 pacing 위반을 errorEvent 로 알리고 빈 결과 반환
+            manager.ib.errorEvent.emit(1, 162, "Historical Market Data Service error message: pacing violation",
+                                       contract)
+            return []
+        return [BarData(date="20240102 10:00:00", open=1.0, high=2.0, low=0.5, close=1.5, volume=10,
+                        average=1.2, barCount=3)]
+
+    manager.ib.reqHistoricalDataAsync = req_historical
+    bars = await manager.get_historical_data("ES", "CME")
+
+    assert [bar["close"] for bar in bars] == [1.5]
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.19          # base_backoff 만큼 차단 후 재시도
+    assert scheduler._violations[REQUEST_HISTORICAL] == 1
+    assert scheduler._backoff[REQUEST_HISTORICAL] == 0.0  # 성공 후 백오프 초기화
+    await scheduler.stop()
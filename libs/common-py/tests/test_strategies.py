@@ -0,0 +1,17 @@
+from tradelib.strategies import get_strategy, load_strategies, write_strategies
+
+
+def test_manifest_round_trip(tmp_path):
+    """매니페스트 저장/조회 테스트"""
+    path = tmp_path / "strategies.json"
+    write_strategies([{"name": "A", "description": "", "version": "1.0.0", "parameters": {"window": 10}}], path)
+    assert [s["name"] for s in load_strategies(path)] == ["A"]
+    assert get_strategy("A", path)["parameters"] == {"window": 10}
+    assert get_strategy("B", path) is None
+    assert load_strategies(tmp_path / "missing.json") == []
+
+
+def test_packaged_manifest():
+    """패키지에 포함된 기본 매니페스트 테스트"""
+    names = [s["name"] for s in load_strategies()]
+    assert "Example1Strategy" in names
@@ -1,4 +1,31 @@
 from .client import IBKRManager
 from .converters import ibkr_to_dict
+from .scheduler import (
+    IBKRRequestScheduler,
+    TokenBucket,
+    gather_limited,
+    DEFAULT_JOB_CONCURRENCY,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+    REQUEST_HISTORICAL,
+    REQUEST_CONTRACT_DETAILS,
+    REQUEST_MARKET_DATA,
+    REQUEST_GENERAL,
+)
 
-__all__ = ["IBKRManager", "ibkr_to_dict"]
\ No newline at end of file
+__all__ = [
+    "IBKRManager",
+    "ibkr_to_dict",
+    "IBKRRequestScheduler",
+    "TokenBucket",
+    "gather_limited",
+    "DEFAULT_JOB_CONCURRENCY",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
+    "REQUEST_HISTORICAL",
+    "REQUEST_CONTRACT_DETAILS",
+    "REQUEST_MARKET_DATA",
+    "REQUEST_GENERAL",
+]
\ No newline at end of file
@@ -2,17 +2,26 @@ from ib_insync import IB, Contract, Stock, Future, Option, Forex, Index
 from typing import Dict, List, Any, Optional
 import logging
 from tradelib.ibkr.converters import ibkr_to_dict
+from tradelib.ibkr.scheduler import (
+    IBKRRequestScheduler, PRIORITY_NORMAL,
+    REQUEST_HISTORICAL, REQUEST_CONTRACT_DETAILS, REQUEST_GENERAL
+)
 import asyncio
 
 logger = logging.getLogger(__name__)
 
 
 class IBKRManager:
-    """IBKR 연결 관리자 - Dict 기반"""
+    """IBKR 연결 관리자 - Dict 기반
+
+    모든 요청은 scheduler(IBKRRequestScheduler) 를 거쳐 pacing 한도 내에서 실행된다.
+    """
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[IBKRRequestScheduler] = None):
         self.ib = IB()
         self._connected = False
+        self.scheduler = scheduler or IBKRRequestScheduler()
+        self.ib.errorEvent += self.scheduler.on_ib_error
     
     async def connect(self, host: str, port: int, client_id: int):
         """IBKR 게이트웨이 연결"""
@@ -30,6 +39,7 @@ class IBKRManager:
     async def disconnect(self):
         """연결 해제"""
         if self._connected:
+            await self.scheduler.stop()
             self.ib.disconnect()
             self._connected = False
             logger.info("Disconnected from IBKR")
@@ -38,7 +48,8 @@ class IBKRManager:
         """연결 상태 확인"""
         return self._connected
     
-    async def get_contract_details(self, symbol: str, exchange: str, sec_type: str = "STK") -> List[Dict[str, Any]]:
+    async def get_contract_details(self, symbol: str, exchange: str, sec_type: str = "STK",
+                                   priority: int = PRIORITY_NORMAL) -> List[Dict[str, Any]]:
         """계약 상세 정보를 Dict로 반환"""
         # Contract 객체 생성
         if sec_type == "STK":
@@ -58,23 +69,29 @@ class IBKRManager:
             contract.secType = sec_type
         
         # 상세 정보 요청
-        details_list = await self.ib.reqContractDetailsAsync(contract)
+        details_list = await self.scheduler.submit(
+            REQUEST_CONTRACT_DETAILS, lambda: self.ib.reqContractDetailsAsync(contract), priority
+        )
         
         # Dict로 변환하여 반환
         return [ibkr_to_dict(details) for details in details_list]
     
     async def get_historical_data(self, symbol: str, exchange: str, duration: str = "1 D", 
-                                 bar_size: str = "1 hour") -> List[Dict[str, Any]]:
+                                 bar_size: str = "1 hour", priority: int = PRIORITY_NORMAL) -> List[Dict[str, Any]]:
         """과거 데이터를 Dict로 반환"""
         contract = Stock(symbol, exchange, 'USD')
         
-        bars = await self.ib.reqHistoricalDataAsync(
-            contract,
-            endDateTime='',
-            durationStr=duration,
-            barSizeSetting=bar_size,
-            whatToShow='TRADES',
-            useRTH=True
+        bars = await self.scheduler.submit(
+            REQUEST_HISTORICAL,
+            lambda: self.ib.reqHistoricalDataAsync(
+                contract,
+                endDateTime='',
+                durationStr=duration,
+                barSizeSetting=bar_size,
+                whatToShow='TRADES',
+                useRTH=True
+            ),
+            priority
         )
         
         # BarData를 Dict로 변환
@@ -95,7 +112,7 @@ class IBKRManager:
     
     async def get_positions(self) -> List[Dict[str, Any]]:
         """포지션을 Dict로 반환"""
-        positions = await self.ib.reqPositionsAsync()
+        positions = await self.scheduler.submit(REQUEST_GENERAL, self.ib.reqPositionsAsync)
         
         result = []
         for pos in positions:
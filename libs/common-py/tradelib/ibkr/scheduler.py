@@ -0,0 +1,217 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청 분류
+REQUEST_HISTORICAL = "historical"
+REQUEST_CONTRACT_DETAILS = "contract_details"
+REQUEST_MARKET_DATA = "market_data"
+REQUEST_GENERAL = "general"
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+# 분류별 (초당 충전 속도, 버킷 용량)
+# historical: 용량 6 + 0.09/s x 600s = 10분 60건 이내
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    REQUEST_HISTORICAL: (0.09, 6),
+    REQUEST_CONTRACT_DETAILS: (10.0, 10),
+    REQUEST_MARKET_DATA: (40.0, 40),
+    REQUEST_GENERAL: (40.0, 40),
+}
+
+# 분류별 동시 진행 요청 한도
+DEFAULT_MAX_IN_FLIGHT: Dict[str, int] = {
+    REQUEST_HISTORICAL: 50,
+    REQUEST_CONTRACT_DETAILS: 20,
+    REQUEST_MARKET_DATA: 50,
+    REQUEST_GENERAL: 20,
+}
+
+# pacing 위반 에러 코드 → 해당 분류 (None 이면 전체)
+PACING_ERROR_CODES: Dict[int, Optional[str]] = {
+    100: None,                  # Max rate of messages per second has been exceeded
+    162: REQUEST_HISTORICAL,    # Historical Market Data Service error (pacing violation)
+    420: REQUEST_MARKET_DATA,   # Invalid real-time query (pacing violation)
+}
+
+# 배치 작업에서 동시에 처리하는 항목 수 (IBKR 요청 + DB 저장)
+DEFAULT_JOB_CONCURRENCY = 10
+
+
+class TokenBucket:
+    """토큰 버킷 - capacity 만큼 버스트 허용, rate(개/초) 로 충전"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: Optional[float] = None) -> float:
+        """토큰 1개 획득 시도 - 성공 시 0, 실패 시 필요한 대기 시간(초)"""
+        now = time.monotonic() if now is None else now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def penalize(self, seconds: float, now: Optional[float] = None):
+        """pacing 위반 시 seconds 동안 차단하고 버킷 비움"""
+        now = time.monotonic() if now is None else now
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = max(self.updated, now)
+
+
+class PacingViolation(Exception):
+    """IBKR pacing 위반으로 재시도가 필요한 요청"""
+
+
+class IBKRRequestScheduler:
+    """IBKR 요청 중앙 스케줄러
+
+    요청 분류별 토큰 버킷 + 우선순위 큐로 pacing 한도 내 최대 처리량을 낸다.
+    pacing 위반이 보고되면 해당 분류를 지수 백오프로 차단하고 요청을 다시 큐에 넣는다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 max_in_flight: Optional[Dict[str, int]] = None,
+                 base_backoff: float = 10.0, max_backoff: float = 600.0, max_retries: int = 3):
+        limits = {**DEFAULT_LIMITS, **(limits or {})}
+        max_in_flight = {**DEFAULT_MAX_IN_FLIGHT, **(max_in_flight or {})}
+        self.buckets = {name: TokenBucket(rate, capacity) for name, (rate, capacity) in limits.items()}
+        self.max_in_flight = max_in_flight
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._in_flight: Dict[str, asyncio.Semaphore] = {}
+        self._violations: Dict[str, int] = {name: 0 for name in self.buckets}
+        self._backoff: Dict[str, float] = {name: 0.0 for name in self.buckets}
+        self._running: set = set()
+        self._seq = itertools.count()
+
+    async def submit(self, request_class: str, factory: Callable[[], Awaitable[Any]],
+                     priority: int = PRIORITY_NORMAL) -> Any:
+        """요청을 큐에 넣고 결과를 기다림
+
+        :param factory: 호출 시 IBKR 요청 코루틴을 새로 만드는 함수 (재시도 시 다시 호출)
+        """
+        if request_class not in self.buckets:
+            raise ValueError(f"알 수 없는 요청 분류: {request_class}")
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker(request_class)
+        await self._queues[request_class].put((priority, next(self._seq), factory, future, 0))
+        return await future
+
+    def report_pacing_violation(self, request_class: Optional[str] = None):
+        """pacing 위반 보고 - 해당 분류(없으면 전체)를 지수 백오프로 차단"""
+        targets = [request_class] if request_class else list(self.buckets)
+        for name in targets:
+            self._violations[name] += 1
+            backoff = min(self.max_backoff, max(self.base_backoff, self._backoff[name] * 2))
+            self._backoff[name] = backoff
+            self.buckets[name].penalize(backoff)
+            logger.warning(f"IBKR pacing violation ({name}) - {backoff:.0f}s backoff")
+
+    def on_ib_error(self, req_id: int, error_code: int, error_string: str, contract=None):
+        """ib.errorEvent 핸들러"""
+        if error_code in PACING_ERROR_CODES:
+            self.report_pacing_violation(PACING_ERROR_CODES[error_code])
+
+    async def stop(self):
+        for task in self._workers.values():
+            task.cancel()
+        for task in self._workers.values():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._workers.clear()
+        self._queues.clear()
+        self._in_flight.clear()
+
+    # ───── 내부 ─────
+    def _ensure_worker(self, request_class: str):
+        task = self._workers.get(request_class)
+        if task is None or task.done():
+            self._queues.setdefault(request_class, asyncio.PriorityQueue())
+            self._in_flight.setdefault(request_class, asyncio.Semaphore(self.max_in_flight[request_class]))
+            self._workers[request_class] = asyncio.create_task(self._worker(request_class))
+
+    async def _worker(self, request_class: str):
+        queue = self._queues[request_class]
+        bucket = self.buckets[request_class]
+        in_flight = self._in_flight[request_class]
+        while True:
+            item = await queue.get()
+            if item[3].cancelled():
+                continue
+            while (wait := bucket.try_acquire()) > 0:
+                await asyncio.sleep(wait)
+            await in_flight.acquire()
+            task = asyncio.create_task(self._execute(request_class, item, queue, in_flight))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _execute(self, request_class: str, item, queue: asyncio.PriorityQueue,
+                       in_flight: asyncio.Semaphore):
+        priority, seq, factory, future, attempt = item
+        violations = self._violations[request_class]
+        try:
+            result = await factory()
+            if self._violations[request_class] != violations and not result:
+                # 요청 도중 위반이 보고되고 빈 결과 - pacing 으로 거절된 것으로 간주
+                raise PacingViolation(request_class)
+            self._backoff[request_class] = 0.0
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            pacing = isinstance(e, PacingViolation) or "pacing" in str(e).lower()
+            if pacing and attempt < self.max_retries:
+                if not isinstance(e, PacingViolation):
+                    self.report_pacing_violation(request_class)
+                await queue.put((priority, seq, factory, future, attempt + 1))
+            elif not future.done():
+                future.set_exception(e)
+        finally:
+            in_flight.release()
+
+
+async def gather_limited(func: Callable[[Any], Awaitable[Any]], items: Iterable[Any],
+                         limit: int = DEFAULT_JOB_CONCURRENCY) -> List[Any]:
+    """items 각각에 func 를 최대 limit 개씩 동시에 실행하고 결과를 입력 순서대로 반환
+
+    asyncio.gather 와 달리 코루틴을 한꺼번에 만들지 않으므로 항목 수와 무관하게
+    대기 중인 요청/DB 작업이 limit 개로 제한된다. trade_batch 잡처럼 항목마다 IBKRManager 요청을 보내는 경우
+    IBKR pacing 은 IBKRManager.scheduler 가 맡고, 이 함수는 동시에 처리하는 항목 수만 제한한다.
+    """
+    if limit < 1:
+        raise ValueError(f"limit 은 1 이상이어야 합니다: {limit}")
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    pending = iter(range(len(items)))
+
+    async def worker():
+        for index in pending:
+            results[index] = await func(items[index])
+
+    await asyncio.gather(*(worker() for _ in range(min(limit, len(items)))))
+    return results
@@ -0,0 +1,42 @@
+"""전략 매니페스트 - trade_engine 전략 목록/메타데이터를 서비스 간에 공유
+
+trade_engine 이 `python -m utils.strategy_manifest` 로 레지스트리(entry point 포함)에서 생성한 JSON 을
+읽기만 하므로, 대시보드 등은 엔진 코드나 전략 모듈을 import 하지 않고 전략 정보를 조회할 수 있다.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 기본 매니페스트 (패키지에 포함) - STRATEGY_MANIFEST 환경 변수로 다른 파일 지정 가능
+MANIFEST_PATH = Path(__file__).with_name("strategies.json")
+
+
+def manifest_path() -> Path:
+    return Path(os.environ.get("STRATEGY_MANIFEST") or MANIFEST_PATH)
+
+
+def load_strategies(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """매니페스트의 전략 목록 [{"name", "description", "version", "parameters"}] - 파일이 없으면 빈 목록"""
+    path = Path(path) if path is not None else manifest_path()
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("strategies", [])
+
+
+def get_strategy(name: str, path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    for strategy in load_strategies(path):
+        if strategy["name"] == name:
+            return strategy
+    return None
+
+
+def write_strategies(strategies: List[Dict[str, Any]], path: Optional[Path] = None) -> Path:
+    """전략 목록을 매니페스트로 저장 (trade_engine 에서 호출)"""
+    path = Path(path) if path is not None else manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"strategies": strategies}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return path
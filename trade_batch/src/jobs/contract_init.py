@@ -1,7 +1,7 @@
 import logging
 from typing import Dict, List, Any, Optional
-import asyncio
 from datetime import datetime
+from tradelib.ibkr import gather_limited
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ async def init_contract_data(db_manager, ibkr_manager, redis_manager):
         logger.info(f"Loaded {len(symbols)} symbols from CSV")
         
         # 2. 각 심볼에 대해 계약 상세 정보 수집
-        for symbol in symbols:
+        async def process_symbol(symbol):
             try:
                 # IBKR에서 계약 상세 정보 가져오기
                 contract_details = await fetch_contract_details(ibkr_manager, symbol)
@@ -28,15 +28,13 @@ async def init_contract_data(db_manager, ibkr_manager, redis_manager):
                     # DB에 저장
                     await save_contract_details(db_manager, contract_details)
                     logger.info(f"Saved contract details for {symbol['symbol']}")
-                    
-                    # API 제한을 위한 대기
-                    await asyncio.sleep(2)
                 else:
                     logger.warning(f"No contract details found for {symbol['symbol']}")
                     
             except Exception as e:
                 logger.error(f"Error processing symbol {symbol['symbol']}: {e}")
-                continue
+        
+        await gather_limited(process_symbol, symbols)
         
         logger.info("Contract initialization job completed")
         return {"status": "success", "processed": len(symbols)}
@@ -1,7 +1,7 @@
 import logging
 from typing import Dict, List, Any
-import asyncio
 from datetime import datetime, timedelta
+from tradelib.ibkr import gather_limited
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +19,7 @@ async def add_future_months(db_manager, ibkr_manager, redis_manager):
         logger.info(f"Loaded {len(target_contracts)} future contracts")
         
         # 2. 각 계약에 대해 월물 정보 수집
-        processed_count = 0
-        for contract in target_contracts:
+        async def process_contract(contract) -> bool:
             try:
                 # IBKR에서 선물 월물 정보 수집
                 future_months = await collect_future_months(ibkr_manager, contract)
@@ -29,16 +28,16 @@ async def add_future_months(db_manager, ibkr_manager, redis_manager):
                     # DB에 저장
                     await save_future_months(db_manager, contract, future_months)
                     logger.info(f"Saved {len(future_months)} months for {contract['symbol']}")
-                    processed_count += 1
-                    
-                    # API 제한을 위한 대기
-                    await asyncio.sleep(2)
+                    return True
                 else:
                     logger.warning(f"No future months found for {contract['symbol']}")
                     
             except Exception as e:
                 logger.error(f"Error processing contract {contract['symbol']}: {e}")
-                continue
+            return False
+        
+        results = await gather_limited(process_contract, target_contracts)
+        processed_count = sum(results)
         
         logger.info(f"Add future months job completed. Processed: {processed_count}")
         return {"status": "success", "processed": processed_count}
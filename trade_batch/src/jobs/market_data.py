@@ -1,8 +1,8 @@
 import logging
 from typing import Dict, List, Any
-import asyncio
 from datetime import datetime, timedelta
 import json
+from tradelib.ibkr import gather_limited
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,7 @@ async def collect_time_data(db_manager, ibkr_manager, redis_manager):
         logger.info(f"Loaded {len(contracts)} contracts for time data collection")
         
         # 2. 각 계약에 대해 시계열 데이터 수집
-        processed_count = 0
-        for contract in contracts:
+        async def process_contract(contract) -> bool:
             try:
                 # IBKR에서 과거 데이터 수집
                 time_data = await collect_historical_data(ibkr_manager, contract)
@@ -30,19 +29,19 @@ async def collect_time_data(db_manager, ibkr_manager, redis_manager):
                     # DB에 저장
                     await save_time_data(db_manager, contract, time_data)
                     logger.info(f"Saved {len(time_data)} bars for {contract['symbol']}")
-                    processed_count += 1
                     
                     # Redis에 최신 데이터 캐시
                     await cache_latest_data(redis_manager, contract, time_data)
-                    
-                    # API 제한을 위한 대기
-                    await asyncio.sleep(2)
+                    return True
                 else:
                     logger.warning(f"No time data found for {contract['symbol']}")
                     
             except Exception as e:
                 logger.error(f"Error processing contract {contract['symbol']}: {e}")
-                continue
+            return False
+        
+        results = await gather_limited(process_contract, contracts)
+        processed_count = sum(results)
         
         logger.info(f"Collect time data job completed. Processed: {processed_count}")
         return {"status": "success", "processed": processed_count}
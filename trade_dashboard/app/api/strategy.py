@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
+from tradelib.strategies import get_strategy as find_strategy, load_strategies
 
 router = APIRouter()
 
@@ -14,10 +15,11 @@ class StrategyInfo(BaseModel):
     name: str
     description: str
     version: str
-    is_active: bool
     parameters: Dict[str, Any]
-    created_at: datetime
-    updated_at: datetime
+    # 활성 상태/생성·수정 시각은 저장소가 생기기 전까지 알 수 없음 (None)
+    is_active: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
 class StrategyParameter(BaseModel):
@@ -48,56 +50,17 @@ class StrategyPerformance(BaseModel):
 
 @router.get("/", response_model=List[StrategyInfo])
 async def get_strategies():
-    """사용 가능한 모든 전략 목록 조회"""
-    # TODO: 실제 전략 목록을 trade_engine에서 가져오기
-    strategies = [
-        {
-            "name": "Example1Strategy",
-            "description": "예제 전략 1 - 이동평균 크로스오버",
-            "version": "1.0.0",
-            "is_active": True,
-            "parameters": {
-                "fast_period": 10,
-                "slow_period": 20,
-                "stop_loss": 0.02,
-                "take_profit": 0.05
-            },
-            "created_at": datetime.now(),
-            "updated_at": datetime.now()
-        },
-        {
-            "name": "Example2Strategy", 
-            "description": "예제 전략 2 - RSI 기반 전략",
-            "version": "1.0.0",
-            "is_active": False,
-            "parameters": {
-                "rsi_period": 14,
-                "oversold_threshold": 30,
-                "overbought_threshold": 70
-            },
-            "created_at": datetime.now(),
-            "updated_at": datetime.now()
-        }
-    ]
-    return strategies
+    """사용 가능한 모든 전략 목록 조회 (trade_engine 이 생성한 tradelib 전략 매니페스트)"""
+    return load_strategies()
 
 
 @router.get("/{strategy_name}", response_model=StrategyInfo)
 async def get_strategy(strategy_name: str):
     """특정 전략 상세 정보 조회"""
-    # TODO: 실제 전략 정보 조회
-    if strategy_name not in ["Example1Strategy", "Example2Strategy"]:
+    strategy = find_strategy(strategy_name)
+    if strategy is None:
         raise HTTPException(status_code=404, detail=f"Strategy {strategy_name} not found")
-    
-    return {
-        "name": strategy_name,
-        "description": f"{strategy_name} 설명",
-        "version": "1.0.0",
-        "is_active": True,
-        "parameters": {},
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
-    }
+    return strategy
 
 
 @router.get("/{strategy_name}/performance", response_model=StrategyPerformance)
@@ -33,6 +33,9 @@ class Config:
     LOGS_DIR = STORAGE_DIR / "storage" / "logs"
     REPORTS_DIR = STORAGE_DIR / "trading_records" / "reports"
     SCREENSHOTS_DIR = STORAGE_DIR / "trading_records" / "screenshots"
+    BAR_CACHE_DIR = Path(os.getenv("BAR_CACHE_DIR", STORAGE_DIR / "bar_cache"))  # 과거 봉 Parquet 캐시
+    WALK_FORWARD_CACHE_DIR = STORAGE_DIR / "walk_forward"                        # 워크포워드 구간 결과 캐시
+    BAR_STORE_DIR = Path(os.getenv("BAR_STORE_DIR", STORAGE_DIR / "bar_store"))  # 메모리 맵 컬럼형 봉 저장소
 
 
     #  mode back/live   real paper/live   broker ibkr/binance
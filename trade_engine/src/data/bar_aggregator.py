@@ -0,0 +1,96 @@
+from typing import List, NamedTuple, Optional
+
+import pandas as pd
+
+
+class Bar(NamedTuple):
+    timestamp: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class TimeBarAggregator:
+    """실시간 봉(reqRealTimeBars 5초봉) → timeframe 봉 증분 집계
+
+    resampler.time_bar() 와 같은 OHLCV 규칙(Open 처음, High 최대, Low 최소,
+    Close 마지막, Volume 합)과 같은 봉 라벨(start_day 기준 구간 시작 시각)을 사용한다.
+    update() 1회는 O(1) 이며, 완성된 봉만 반환하므로 전략은 봉이 닫힐 때만 깨어난다.
+
+    봉 종료 조건
+      - 구간의 마지막 소스 봉(끝 시각 >= 구간 끝)이 들어오면 즉시 종료
+      - 다음 구간의 봉이 들어오면 이전 봉 종료 (세션 종료/데이터 공백으로 끝이 비어 있는 경우)
+      - on_time(now) / flush() 로 세션 마감 시 미완성 봉 강제 종료
+    이미 종료한 구간에 늦게 도착한 소스 봉은 같은 시각 봉이 두 번 나가지 않도록 버린다.
+    """
+
+    def __init__(self, timeframe: str = '1min', source_seconds: int = 5):
+        self.step_ns = pd.Timedelta(timeframe).value
+        self.source_ns = pd.Timedelta(seconds=source_seconds).value
+        if self.step_ns < self.source_ns:
+            raise ValueError(f"timeframe({timeframe}) 은 소스 봉({source_seconds}s) 보다 짧을 수 없습니다.")
+        self.origin_ns: Optional[int] = None
+        self.tz = None
+        self._label_ns: Optional[int] = None
+        self._last_label_ns: Optional[int] = None  # 마지막으로 종료한 봉 라벨
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+
+    @property
+    def has_open_bar(self) -> bool:
+        return self._label_ns is not None
+
+    def update(self, timestamp, open_: float, high: float, low: float, close: float,
+               volume: float) -> List[Bar]:
+        """소스 봉 1개 반영 후 완성된 봉 목록 반환 (대부분 0 또는 1개)"""
+        ts = pd.Timestamp(timestamp)
+        ts_ns = ts.value
+        if self.origin_ns is None:
+            # time_bar() 의 resample(origin='start_day') 과 동일한 기준점
+            self.origin_ns = ts.normalize().value
+            self.tz = ts.tz
+        label_ns = ts_ns - (ts_ns - self.origin_ns) % self.step_ns
+        if self._last_label_ns is not None and label_ns <= self._last_label_ns:
+            return []
+
+        completed = []
+        if self._label_ns is not None and label_ns != self._label_ns:
+            completed.append(self._close_bar())
+
+        if self._label_ns is None:
+            self._label_ns = label_ns
+            self._open, self._high, self._low = open_, high, low
+            self._volume = volume
+        else:
+            self._high = max(self._high, high)
+            self._low = min(self._low, low)
+            self._volume += volume
+        self._close = close
+
+        if ts_ns + self.source_ns >= label_ns + self.step_ns:
+            completed.append(self._close_bar())
+        return completed
+
+    def update_bar(self, bar) -> List[Bar]:
+        """ib_insync RealTimeBar(time, open_, high, low, close, volume) 입력"""
+        return self.update(bar.time, bar.open_, bar.high, bar.low, bar.close, bar.volume)
+
+    def on_time(self, now) -> List[Bar]:
+        """현재 시각 기준으로 구간이 끝난 미완성 봉 종료 (세션 마감/수신 공백 대비)"""
+        if self._label_ns is not None and pd.Timestamp(now).value >= self._label_ns + self.step_ns:
+            return [self._close_bar()]
+        return []
+
+    def flush(self) -> List[Bar]:
+        """미완성 봉 강제 종료 (세션 종료 시 호출)"""
+        return [self._close_bar()] if self._label_ns is not None else []
+
+    def _close_bar(self) -> Bar:
+        bar = Bar(pd.Timestamp(self._label_ns, tz="UTC").tz_convert(self.tz) if self.tz is not None
+                  else pd.Timestamp(self._label_ns),
+                  self._open, self._high, self._low, self._close, self._volume)
+        self._last_label_ns = self._label_ns
+        self._label_ns = None
+        return bar
@@ -0,0 +1,118 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+
+from src.config import config
+
+
+Range = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+class BarCache:
+    """과거 봉 로컬 Parquet 캐시 - {root}/{con_id}/{interval}/{YYYY-MM-DD}.parquet
+
+    이미 받아 둔 구간은 _coverage.json 에 병합된 [start, end] 목록으로 기록하고,
+    download() 는 missing_ranges() 로 빠진 구간만 IBKR 에 요청한다.
+    """
+
+    COVERAGE_FILE = "_coverage.json"
+
+    def __init__(self, root: Union[str, Path] = None):
+        self.root = Path(root or config.BAR_CACHE_DIR)
+
+    def _dir(self, key, interval: str) -> Path:
+        return self.root / str(key) / interval
+
+    # ───── 커버리지 ─────
+    def coverage(self, key, interval: str) -> List[Range]:
+        path = self._dir(key, interval) / self.COVERAGE_FILE
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in json.load(f)]
+
+    def _save_coverage(self, key, interval: str, ranges: List[Range]):
+        path = self._dir(key, interval) / self.COVERAGE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([[s.isoformat(), e.isoformat()] for s, e in ranges], f)
+        tmp.replace(path)
+
+    def add_coverage(self, key, interval: str, stt_dt: datetime, end_dt: datetime):
+        ranges = self.coverage(key, interval) + [(pd.Timestamp(stt_dt), pd.Timestamp(end_dt))]
+        self._save_coverage(key, interval, _merge_ranges(ranges))
+
+    def missing_ranges(self, key, interval: str, stt_dt: datetime, end_dt: datetime) -> List[Range]:
+        """[stt_dt, end_dt] 중 캐시에 없는 구간"""
+        start, end = pd.Timestamp(stt_dt), pd.Timestamp(end_dt)
+        gaps, cursor = [], start
+        for s, e in self.coverage(key, interval):
+            if e < cursor or s > end:
+                continue
+            if s > cursor:
+                gaps.append((cursor, min(s, end)))
+            cursor = max(cursor, e)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    # ───── 데이터 ─────
+    def store(self, key, interval: str, df: pd.DataFrame,
+              stt_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None):
+        """일자 파티션별로 병합 저장 후 [stt_dt, end_dt] 를 커버리지에 추가 (구간 생략 시 데이터만 저장)"""
+        directory = self._dir(key, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        if len(df):
+            for day, part in df.groupby(df["timestamp"].dt.date):
+                path = directory / f"{day.isoformat()}.parquet"
+                if path.exists():
+                    part = pd.concat([pd.read_parquet(path), part])
+                part = part.drop_duplicates("timestamp", keep="last").sort_values("timestamp")
+                part.to_parquet(path, index=False)
+        if stt_dt is not None and end_dt is not None:
+            self.add_coverage(key, interval, stt_dt, end_dt)
+
+    def load(self, key, interval: str, stt_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+        """[stt_dt, end_dt] 봉 - naive 경계는 저장된 봉의 tz 시각으로, tz 가 있는 경계는 그 tz 로 변환해 비교"""
+        directory = self._dir(key, interval)
+        start, end = pd.Timestamp(stt_dt), pd.Timestamp(end_dt)
+        # 파티션은 봉의 현지 날짜 기준 - 경계의 tz 와 다를 수 있으므로 앞뒤 하루씩 여유를 두고 읽는다
+        days = pd.date_range(_naive(start).normalize() - pd.Timedelta(days=1),
+                             _naive(end).normalize() + pd.Timedelta(days=1), freq="D")
+        paths = [directory / f"{day.date().isoformat()}.parquet" for day in days]
+        frames = [pd.read_parquet(path) for path in paths if path.exists()]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        tz = df["timestamp"].dt.tz
+        start, end = _localize(start, tz), _localize(end, tz)
+        return df[(df["timestamp"] >= start) & (df["timestamp"] <= end)].reset_index(drop=True)
+
+
+def _naive(ts: pd.Timestamp) -> pd.Timestamp:
+    return ts.tz_localize(None) if ts.tz is not None else ts
+
+
+def _localize(ts: pd.Timestamp, tz) -> pd.Timestamp:
+    """경계를 저장된 봉과 비교 가능한 시각으로 - bar_columns._bound 와 같은 규칙"""
+    if tz is not None and ts.tz is None:
+        return ts.tz_localize(tz)
+    if tz is None and ts.tz is not None:
+        return ts.tz_localize(None)
+    return ts
+
+
+def _merge_ranges(ranges: List[Range]) -> List[Range]:
+    merged: List[Range] = []
+    for s, e in sorted(ranges):
+        if merged and s <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+        else:
+            merged.append((s, e))
+    return merged
@@ -0,0 +1,130 @@
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# ib_insync BarData / RealTimeBar 숫자 필드
+BAR_FIELDS = ("open", "high", "low", "close", "volume", "average", "barCount")
+REALTIME_BAR_FIELDS = ("endTime", "open_", "high", "low", "close", "volume", "wap", "count")
+_INT_FIELDS = ("barCount", "endTime", "count")
+
+Columns = Dict[str, np.ndarray]
+
+
+def bars_to_columns(bars: Sequence, time_field: str = "date", fields: Sequence[str] = BAR_FIELDS) \
+        -> Optional[Columns]:
+    """BarDataList → {time_field: DatetimeIndex, 필드: ndarray}
+
+    util.df() 처럼 행 튜플/DataFrame 을 만들지 않고, 필드마다 길이를 미리 정한 배열에 바로 채운다.
+    """
+    n = len(bars)
+    if n == 0:
+        return None
+    index = pd.DatetimeIndex(list(map(attrgetter(time_field), bars)))
+    if getattr(index, "unit", "ns") != "ns":
+        # pandas 2 는 datetime 목록을 us 단위로 만들 수 있음 - 병합 시 asi8 를 ns 로 비교
+        index = index.as_unit("ns")
+    columns = {time_field: index}
+    for field in fields:
+        dtype = np.int64 if field in _INT_FIELDS else np.float64
+        columns[field] = np.fromiter(map(attrgetter(field), bars), dtype, n)
+    return columns
+
+
+def columns_to_frame(columns: Optional[Columns]) -> Optional[pd.DataFrame]:
+    if columns is None:
+        return None
+    return pd.DataFrame(columns)
+
+
+def _bound(dt: datetime, tz) -> int:
+    """구간 경계 → 봉 시각과 같은 기준의 int64 ns"""
+    ts = pd.Timestamp(dt)
+    if tz is not None and ts.tz is None:
+        ts = ts.tz_localize(tz)
+    elif tz is None and ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.value
+
+
+def _overlapping(prepared) -> bool:
+    """첫 시각 순으로 정렬된 청크 중 앞 청크들의 마지막 시각보다 먼저 시작하는 청크가 있는지"""
+    last = prepared[0][0][-1]
+    for ts, _ in prepared[1:]:
+        if ts[0] < last:
+            return True
+        last = max(last, ts[-1])
+    return False
+
+
+def _concat_sorted(prepared, time_field: str):
+    """청크를 이어 붙여 시각 기준 stable 정렬 - 같은 시각은 앞 청크의 봉이 먼저"""
+    ts = np.concatenate([item[0] for item in prepared])
+    order = np.argsort(ts, kind="stable")
+    fields = [key for key in prepared[0][1] if key != time_field]
+    chunk = {field: np.concatenate([item[1][field] for item in prepared])[order] for field in fields}
+    return ts[order], chunk
+
+
+def merge_chunks(chunks: List[Optional[Columns]], stt_dt: datetime, end_dt: datetime,
+                 time_field: str = "date") -> Optional[Columns]:
+    """청크 컬럼 병합 - [stt_dt, end_dt] 밖과 청크 간 겹치는 봉 제거, 결과는 시간순
+
+    IBKR 청크는 내부적으로 시간순이므로 전체 정렬 대신 청크를 첫 시각 기준으로만 정렬하고,
+    각 청크에서 직전까지 채택한 마지막 시각 이후 구간만 searchsorted 로 잘라 이어 붙인다.
+    이 방식은 청크 구간이 경계에서만 맞닿는다는 가정에 기대므로, 한 청크가 앞 청크 구간 안에서
+    시작하면(앞 청크에 없는 봉이 잘려 나갈 수 있음) 전체를 이어 붙여 stable 정렬 후
+    시각별 첫 봉(첫 시각이 이른 청크 우선)만 남기는 전체 병합으로 처리한다.
+    """
+    chunks = [chunk for chunk in chunks if chunk is not None and len(chunk[time_field])]
+    if not chunks:
+        return None
+    tz = chunks[0][time_field].tz
+    lo, hi = _bound(stt_dt, tz), _bound(end_dt, tz)
+
+    prepared = []
+    for chunk in chunks:
+        ts = chunk[time_field].asi8
+        if len(ts) > 1 and (np.diff(ts) < 0).any():
+            # 예외적으로 정렬되지 않은 청크만 청크 내부 정렬
+            order = np.argsort(ts, kind="stable")
+            chunk = {key: values[order] for key, values in chunk.items()}
+            ts = chunk[time_field].asi8
+        prepared.append((ts, chunk))
+    prepared.sort(key=lambda item: item[0][0])
+    if _overlapping(prepared):
+        prepared = [_concat_sorted(prepared, time_field)]
+
+    fields = [key for key in prepared[0][1] if key != time_field]
+    times, parts = [], {field: [] for field in fields}
+    last = lo - 1
+    for ts, chunk in prepared:
+        start = np.searchsorted(ts, max(lo, last + 1), side="left")
+        stop = np.searchsorted(ts, hi, side="right")
+        if start >= stop:
+            continue
+        piece = ts[start:stop]
+        keep = slice(start, stop)
+        if len(piece) > 1 and (np.diff(piece) == 0).any():
+            # 청크 내부 중복 시각 - 첫 봉만 유지
+            mask = np.concatenate([[True], np.diff(piece) != 0])
+            keep = np.arange(start, stop)[mask]
+            piece = piece[mask]
+        times.append(piece)
+        for field in fields:
+            parts[field].append(chunk[field][keep])
+        last = piece[-1]
+
+    if not times:
+        return {"timestamp": pd.DatetimeIndex([], tz=tz), **{field: np.empty(0) for field in fields}}
+    stamps = np.concatenate(times) if len(times) > 1 else times[0]
+    index = pd.DatetimeIndex(stamps.view("datetime64[ns]"))
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    merged = {"timestamp": index}
+    for field in fields:
+        merged[field] = np.concatenate(parts[field]) if len(parts[field]) > 1 else parts[field][0]
+    return merged
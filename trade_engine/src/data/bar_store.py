@@ -0,0 +1,352 @@
+import json
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.config import config
+from src.data.bar_cache import Range, _merge_ranges
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 쓰기 잠금 없음
+    fcntl = None
+
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+TIME_COLUMN = "timestamp"
+INDEX_STRIDE = 4096  # 희소 시간 인덱스 간격 (봉 수)
+READ_RETRIES = 3     # 읽는 도중 세대가 바뀌었을 때 현재 세대로 다시 읽는 횟수
+
+Columns = Dict[str, np.ndarray]
+
+
+class BarStoreLocked(Exception):
+    """다른 프로세스가 같은 con_id/interval 에 쓰는 중"""
+
+
+class BarStore:
+    """메모리 맵 컬럼형 봉 저장소 - {root}/{con_id}/{interval}/g{세대}/{column}.bin
+
+    컬럼마다 raw 배열 파일 1개(timestamp: int64 ns - tz-aware 데이터는 UTC, OHLCV: float64)를 두고,
+    INDEX_STRIDE 봉마다 timestamp 를 모은 희소 인덱스(index.bin)로 구간 탐색 범위를 좁힌다.
+    읽기는 np.memmap 뷰를 그대로 돌려주므로(zero-copy) 여러 엔진 프로세스가 같은 파일을
+    OS 페이지 캐시로 공유한다.
+
+    - 마지막 봉 이후 데이터는 현재 세대 파일 끝에 append
+    - 이전 시각 데이터(backfill, 빈 구간 채우기)는 병합한 새 세대를 쓰고 meta.json 교체로 전환
+      (기존 memmap 을 들고 있는 reader 는 이전 세대를 계속 본다)
+    - 받아 둔 구간은 BarCache 와 같은 방식으로 _coverage.json 에 기록
+    - 쓰기는 con_id/interval 별 파일 잠금으로 한 번에 프로세스 1개만 수행
+    """
+
+    META_FILE = "meta.json"
+    COVERAGE_FILE = "_coverage.json"
+    LOCK_FILE = ".lock"
+    INDEX_FILE = "index.bin"
+
+    def __init__(self, root: Union[str, Path] = None):
+        self.root = Path(root or config.BAR_STORE_DIR)
+        self._maps: Dict[Tuple[str, str], Tuple[int, int, Columns, np.ndarray]] = {}
+
+    def _dir(self, key, interval: str) -> Path:
+        return self.root / str(key) / interval
+
+    @staticmethod
+    def _dtype(column: str):
+        return np.int64 if column == TIME_COLUMN else np.float64
+
+    def meta(self, key, interval: str) -> Dict:
+        path = self._dir(key, interval) / self.META_FILE
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _generation_dir(self, key, interval: str, meta: Optional[Dict] = None) -> Optional[Path]:
+        meta = self.meta(key, interval) if meta is None else meta
+        if "generation" not in meta:
+            return None
+        return self._dir(key, interval) / f"g{meta['generation']}"
+
+    # ───── 커버리지 ─────
+    def coverage(self, key, interval: str) -> List[Range]:
+        path = self._dir(key, interval) / self.COVERAGE_FILE
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in json.load(f)]
+
+    def _add_coverage(self, key, interval: str, stt_ns: int, end_ns: int):
+        ranges = self.coverage(key, interval) + [(pd.Timestamp(stt_ns), pd.Timestamp(end_ns))]
+        path = self._dir(key, interval) / self.COVERAGE_FILE
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([[s.isoformat(), e.isoformat()] for s, e in _merge_ranges(ranges)], f)
+        tmp.replace(path)
+
+    def missing_ranges(self, key, interval: str, stt_dt: datetime, end_dt: datetime) -> List[Range]:
+        """[stt_dt, end_dt] 중 저장소에 없는 구간 (UTC 기준 naive Timestamp)"""
+        tz = self.meta(key, interval).get("tz")
+        start, end = pd.Timestamp(_to_ns(stt_dt, tz)), pd.Timestamp(_to_ns(end_dt, tz))
+        gaps, cursor = [], start
+        for s, e in self.coverage(key, interval):
+            if e < cursor or s > end:
+                continue
+            if s > cursor:
+                gaps.append((cursor, min(s, end)))
+            cursor = max(cursor, e)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def covers(self, key, interval: str, stt_dt: datetime, end_dt: datetime) -> bool:
+        return not self.missing_ranges(key, interval, stt_dt, end_dt)
+
+    # ───── 읽기 ─────
+    def count(self, key, interval: str) -> int:
+        """현재 세대의 봉 수 - 컬럼 파일 중 가장 짧은 길이 (쓰기 도중인 꼬리는 제외)"""
+        return _column_count(self._generation_dir(key, interval))
+
+    def _columns(self, key, interval: str) -> Tuple[int, Columns, np.ndarray]:
+        """컬럼 memmap 과 희소 인덱스 - 세대가 바뀌었거나 파일이 늘어났을 때만 다시 맵핑"""
+        for _ in range(READ_RETRIES):
+            meta = self.meta(key, interval)
+            directory = self._generation_dir(key, interval, meta)
+            generation = meta.get("generation", -1)
+            n = _column_count(directory)
+            if not n and meta.get("count"):
+                # meta.json 을 읽은 뒤 다른 프로세스가 새 세대로 전환하고 이 세대를 삭제 - 현재 세대로 다시 시도
+                continue
+            cached = self._maps.get((str(key), interval))
+            if cached is not None and cached[0] == generation and cached[1] == n:
+                return cached[1:]
+            columns: Columns = {}
+            index = np.empty(0, np.int64)
+            try:
+                if n:
+                    for column in (TIME_COLUMN,) + COLUMNS:
+                        columns[column] = np.memmap(directory / f"{column}.bin", dtype=self._dtype(column),
+                                                    mode="r", shape=(n,))
+                    index_path = directory / self.INDEX_FILE
+                    if index_path.exists():
+                        index = np.fromfile(index_path, dtype=np.int64)[:(n + INDEX_STRIDE - 1) // INDEX_STRIDE]
+            except FileNotFoundError:
+                continue
+            self._maps[(str(key), interval)] = (generation, n, columns, index)
+            return n, columns, index
+        raise RuntimeError(f"{key}/{interval} 세대 전환이 반복되어 읽지 못했습니다.")
+
+    def _search(self, times: np.ndarray, index: np.ndarray, value: int, side: str) -> int:
+        """희소 인덱스로 블록을 고른 뒤 해당 블록 안에서만 이진 탐색 - O(log n), 블록 1개 페이지만 접근"""
+        block = max(int(np.searchsorted(index, value, side=side)) - 1, 0)
+        lo = block * INDEX_STRIDE
+        hi = min(lo + INDEX_STRIDE, len(times))  # timestamp 는 순증가 - 결과는 [lo, lo + INDEX_STRIDE]
+        return lo + int(np.searchsorted(times[lo:hi], value, side=side))
+
+    def read(self, key, interval: str, stt_dt: Optional[datetime] = None,
+             end_dt: Optional[datetime] = None) -> Columns:
+        """[stt_dt, end_dt] 구간 컬럼 - 읽기 전용 memmap 슬라이스 (복사 없음), timestamp 는 UTC datetime64[ns]"""
+        n, columns, index = self._columns(key, interval)
+        if not n:
+            return {TIME_COLUMN: np.empty(0, "datetime64[ns]"), **{c: np.empty(0) for c in COLUMNS}}
+        times = columns[TIME_COLUMN]
+        tz = self.meta(key, interval).get("tz")
+        start = 0 if stt_dt is None else self._search(times, index, _to_ns(stt_dt, tz), "left")
+        stop = n if end_dt is None else self._search(times, index, _to_ns(end_dt, tz), "right")
+        stop = max(start, stop)
+        result = {column: values[start:stop] for column, values in columns.items()}
+        result[TIME_COLUMN] = result[TIME_COLUMN].view("datetime64[ns]")
+        return result
+
+    def _index(self, key, interval: str, times: np.ndarray) -> pd.DatetimeIndex:
+        """저장 시 tz 로 되돌린 시각 - download() 결과와 같은 시간 표현"""
+        index = pd.DatetimeIndex(times, name=TIME_COLUMN)
+        tz = self.meta(key, interval).get("tz")
+        return index.tz_localize("UTC").tz_convert(tz) if tz else index
+
+    def series(self, key, interval: str, stt_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None,
+               column: str = "close") -> pd.Series:
+        """전략 입력용 가격 Series - 값은 memmap 을 그대로 참조 (읽기 전용)"""
+        data = self.read(key, interval, stt_dt, end_dt)
+        return pd.Series(data[column], index=self._index(key, interval, data[TIME_COLUMN]), name=column, copy=False)
+
+    def frame(self, key, interval: str, stt_dt: Optional[datetime] = None,
+              end_dt: Optional[datetime] = None) -> pd.DataFrame:
+        """download() 와 같은 모양(timestamp + OHLCV 컬럼)의 DataFrame - OHLCV 는 memmap 참조"""
+        data = self.read(key, interval, stt_dt, end_dt)
+        data[TIME_COLUMN] = self._index(key, interval, data[TIME_COLUMN])
+        return pd.DataFrame(data, copy=False)
+
+    def last_timestamp(self, key, interval: str) -> Optional[pd.Timestamp]:
+        """마지막 봉 시각 (UTC naive)"""
+        n, columns, _ = self._columns(key, interval)
+        return pd.Timestamp(int(columns[TIME_COLUMN][n - 1])) if n else None
+
+    # ───── 쓰기 ─────
+    @contextmanager
+    def _write_lock(self, key, interval: str):
+        """con_id/interval 당 writer 1개 - 다른 프로세스가 쓰는 중이면 BarStoreLocked"""
+        directory = self._dir(key, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / self.LOCK_FILE, "a") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise BarStoreLocked(f"{key}/{interval} 는 다른 프로세스가 쓰는 중") from None
+            try:
+                yield directory
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def append(self, key, interval: str, df: pd.DataFrame,
+               stt_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None) -> int:
+        """봉 저장 후 [stt_dt, end_dt] (생략 시 df 의 처음~마지막 봉) 를 커버리지에 추가
+
+        마지막 저장 시각 이후 봉은 append, 이전 시각이 섞이면 기존 데이터와 병합한 새 세대로 교체한다.
+        같은 시각은 새 값으로 덮어쓴다. 저장(추가/교체)된 봉 수 반환.
+        """
+        if df is None or not len(df):
+            if stt_dt is not None and end_dt is not None:
+                tz = self.meta(key, interval).get("tz")
+                with self._write_lock(key, interval):
+                    self._add_coverage(key, interval, _to_ns(stt_dt, tz), _to_ns(end_dt, tz))
+            return 0
+        times = pd.DatetimeIndex(df[TIME_COLUMN])
+        tz = str(times.tz) if times.tz is not None else None
+        stamps = _utc_ns(times)
+        values = {column: df[column].to_numpy(dtype=np.float64) for column in COLUMNS}
+        stamps, values = _sort_unique(stamps, values)
+
+        with self._write_lock(key, interval) as directory:
+            meta = self.meta(key, interval)
+            if meta.get("tz") is not None and tz is not None:
+                # 시각은 UTC 로 저장하므로 tz 가 달라도 같은 시점 - 저장 tz 로 표현만 맞춤
+                tz = meta["tz"]
+            elif meta.get("tz", tz) != tz:
+                raise ValueError(f"{key}/{interval} 저장 tz({meta.get('tz')}) 와 다른 데이터 tz({tz})")
+            last = self.last_timestamp(key, interval)
+            if last is None or stamps[0] > last.value:
+                self._append_tail(key, interval, meta, stamps, values, tz)
+            else:
+                self._rewrite(key, interval, meta, stamps, values, tz)
+            self._add_coverage(key, interval, _to_ns(stt_dt, tz) if stt_dt is not None else int(stamps[0]),
+                               _to_ns(end_dt, tz) if end_dt is not None else int(stamps[-1]))
+        return len(stamps)
+
+    def _append_tail(self, key, interval: str, meta: Dict, stamps: np.ndarray, values: Columns, tz):
+        generation = meta.get("generation", 0)
+        directory = self._dir(key, interval) / f"g{generation}"
+        directory.mkdir(parents=True, exist_ok=True)
+        n = _column_count(directory)
+        _truncate(directory, n)
+        # 값 컬럼을 먼저 쓰고 timestamp 를 마지막에 써서, 읽는 쪽은 항상 완성된 봉까지만 본다
+        for column in COLUMNS:
+            with open(directory / f"{column}.bin", "ab") as f:
+                f.write(np.ascontiguousarray(values[column]).tobytes())
+        with open(directory / f"{TIME_COLUMN}.bin", "ab") as f:
+            f.write(stamps.tobytes())
+
+        # 새로 생긴 블록의 첫 timestamp 를 희소 인덱스에 추가
+        first_block = (n + INDEX_STRIDE - 1) // INDEX_STRIDE
+        positions = np.arange(first_block * INDEX_STRIDE, n + len(stamps), INDEX_STRIDE)
+        if len(positions):
+            with open(directory / self.INDEX_FILE, "ab") as f:
+                f.write(stamps[positions - n].tobytes())
+        self._write_meta(key, interval, generation, n + len(stamps), tz)
+
+    def _rewrite(self, key, interval: str, meta: Dict, stamps: np.ndarray, values: Columns, tz):
+        """기존 봉 + 새 봉 병합본을 새 세대 디렉터리에 쓰고 meta.json 으로 원자적으로 전환"""
+        old = self.read(key, interval)
+        merged_stamps = np.concatenate([old[TIME_COLUMN].view(np.int64), stamps])
+        merged = {column: np.concatenate([old[column], values[column]]) for column in COLUMNS}
+        merged_stamps, merged = _sort_unique(merged_stamps, merged)  # 같은 시각은 새 값 유지
+
+        generation = meta.get("generation", -1) + 1
+        directory = self._dir(key, interval) / f"g{generation}"
+        if directory.exists():
+            shutil.rmtree(directory)
+        directory.mkdir(parents=True)
+        for column in COLUMNS:
+            merged[column].tofile(directory / f"{column}.bin")
+        merged_stamps.tofile(directory / f"{TIME_COLUMN}.bin")
+        merged_stamps[::INDEX_STRIDE].tofile(directory / self.INDEX_FILE)
+        self._write_meta(key, interval, generation, len(merged_stamps), tz)
+
+        # 이전 세대 삭제 - 이미 memmap 한 reader 는 (POSIX 에서) 열린 파일을 계속 사용
+        previous = self._dir(key, interval) / f"g{generation - 1}"
+        if previous.exists():
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def _write_meta(self, key, interval: str, generation: int, n: int, tz):
+        path = self._dir(key, interval) / self.META_FILE
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"interval": interval, "generation": generation, "count": n, "tz": tz,
+                       "columns": [TIME_COLUMN, *COLUMNS], "index_stride": INDEX_STRIDE,
+                       "updated": datetime.now().isoformat(timespec="seconds")}, f)
+        tmp.replace(path)
+
+
+def _column_count(directory: Optional[Path]) -> int:
+    if directory is None:
+        return 0
+    counts = []
+    for column in (TIME_COLUMN,) + COLUMNS:
+        path = directory / f"{column}.bin"
+        if not path.exists():
+            return 0
+        counts.append(path.stat().st_size // np.dtype(BarStore._dtype(column)).itemsize)
+    return min(counts)
+
+
+def _truncate(directory: Path, n: int):
+    """이전 쓰기가 중간에 끊겨 컬럼 길이가 다르면 완성된 봉 수(n)로 맞춤"""
+    for column in (TIME_COLUMN,) + COLUMNS:
+        path = directory / f"{column}.bin"
+        size = n * np.dtype(BarStore._dtype(column)).itemsize
+        if path.exists() and path.stat().st_size != size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+    index_path = directory / BarStore.INDEX_FILE
+    index_size = (n + INDEX_STRIDE - 1) // INDEX_STRIDE * 8
+    if index_path.exists() and index_path.stat().st_size != index_size:
+        with open(index_path, "r+b") as f:
+            f.truncate(index_size)
+
+
+def _sort_unique(stamps: np.ndarray, values: Columns) -> Tuple[np.ndarray, Columns]:
+    """시간순 정렬 + 같은 시각은 마지막 값 유지"""
+    if len(stamps) > 1 and (np.diff(stamps) <= 0).any():
+        order = np.argsort(stamps, kind="stable")
+        sorted_stamps = stamps[order]
+        keep = np.append(np.diff(sorted_stamps) != 0, True)
+        order = order[keep]
+        return sorted_stamps[keep], {column: array[order] for column, array in values.items()}
+    return stamps, values
+
+
+def _utc_ns(times: pd.DatetimeIndex) -> np.ndarray:
+    if times.tz is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    if hasattr(times, "as_unit"):
+        times = times.as_unit("ns")
+    return np.asarray(times.asi8, dtype=np.int64)
+
+
+def _to_ns(dt, tz: Optional[str] = None) -> int:
+    """구간 경계 → 저장 기준(UTC) int64 ns - tz 가 있는 저장소의 naive 경계는 그 tz 시각으로 해석"""
+    ts = pd.Timestamp(dt)
+    if ts.tz is None and tz:
+        ts = ts.tz_localize(tz)
+    if ts.tz is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.as_unit("ns").value if hasattr(ts, "as_unit") else ts.value
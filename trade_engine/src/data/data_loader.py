@@ -1,9 +1,19 @@
-from typing import List, Dict
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional
 
 
-from ib_insync import IB, util, Contract, Stock, Future
-from src.infra.postgresql.database import get_connection
+from ib_insync import IB, Contract, Stock, Future
+from src.infra.postgresql.database import get_connection, get_pool
+from src.infra.postgresql.price_copy import copy_prices, price_table
+from src.data.bar_cache import BarCache
+from src.data.bar_store import BarStore, BarStoreLocked
+from src.data.bar_columns import REALTIME_BAR_FIELDS, bars_to_columns, columns_to_frame, merge_chunks
+from src.data.pacing import HistoricalPacer
+from src.data.resampler import time_bar
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -35,29 +45,96 @@ def target_symbols(symbols: List[str]) -> List[Contract]:
 
 
 class IBKRData:
-    def __init__(self, ib: IB):
+    def __init__(self, ib: IB, cache: Optional[BarCache] = None, store: Optional[BarStore] = None,
+                 pacer: Optional[HistoricalPacer] = None):
         self.ib = ib
+        self.pacer = pacer or HistoricalPacer()  # 이 연결의 모든 과거 데이터 요청이 공유
         self.conn = None  # DB 연결 비활성화
         self.data = None
+        self.cache = cache  # 설정 시 download() 는 캐시에 없는 구간만 IBKR 에 요청
+        self.store = store  # 설정 시 받은 봉을 메모리 맵 저장소에 이어 붙여 다른 프로세스와 공유
 
-    def database(self, contracts: List[Contract], stt_dt: datetime, end_dt: datetime, interval: str) \
+    def stored(self, contracts: List[Contract], stt_dt: datetime, end_dt: datetime, interval: str) \
             -> Dict[str, pd.DataFrame]:
+        """BarStore 구간 조회 - OHLCV 컬럼은 memmap 을 참조하는 읽기 전용 배열 (IBKR 요청 없음)
 
-        print(f"[WARNING] DB 연결 없이 빈 DataFrame 반환")
+        [stt_dt, end_dt] 전체가 저장소 커버리지에 있는 계약만 반환한다 (일부만 있으면 경고 후 제외).
+        """
         all_data = {}
+        if self.store is None:
+            return all_data
+        end_dt = min(end_dt, _now_like(end_dt))
+        for contract in contracts:
+            key = cache_key(contract)
+            missing = self.store.missing_ranges(key, interval, stt_dt, end_dt)
+            if missing:
+                if len(self.store.coverage(key, interval)):
+                    print(f"[WARNING] BarStore {contract.symbol} {interval}: 빠진 구간 {len(missing)}개 - 저장소 사용 안 함")
+                continue
+            df = self.store.frame(key, interval, stt_dt, end_dt)
+            if len(df):
+                df["con_id"] = contract.conId
+                df["symbol"] = contract.symbol
+                all_data[contract.symbol] = df
+        return all_data
+
+    def _keep(self, contract: Contract, interval: str, df: Optional[pd.DataFrame],
+              stt_dt: datetime, end_dt: datetime, complete: bool):
+        """빠짐없이 받은 구간만 BarStore 에 저장 - 다른 프로세스가 쓰는 중이거나 저장 데이터와 tz 가 맞지 않으면
+        저장만 건너뛰고 다운로드 결과(메모리 DataFrame)는 그대로 사용"""
+        if self.store is None or not complete:
+            return
+        try:
+            self.store.append(cache_key(contract), interval, df, stt_dt, min(end_dt, _now_like(end_dt)))
+        except BarStoreLocked as e:
+            print(f"[BarStore] 저장 건너뜀: {e}")
+        except ValueError as e:
+            # tz 있는/없는 데이터 혼합 - 저장소를 정리하기 전까지 이 계약은 저장하지 않음
+            print(f"[BarStore] 저장 건너뜀 ({contract.symbol}): {e}")
+
+    def database(self, contracts: List[Contract], stt_dt: datetime, end_dt: datetime, interval: str,
+                 max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+        """price_time_{region} 테이블에서 계약별 [stt_dt, end_dt] 봉 로딩 (실시간 warm-up 용)
 
+        계약마다 연결 풀의 연결 1개로 바이너리 COPY 를 실행하고 결과를 바로 NumPy 컬럼으로 디코딩한다.
+        계약들은 스레드 풀에서 동시에 로딩한다 (psycopg2 는 I/O 중 GIL 해제).
+        테이블에는 수집된 봉 크기 그대로 저장되어 있으므로 interval 보다 촘촘하면 interval 로 재집계하고,
+        더 성기면(업샘플 불가) 경고 후 그대로 반환한다. conId 가 없는 계약은 조회하지 않는다.
+        """
+        resolved = [contract for contract in contracts if contract.conId]
         for contract in contracts:
-            # 빈 DataFrame 생성
-            df = pd.DataFrame({
-                'timestamp': pd.date_range(stt_dt, end_dt, freq='1min')[:100],
-                'open': [100.0] * 100,
-                'high': [101.0] * 100,
-                'low': [99.0] * 100,
-                'close': [100.5] * 100,
-                'volume': [10000] * 100
-            })
-            df["con_id"] = contract.conId
-            all_data[contract.symbol] = df
+            if not contract.conId:
+                print(f"[WARNING] {contract.symbol}: conId 가 없어 DB 조회 생략 (qualifyContracts 필요)")
+        contracts = resolved
+        if not contracts:
+            return {}
+        pool = get_pool(max_workers)
+        workers = max(1, min(max_workers, pool.maxconn, len(contracts)))
+
+        def load(contract: Contract):
+            conn = pool.getconn()
+            try:
+                return copy_prices(conn, price_table(contract.exchange), contract.conId, stt_dt, end_dt)
+            finally:
+                pool.putconn(conn)
+
+        all_data = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(load, contract): contract for contract in contracts}
+            for future in as_completed(futures):
+                contract = futures[future]
+                try:
+                    columns = future.result()
+                except Exception as e:
+                    print(f"data_loader.database ({contract.symbol}): {e}")
+                    continue
+                if not len(columns["timestamp"]):
+                    print(f"[WARNING] {contract.symbol}: {price_table(contract.exchange)} 에 데이터 없음")
+                    continue
+                df = _resample_prices(pd.DataFrame(columns, copy=False), interval, contract.symbol)
+                df["con_id"] = contract.conId
+                df["symbol"] = contract.symbol
+                all_data[contract.symbol] = df
 
         return all_data
 
@@ -65,39 +142,144 @@ class IBKRData:
             -> Dict[str, pd.DataFrame]:
 
         all_data = {}
+
+        for contract in contracts:
+            if self.cache is not None:
+                df = self._download_cached(contract, stt_dt, end_dt, interval)
+                complete = not self.cache.missing_ranges(cache_key(contract), interval, stt_dt,
+                                                         min(end_dt, _now_like(end_dt)))
+            else:
+                df, complete = self._fetch_range(contract, stt_dt, end_dt, interval)
+            self._keep(contract, interval, df, stt_dt, end_dt, complete)
+            if df is not None and len(df):
+                all_data[contract.symbol] = df
+
+        return all_data
+
+    def _download_cached(self, contract: Contract, stt_dt: datetime, end_dt: datetime, interval: str) \
+            -> pd.DataFrame:
+        """캐시에 없는 구간(gap)만 IBKR 에서 받아 병합 저장 후 캐시에서 전체 구간 로드"""
+        key = cache_key(contract)
+        # 아직 오지 않은 시간은 커버리지로 기록하지 않음
+        end_dt = min(end_dt, _now_like(end_dt))
+
+        for gap_stt, gap_end in self.cache.missing_ranges(key, interval, stt_dt, end_dt):
+            df, ok = self._fetch_range(contract, gap_stt.to_pydatetime(), gap_end.to_pydatetime(), interval)
+            if ok:
+                self.cache.store(key, interval, df if df is not None else pd.DataFrame(),
+                                 gap_stt, gap_end)
+            elif df is not None:
+                # 요청 일부 실패 - 받은 데이터만 저장하고 구간은 다음 실행에서 재요청
+                self.cache.store(key, interval, df)
+
+        df = self.cache.load(key, interval, stt_dt, end_dt)
+        if len(df):
+            df["symbol"] = contract.symbol
+        return df
+
+    def _fetch_range(self, contract: Contract, stt_dt: datetime, end_dt: datetime, interval: str):
+        """[stt_dt, end_dt] 를 MAX_DURATION_BY_BAR_SIZE 단위로 요청 → (DataFrame | None, 성공 여부)"""
+        chunks = []
+        ok = True
+
+        for chunk_end in _chunk_ends(stt_dt, end_dt, parse_duration_str(MAX_DURATION_BY_BAR_SIZE[interval][1])):
+            bars = []
+            try:
+                bars = self.ib.reqHistoricalData(contract, **_history_request(chunk_end, interval))
+            except Exception as e:
+                print(f"data_loader.download.reqHistoricalData : {e}")
+                ok = False
+            # 빈 청크(주말/휴장)에서 멈추면 더 이전 청크가 요청되지 않은 채 커버리지로 기록되므로 계속 진행
+            if bars:
+                chunks.append(bars_to_columns(bars))
+
+        df = _assemble_chunks(chunks, stt_dt, end_dt)
+        if df is not None:
+            df["symbol"] = contract.symbol
+        return df, ok
+
+    async def download_async(self, contracts: List[Contract], stt_dt: datetime, end_dt: datetime,
+                             interval: str, max_concurrency: int = 8, scheduler=None) -> Dict[str, pd.DataFrame]:
+        """reqHistoricalDataAsync 기반 동시 다운로드 - download() 와 같은 Dict[symbol, DataFrame] 반환
+
+        계약 x 청크 요청을 max_concurrency 까지 동시에 보내고, self.pacer 로 IBKR pacing 규칙을 지킨다.
+        scheduler(tradelib.ibkr.scheduler.IBKRRequestScheduler) 를 주면 pacing 은 그 스케줄러에 맡겨
+        같은 연결의 다른 요청(trade_batch 잡 등)과 하나의 한도를 공유한다.
+        캐시가 설정되어 있으면 빠진 구간만 요청한다.
+        """
         interval_str, max_duration = MAX_DURATION_BY_BAR_SIZE[interval]
         delta = parse_duration_str(max_duration)
+        pacer = self.pacer
+        limit = asyncio.Semaphore(max_concurrency)
+        if self.cache is not None:
+            end_dt = min(end_dt, _now_like(end_dt))
+
+        async def request(contract: Contract, chunk_end: datetime):
+            if scheduler is not None:
+                return await scheduler.submit("historical", lambda: self.ib.reqHistoricalDataAsync(
+                    contract, **_history_request(chunk_end, interval)))
+            # pacing 토큰을 먼저 받고 슬롯을 잡는다 - pacing 대기 중인 요청이 슬롯을 점유하지 않도록
+            await pacer.acquire(cache_key(contract), (cache_key(contract), interval_str, chunk_end))
+            try:
+                async with limit:
+                    return await self.ib.reqHistoricalDataAsync(contract, **_history_request(chunk_end, interval))
+            finally:
+                pacer.release()
+
+        async def fetch_chunk(job_id: int, contract: Contract, chunk_end: datetime):
+            try:
+                bars = await request(contract, chunk_end)
+                return job_id, bars_to_columns(bars) if bars else None, True
+            except Exception as e:
+                print(f"data_loader.download_async.reqHistoricalDataAsync ({contract.symbol}): {e}")
+                return job_id, None, False
 
+        # (계약, 구간) 별 청크 요청 생성
+        jobs, coros = [], []
         for contract in contracts:
-            current_end = end_dt
-            dfs = []
+            if self.cache is not None:
+                ranges = self.cache.missing_ranges(cache_key(contract), interval, stt_dt, end_dt)
+                ranges = [(s.to_pydatetime(), e.to_pydatetime()) for s, e in ranges]
+            else:
+                ranges = [(stt_dt, end_dt)]
+            for rng in ranges:
+                coros += [fetch_chunk(len(jobs), contract, chunk_end)
+                          for chunk_end in _chunk_ends(rng[0], rng[1], delta)]
+                jobs.append((contract, rng))
 
-            while current_end > stt_dt:
-                current_start = max(stt_dt, current_end - delta)
-                bars = []
-                try:
-                    bars = self.ib.reqHistoricalData(
-                        contract,
-                        endDateTime=current_end.strftime("%Y%m%d %H:%M:%S"),
-                        durationStr=max_duration,
-                        barSizeSetting=interval_str,
-                        whatToShow='TRADES',
-                        useRTH=False,
-                        formatDate=1
-                    )
-                except Exception as e:
-                    print(f"data_loader.download.reqHistoricalData : {e}")
-                if bars is None or len(bars) == 0:
-                    break
+        # 모든 청크를 동시에 실행하고 완료 순서대로 수집
+        frames = [[] for _ in jobs]
+        oks = [True] * len(jobs)
+        for future in asyncio.as_completed(coros):
+            job_id, columns, ok = await future
+            if columns is not None:
+                frames[job_id].append(columns)
+            oks[job_id] = oks[job_id] and ok
 
-                df = util.df(bars)
+        all_data = {}
+        for job_id, (contract, (rng_stt, rng_end)) in enumerate(jobs):
+            df = _assemble_chunks(frames[job_id], rng_stt, rng_end)
+            if self.cache is not None:
+                # 일부 청크가 실패한 구간은 커버리지로 기록하지 않음 (다음 실행에서 재요청)
+                covered = (rng_stt, rng_end) if oks[job_id] else (None, None)
+                self.cache.store(cache_key(contract), interval, df if df is not None else pd.DataFrame(), *covered)
+            elif df is not None:
                 df["symbol"] = contract.symbol
-                dfs.append(df)
-                current_end = current_start
-
-            if dfs:
-                all_data[contract.symbol] = pd.concat(dfs).sort_values("timestamp")
+                all_data[contract.symbol] = df
 
+        if self.cache is not None:
+            for contract in contracts:
+                df = self.cache.load(cache_key(contract), interval, stt_dt, end_dt)
+                if len(df):
+                    df["symbol"] = contract.symbol
+                    all_data[contract.symbol] = df
+        for contract in contracts:
+            if self.cache is not None:
+                complete = not self.cache.missing_ranges(cache_key(contract), interval, stt_dt, end_dt)
+            else:
+                complete = all(oks[job_id] for job_id, (job_contract, _) in enumerate(jobs)
+                               if job_contract is contract)
+            self._keep(contract, interval, all_data.get(contract.symbol), stt_dt, end_dt, complete)
         return all_data
 
     def stream(self, contracts: List[Contract], callback):
@@ -105,11 +287,90 @@ class IBKRData:
             try:
                 self.ib.qualifyContracts(contract)
                 bars = self.ib.reqRealTimeBars(contract, 5, 'TRADES', False)
-                df = util.df(bars)
+                df = columns_to_frame(bars_to_columns(bars, "time", REALTIME_BAR_FIELDS))
                 callback(contract.symbol, contract, df)
             except Exception as e:
                 print(f"오류 발생 ({contract.symbol}): {e}")
 
+    async def stream_live(self, contracts: List[Contract], handler: Callable, queue_size: int = 1000,
+                          keep_bars: int = 100, stop_event: Optional[asyncio.Event] = None,
+                          on_timer: Optional[Callable] = None, timer_seconds: float = 1.0) -> Dict[str, int]:
+        """reqRealTimeBars 업데이트 이벤트 기반 실시간 스트림
+
+        모든 심볼을 하나의 asyncio 루프에서 구독하고, 새 5초봉이 들어올 때마다 해당 봉 1개만
+        handler(symbol, contract, bar) 로 넘긴다 (bar 는 ib_insync RealTimeBar, DataFrame 재구성 없음).
+        심볼별 큐/소비 태스크를 두어 느린 전략이 다른 심볼을 막지 않으며, 큐가 가득 차면
+        가장 오래된 봉을 버린다. handler 는 일반 함수 또는 코루틴 함수 모두 가능하다.
+
+        on_timer 를 주면 같은 루프에서 timer_seconds 마다 on_timer() 를 호출한다
+        (예: LivePipeline.on_time - 수신 공백/세션 마감으로 닫히지 않은 봉 종료).
+        stop_event 가 set 되거나 태스크가 취소될 때까지 실행되고, 종료 시 구독을 해제한다.
+
+        :return: 심볼별 버린 봉 수
+        """
+        stop_event = stop_event or asyncio.Event()
+        subscriptions, consumers = [], []
+        dropped: Dict[str, int] = {}
+
+        def subscribe(contract: Contract, queue: asyncio.Queue):
+            def on_update(bars, has_new_bar: bool):
+                if not has_new_bar:
+                    return
+                if queue.full():
+                    queue.get_nowait()
+                    dropped[contract.symbol] += 1
+                queue.put_nowait(bars[-1])
+                # 봉 목록은 계속 쌓이므로 최근 keep_bars 개만 유지
+                if len(bars) > keep_bars:
+                    del bars[:-keep_bars]
+
+            bars = self.ib.reqRealTimeBars(contract, 5, 'TRADES', False)
+            bars.updateEvent += on_update
+            subscriptions.append((bars, on_update))
+
+        async def consume(contract: Contract, queue: asyncio.Queue):
+            while True:
+                bar = await queue.get()
+                try:
+                    result = handler(contract.symbol, contract, bar)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    print(f"오류 발생 ({contract.symbol}): {e}")
+                # 동기 handler 사이에 다른 심볼 소비 태스크에 차례를 넘김
+                await asyncio.sleep(0)
+
+        async def tick():
+            while True:
+                await asyncio.sleep(timer_seconds)
+                try:
+                    on_timer()
+                except Exception as e:
+                    print(f"타이머 오류: {e}")
+
+        try:
+            if on_timer is not None:
+                consumers.append(asyncio.create_task(tick()))
+            for contract in contracts:
+                try:
+                    await self.ib.qualifyContractsAsync(contract)
+                    queue = asyncio.Queue(maxsize=queue_size)
+                    dropped[contract.symbol] = 0
+                    subscribe(contract, queue)
+                    consumers.append(asyncio.create_task(consume(contract, queue)))
+                except Exception as e:
+                    print(f"오류 발생 ({contract.symbol}): {e}")
+            await stop_event.wait()
+        finally:
+            for task in consumers:
+                task.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+            for bars, on_update in subscriptions:
+                bars.updateEvent -= on_update
+                self.ib.cancelRealTimeBars(bars)
+
+        return dropped
+
     def check_market_data_status(self, contracts: List[Contract]):
         error_contracts = []
 
@@ -129,6 +390,66 @@ class IBKRData:
             print("✅ All market data requests succeeded.")
 
 
+def _resample_prices(df: pd.DataFrame, interval: str, symbol: str = "") -> pd.DataFrame:
+    """DB 봉(timestamp, OHLCV, count, vwap)을 interval 봉으로 재집계 - 이미 같거나 더 큰 봉이면 그대로"""
+    if len(df) < 2:
+        return df
+    target = pd.Timedelta(interval)
+    times = df["timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    source = pd.Timedelta(int(np.median(np.diff(times))))
+    if source >= target:
+        if source > target:
+            print(f"[WARNING] {symbol}: DB 봉({source}) 이 요청 interval({interval}) 보다 커서 재집계 불가")
+        return df
+
+    frame = df.set_index("timestamp")
+    ohlcv = frame.rename(columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"})
+    bars = time_bar(ohlcv[["Open", "High", "Low", "Close", "Volume"]], timeframe=target)
+    resampled = frame[["count"]].assign(notional=frame["vwap"] * frame["volume"]).resample(target).sum()
+    resampled = resampled.reindex(bars.index)
+    volume = bars["Volume"].to_numpy()
+    return pd.DataFrame({
+        "timestamp": bars.index,
+        "open": bars["Open"].to_numpy(), "high": bars["High"].to_numpy(), "low": bars["Low"].to_numpy(),
+        "close": bars["Close"].to_numpy(), "volume": volume,
+        "count": resampled["count"].to_numpy(dtype=np.int64),
+        "vwap": np.divide(resampled["notional"].to_numpy(), volume, out=np.full(len(volume), np.nan),
+                          where=volume > 0),
+    })
+
+
+def _now_like(dt: datetime) -> datetime:
+    """dt 와 비교 가능한 현재 시각 (tz-aware 면 같은 tz)"""
+    return datetime.now(dt.tzinfo) if dt.tzinfo is not None else datetime.now()
+
+
+def _history_request(chunk_end: datetime, interval: str) -> Dict:
+    """청크 1개의 reqHistoricalData(Async) 인자 - 동기/비동기 다운로드 공용"""
+    interval_str, max_duration = MAX_DURATION_BY_BAR_SIZE[interval]
+    return {"endDateTime": chunk_end.strftime("%Y%m%d %H:%M:%S"), "durationStr": max_duration,
+            "barSizeSetting": interval_str, "whatToShow": "TRADES", "useRTH": False, "formatDate": 1}
+
+
+def _chunk_ends(stt_dt: datetime, end_dt: datetime, delta) -> List[datetime]:
+    """end_dt 부터 delta 간격으로 거슬러 올라가는 청크 종료 시각 목록"""
+    ends = []
+    current_end = end_dt
+    while current_end > stt_dt:
+        ends.append(current_end)
+        current_end = max(stt_dt, current_end - delta)
+    return ends
+
+
+def _assemble_chunks(chunks: List[Dict], stt_dt: datetime, end_dt: datetime) -> Optional[pd.DataFrame]:
+    """bars_to_columns() 청크 병합 - 'date' → 'timestamp', 구간 밖/겹치는 봉 제거, 시간순 (전체 정렬 없음)"""
+    return columns_to_frame(merge_chunks(chunks, stt_dt, end_dt))
+
+
+def cache_key(contract: Contract):
+    """캐시 파티션 키 - conId 가 없는(미검증) 계약은 심볼 사용"""
+    return contract.conId or contract.symbol
+
+
 MAX_DURATION_BY_BAR_SIZE = {
         "1s": ("1 sec", "1 D"), "5s": ("5 secs", "1 D"), "1m": ("1 min",  "1 W"), "3m": ("3 mins", "1 W"),
         "5m": ("5 mins", "1 M"), "20m": ("20 mins","1 M"), "1h": ("1 hour", "1 M"), "1d": ("1 day",  "1 Y")}
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Hashable
+
+
+class HistoricalPacer:
+    """IBKR 과거 데이터 pacing 규칙을 지키는 비동기 요청 제한기
+
+    - 10분(600초) 동안 최대 60건
+    - 같은 계약에 대해 2초 동안 최대 6건 (여유를 두어 5건)
+    - 동일 요청은 15초 이내 재요청 금지
+    - 동시 진행 요청 최대 50건
+
+    acquire() 는 규칙을 어기지 않는 가장 이른 시점까지 대기해 요청 시각을 기록한 뒤 동시 진행 슬롯을 잡는다.
+    pacing 대기 중에는 슬롯을 잡고 있지 않으므로, 대기 중인 요청이 다른 요청의 진행을 막지 않는다.
+    IBKR 연결 1개당 하나의 pacer 를 공유해야 규칙이 지켜진다 (IBKRData.pacer).
+    """
+
+    def __init__(self, max_requests: int = 60, window: float = 600.0,
+                 per_contract: int = 5, contract_window: float = 2.0,
+                 identical_window: float = 15.0, max_concurrent: int = 50):
+        self.max_requests = max_requests
+        self.window = window
+        self.per_contract = per_contract
+        self.contract_window = contract_window
+        self.identical_window = identical_window
+        self._sent: Deque[float] = deque()
+        self._by_contract: Dict[Hashable, Deque[float]] = {}
+        self._identical: Dict[Hashable, float] = {}
+        self._lock = asyncio.Lock()
+        self._concurrent = asyncio.Semaphore(max_concurrent)
+
+    def _wait_time(self, now: float, contract_key: Hashable, request_key: Hashable) -> float:
+        wait = 0.0
+        while self._sent and self._sent[0] <= now - self.window:
+            self._sent.popleft()
+        if len(self._sent) >= self.max_requests:
+            wait = max(wait, self._sent[0] + self.window - now)
+
+        recent = self._by_contract.setdefault(contract_key, deque())
+        while recent and recent[0] <= now - self.contract_window:
+            recent.popleft()
+        if len(recent) >= self.per_contract:
+            wait = max(wait, recent[0] + self.contract_window - now)
+
+        last = self._identical.get(request_key)
+        if last is not None and now - last < self.identical_window:
+            wait = max(wait, last + self.identical_window - now)
+        return wait
+
+    async def pace(self, contract_key: Hashable, request_key: Hashable):
+        """pacing 규칙상 보낼 수 있을 때까지 대기 후 요청 시각 기록 (동시 진행 슬롯은 잡지 않음)"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(now, contract_key, request_key)
+                if wait <= 0:
+                    self._sent.append(now)
+                    self._by_contract[contract_key].append(now)
+                    self._identical[request_key] = now
+                    return
+            # 잠금 밖에서 대기 - 다른 계약 요청은 계속 진행
+            await asyncio.sleep(wait)
+
+    async def acquire(self, contract_key: Hashable, request_key: Hashable):
+        """pace() 후 동시 진행 슬롯 확보 - 완료 시 release() 호출"""
+        await self.pace(contract_key, request_key)
+        await self._concurrent.acquire()
+
+    def release(self):
+        """요청 완료 - 동시 진행 슬롯 반환"""
+        self._concurrent.release()
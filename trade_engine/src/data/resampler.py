@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 
 
+# tick/volume/dollar/range 바 공통 규칙: 마지막 미완성 봉(틱 수/누적량/가격 범위를 아직 채우지 못한 봉)은
+# 기본적으로 버리고 include_partial=True 일 때만 포함한다. 완성된 봉만 돌려주므로 데이터가 이어져도
+# 이미 받은 봉이 바뀌지 않는다. time_bar 는 시각으로 닫히므로 해당 없음.
 def apply_resampler(df, mode="time", **kwargs):
     if mode == "time":
         return time_bar(df, **kwargs)
@@ -8,63 +12,237 @@ def apply_resampler(df, mode="time", **kwargs):
         return range_bar(df, **kwargs)
     elif mode == "tick":
         return tick_bar(df, **kwargs)
+    elif mode == "volume":
+        return volume_bar(df, **kwargs)
+    elif mode == "dollar":
+        return dollar_bar(df, **kwargs)
     else:
         raise ValueError(f"Unsupported resample mode: {mode}")
 
 def time_bar(df: pd.DataFrame, timeframe: str = '5min') -> pd.DataFrame:
     if not {'Open', 'High', 'Low', 'Close', 'Volume'}.issubset(df.columns):
         raise ValueError("OHLCV 데이터가 누락되었습니다.")
+    if len(df) == 0:
+        return _empty_bars()
 
-    ohlcv = pd.DataFrame()
-    ohlcv['Open'] = df['Open'].resample(timeframe).first()
-    ohlcv['High'] = df['High'].resample(timeframe).max()
-    ohlcv['Low'] = df['Low'].resample(timeframe).min()
-    ohlcv['Close'] = df['Close'].resample(timeframe).last()
-    ohlcv['Volume'] = df['Volume'].resample(timeframe).sum()
-
-    return ohlcv.dropna()
-
-def range_bar(df: pd.DataFrame, price_column: str = 'Close', range_size: float = 1.0) -> pd.DataFrame:
-    bars = []
-    last_price = None
-    bar = {}
-
-    for i, (ts, row) in enumerate(df.iterrows()):
-        price = row[price_column]
-
-        if last_price is None:
-            last_price = price
-            bar = {
-                'timestamp': ts,
-                'Open': price,
-                'High': price,
-                'Low': price,
-                'Close': price,
-                'Volume': row['Volume']
-            }
-            continue
-
-        bar['High'] = max(bar['High'], price)
-        bar['Low'] = min(bar['Low'], price)
-        bar['Close'] = price
-        bar['Volume'] += row['Volume']
-
-        if abs(price - bar['Open']) >= range_size:
-            bars.append(bar)
-            last_price = price
-            bar = {
-                'timestamp': ts,
-                'Open': price,
-                'High': price,
-                'Low': price,
-                'Close': price,
-                'Volume': 0.0
-            }
-
-    bars_df = pd.DataFrame(bars)
-    bars_df.set_index('timestamp', inplace=True)
-    return bars_df
-
-
-def tick_bar(df: pd.DataFrame, price_column: str = 'Close', range_size: float = 1.0) -> pd.DataFrame:
-    pass
\ No newline at end of file
+    # resample 은 봉 경계(라벨)만 구하고 집계는 공통 코어에서 수행
+    positions = pd.Series(np.arange(len(df)), index=df.index).resample(timeframe)
+    first, last = positions.min().dropna(), positions.max().dropna()
+    starts = first.to_numpy(dtype=np.int64)
+    ends = last.to_numpy(dtype=np.int64) + 1
+
+    return _build_bars(df, starts, ends, labels=first.index).dropna()
+
+def range_bar(df: pd.DataFrame, price_column: str = 'Close', range_size: float = 1.0,
+              include_partial: bool = False) -> pd.DataFrame:
+    """레인지 바 - 시가 대비 range_size 이상 움직인 행에서 봉을 닫고 그 가격으로 새 봉 시작
+
+    봉 경계 탐색은 행 단위 순차 루프(_range_breaks)이고 봉 집계는 벡터화되어 있다.
+    결과는 기존 iterrows 구현과 값까지 같다. 이어지는 데이터를 청크 단위로 처리할 때는
+    RangeBarBuilder 를 사용한다.
+    """
+    bars, carry = _range_bars(df, price_column, range_size, carry=None)
+    if include_partial and carry is not None:
+        return pd.concat([bars, _carry_frame(carry)]) if len(bars) else _carry_frame(carry)
+    return bars
+
+
+class RangeBarBuilder:
+    """청크 단위 레인지 바 생성기 - 미완성 봉을 다음 update() 로 이월
+
+    update() 결과를 이어 붙이면 전체 데이터에 range_bar() 를 적용한 것과 같다.
+    """
+
+    def __init__(self, price_column: str = 'Close', range_size: float = 1.0):
+        self.price_column = price_column
+        self.range_size = range_size
+        self.carry = None  # 미완성 봉 (timestamp, Open, High, Low, Close, Volume)
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """새 청크를 처리하고 완성된 봉만 반환"""
+        bars, self.carry = _range_bars(df, self.price_column, self.range_size, self.carry)
+        return bars
+
+    def flush(self) -> pd.DataFrame:
+        """미완성 봉을 반환하고 상태 초기화"""
+        carry, self.carry = self.carry, None
+        if carry is None:
+            return _empty_bars()
+        return _carry_frame(carry)
+
+
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def _carry_frame(carry) -> pd.DataFrame:
+    ts, *ohlcv = carry
+    return pd.DataFrame([ohlcv], columns=BAR_COLUMNS, index=pd.Index([ts], name='timestamp'))
+
+
+def _empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(columns=BAR_COLUMNS, dtype=float, index=pd.Index([], name='timestamp'))
+
+
+def _range_breaks(prices: list, open_price: float, range_size: float) -> list:
+    """봉을 닫는 행 위치 탐색 - 직전 봉의 종가가 다음 봉의 시가가 되므로 벡터화할 수 없어
+    행마다 Python 비교 1회를 하는 순차 루프로 남긴다 (O(n)). 봉 집계(High/Low/Volume)만 벡터화한다.
+    구간 단위 NumPy 탐색도 시도했지만 봉이 짧으면(수십 행) 호출 오버헤드로 이 루프보다 느렸다."""
+    breaks = []
+    for i, price in enumerate(prices):
+        if abs(price - open_price) >= range_size:
+            breaks.append(i)
+            open_price = price
+    return breaks
+
+
+def _range_bars(df: pd.DataFrame, price_column: str, range_size: float, carry):
+    """(완성된 봉 DataFrame, 이월할 미완성 봉) 반환
+
+    가상 행 0 에 현재 열린 봉의 상태(carry 또는 첫 행)를 두고 이후 행을 스캔한다.
+    봉 k 는 행 (b[k-1], b[k]] 로 구성되고, 시가/시각은 b[k-1] 행의 값을 사용한다.
+    """
+    if len(df) == 0:
+        return _empty_bars(), carry
+
+    ts = df.index.to_numpy()
+    price = df[price_column].to_numpy(dtype=float)
+    volume = df['Volume'].to_numpy(dtype=float)
+
+    if carry is None:
+        carry = (ts[0], price[0], price[0], price[0], price[0], volume[0])
+        ts, price, volume = ts[1:], price[1:], volume[1:]
+    c_ts, c_open, c_high, c_low, c_close, c_volume = carry
+
+    # 가상 행 0 = 열린 봉, 행 1.. = 스캔 대상
+    ts = np.concatenate([[c_ts], ts])
+    close = np.concatenate([[c_close], price])
+    high = np.concatenate([[c_high], price])
+    low = np.concatenate([[c_low], price])
+    volume = np.concatenate([[c_volume], volume])
+
+    breaks = np.asarray(_range_breaks(price.tolist(), c_open, range_size), dtype=np.int64) + 1
+    if len(breaks) == 0:
+        carry = (c_ts, c_open, high.max(), low.min(), close[-1], _seq_sum(volume))
+        return _empty_bars(), carry
+
+    last = breaks[-1]
+    opens_at = np.concatenate([[0], breaks[:-1]])  # 각 봉의 시가 행 (직전 봉의 종가 행과 겹침)
+    volume_starts = np.concatenate([[0], breaks[:-1] + 1])
+    volume_ends = breaks + 1
+
+    bar_open = close[opens_at]
+    bar_open[0] = c_open
+    # 거래량은 기존 구현과 같은 순차 합산 순서를 유지
+    bar_volume = np.array([_seq_sum(volume[a:b]) for a, b in zip(volume_starts, volume_ends)])
+    bars = _bar_frame(
+        ts[opens_at],
+        bar_open,
+        _segment_reduce(np.maximum, high, opens_at, volume_ends),
+        _segment_reduce(np.minimum, low, opens_at, volume_ends),
+        close[breaks],
+        bar_volume,
+    )
+
+    rest_volume = volume[last + 1:]
+    carry = (ts[last], close[last], high[last:].max(), low[last:].min(), close[-1],
+             _seq_sum(rest_volume) if len(rest_volume) else 0.0)
+    return bars, carry
+
+
+def _seq_sum(values: np.ndarray) -> float:
+    """Python 누적 덧셈과 같은 순서의 합 (pairwise 합산 오차 방지)"""
+    return float(np.add.accumulate(values)[-1])
+
+
+def tick_bar(df: pd.DataFrame, price_column: str = 'Close', ticks: int = 100,
+             include_partial: bool = False) -> pd.DataFrame:
+    """틱 바 - 행(체결) ticks 개마다 봉 1개 (마지막 ticks 개 미만 봉은 include_partial 일 때만)"""
+    if ticks < 1:
+        raise ValueError(f"ticks 는 1 이상이어야 합니다: {ticks}")
+    starts = np.arange(0, len(df), ticks, dtype=np.int64)
+    if not include_partial and len(df) % ticks:
+        starts = starts[:-1]
+    return _build_bars(df, starts, ends=np.minimum(starts + ticks, len(df)), price_column=price_column)
+
+
+def volume_bar(df: pd.DataFrame, threshold: float, price_column: str = 'Close',
+               include_partial: bool = False) -> pd.DataFrame:
+    """볼륨 바 - 누적 거래량이 threshold 를 넘는 행에서 봉을 닫음 (마지막 미완성 봉은 include_partial 일 때만)"""
+    return _cumsum_bar(df, df['Volume'].to_numpy(dtype=float), threshold, price_column, include_partial)
+
+
+def dollar_bar(df: pd.DataFrame, threshold: float, price_column: str = 'Close',
+               include_partial: bool = False) -> pd.DataFrame:
+    """달러 바 - 누적 거래대금(가격 x 거래량)이 threshold 를 넘는 행에서 봉을 닫음 (마지막 미완성 봉은 include_partial 일 때만)"""
+    value = df[price_column].to_numpy(dtype=float) * df['Volume'].to_numpy(dtype=float)
+    return _cumsum_bar(df, value, threshold, price_column, include_partial)
+
+
+def _cumsum_bar(df: pd.DataFrame, amount: np.ndarray, threshold: float, price_column: str,
+                include_partial: bool) -> pd.DataFrame:
+    """누적합 버킷팅 - 행 i 는 직전까지의 누적합이 속한 버킷에 배정된다.
+    threshold 를 넘긴 행이 그 봉의 마지막 행이 되며, 한 행이 여러 배수를 넘어도 빈 봉은 만들지 않는다.
+    마지막 봉은 전체 누적합이 다음 배수에 도달했을 때만 완성된 봉이다."""
+    if threshold <= 0:
+        raise ValueError(f"threshold 는 0 보다 커야 합니다: {threshold}")
+    if len(df) == 0:
+        return _empty_bars()
+    cum = np.cumsum(amount)
+    cum_before = np.concatenate([[0.0], cum[:-1]])
+    bucket = np.floor_divide(cum_before, threshold)
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1.0)).astype(np.int64)
+    ends = np.append(starts[1:], len(df))
+    if not include_partial and np.floor_divide(cum[-1], threshold) <= bucket[-1]:
+        starts, ends = starts[:-1], ends[:-1]
+    return _build_bars(df, starts, ends, price_column=price_column)
+
+
+# ───── 공통 봉 생성 코어 ─────
+def _segment_reduce(ufunc, values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """구간 [starts[i], ends[i]) 별 ufunc 집계 (벡터화)
+
+    reduceat 인덱스를 start/end 교차로 배치하므로 인접 구간이 한 행씩 겹쳐도 동작한다.
+    """
+    idx = np.empty(len(starts) * 2, dtype=np.int64)
+    idx[0::2] = starts
+    idx[1::2] = ends
+    if idx[-1] >= len(values):
+        idx = idx[:-1]  # 마지막 구간은 배열 끝까지
+    return ufunc.reduceat(values, idx)[0::2]
+
+
+def _bar_frame(labels, open_, high, low, close, volume) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume,
+    }, index=pd.Index(labels, name='timestamp'))
+
+
+def _build_bars(df: pd.DataFrame, starts: np.ndarray, ends: np.ndarray = None,
+                labels=None, price_column: str = 'Close') -> pd.DataFrame:
+    """봉 i = 행 [starts[i], ends[i]) 의 OHLCV. ends 생략 시 다음 봉 시작 직전까지.
+    Open/High/Low 컬럼이 없으면(틱 데이터) price_column 으로 대체한다."""
+    if len(starts) == 0:
+        return _empty_bars()
+    if ends is None:
+        ends = np.append(starts[1:], len(df))
+    if labels is None:
+        labels = df.index[starts]
+
+    price = df[price_column].to_numpy(dtype=float)
+    open_ = df['Open'].to_numpy(dtype=float) if 'Open' in df else price
+    high = df['High'].to_numpy(dtype=float) if 'High' in df else price
+    low = df['Low'].to_numpy(dtype=float) if 'Low' in df else price
+    close = df['Close'].to_numpy(dtype=float) if 'Close' in df else price
+    volume = df['Volume'].to_numpy(dtype=float)
+
+    return _bar_frame(
+        labels,
+        open_[starts],
+        _segment_reduce(np.maximum, high, starts, ends),
+        _segment_reduce(np.minimum, low, starts, ends),
+        close[ends - 1],
+        _segment_reduce(np.add, volume, starts, ends),
+    )
@@ -0,0 +1,145 @@
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class RingBuffer:
+    """고정 용량 NumPy 링 버퍼
+
+    각 값을 [i] 와 [i + capacity] 두 곳에 기록해 두므로 view() 는 항상
+    연속된 구간을 복사 없이(zero-copy) 반환한다. append 는 제자리 O(1).
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError(f"capacity 는 1 이상이어야 합니다: {capacity}")
+        self.capacity = capacity
+        self._data = np.zeros(capacity * 2, dtype=dtype)
+        self._head = 0  # 다음 기록 위치 [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value):
+        self._data[self._head] = value
+        self._data[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values: Iterable):
+        for value in values:
+            self.append(value)
+
+    def drop_front(self, n: int):
+        """가장 오래된 값 n 개 제거"""
+        self._size -= min(max(n, 0), self._size)
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def view(self) -> np.ndarray:
+        """오래된 값 → 최신 값 순서의 읽기 전용 뷰 (복사 없음)"""
+        start = (self._head - self._size) % self.capacity
+        out = self._data[start:start + self._size]
+        out.flags.writeable = False
+        return out
+
+    def last(self):
+        if self._size == 0:
+            raise IndexError("빈 RingBuffer 입니다.")
+        return self._data[(self._head - 1) % self.capacity]
+
+
+class PriceStore:
+    """심볼 1개의 컬럼별 링 버퍼 - 시간 기반 보존(retention) 지원
+
+    기존 update_price() 의 pd.concat + .last("2h") 를 대체한다.
+    retention 보다 오래된 봉은 append 시점에 잘라내고, 용량을 넘으면
+    가장 오래된 봉부터 덮어쓰므로 실행 시간과 무관하게 메모리가 고정된다.
+    """
+
+    def __init__(self, columns: Iterable[str] = ("close",), capacity: int = 4096,
+                 retention: Optional[Union[str, pd.Timedelta]] = "2h"):
+        self.capacity = capacity
+        self.time = RingBuffer(capacity, dtype=np.int64)  # epoch ns
+        self.columns: Dict[str, RingBuffer] = {col: RingBuffer(capacity) for col in columns}
+        self.retention_ns = pd.Timedelta(retention).value if retention is not None else None
+        self.tz = None  # 처음 받은 시각의 타임존 - 내부는 UTC epoch ns, Series 로 만들 때 복원
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def append(self, timestamp, **values):
+        timestamp = pd.Timestamp(timestamp)
+        if not len(self.time):
+            self.tz = timestamp.tz
+        ts = timestamp.value
+        self.time.append(ts)
+        for col, buf in self.columns.items():
+            buf.append(values.get(col, np.nan))
+        self._trim(ts)
+
+    def extend(self, data: Union[pd.Series, pd.DataFrame]):
+        """DatetimeIndex 를 가진 Series(단일 컬럼) 또는 DataFrame 을 추가"""
+        if isinstance(data, pd.Series):
+            if len(self.columns) != 1:
+                raise ValueError("Series 는 단일 컬럼 PriceStore 에만 추가할 수 있습니다.")
+            arrays = {next(iter(self.columns)): data.to_numpy(dtype=float)}
+        else:
+            arrays = {col: data[col].to_numpy(dtype=float) if col in data else None for col in self.columns}
+        index = pd.DatetimeIndex(data.index)
+        if not len(self.time) and len(index):
+            self.tz = index.tz
+        times = index.as_unit("ns").asi8
+        for i, ts in enumerate(times):
+            self.time.append(ts)
+            for col, buf in self.columns.items():
+                arr = arrays[col]
+                buf.append(arr[i] if arr is not None else np.nan)
+        if len(times):
+            self._trim(times[-1])
+
+    def _trim(self, newest_ns: int):
+        if self.retention_ns is None:
+            return
+        # .last(retention) 과 동일하게 (최신 - retention) 이후의 봉만 유지
+        drop = int(np.searchsorted(self.time.view(), newest_ns - self.retention_ns, side="right"))
+        if drop:
+            self.time.drop_front(drop)
+            for buf in self.columns.values():
+                buf.drop_front(drop)
+
+    def view(self, column: str) -> np.ndarray:
+        """지표 계산용 zero-copy 뷰"""
+        return self.columns[column].view()
+
+    def window(self, column: str, n: Optional[int] = None) -> np.ndarray:
+        """최근 n 봉(None 이면 전체)의 zero-copy 읽기 전용 뷰 - 다음 append 전까지만 유효"""
+        values = self.columns[column].view()
+        return values if n is None else values[max(len(values) - n, 0):]
+
+    def times(self) -> np.ndarray:
+        """UTC 기준 M8[ns] 뷰 (타임존 정보 없음 - index() 는 tz 복원)"""
+        return self.time.view().view("M8[ns]")
+
+    def index(self, copy: bool = True) -> pd.DatetimeIndex:
+        times = self.times()
+        index = pd.DatetimeIndex(times.copy() if copy else times)
+        if self.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self.tz)
+        return index
+
+    def to_series(self, column: str = "close", copy: bool = True) -> pd.Series:
+        """기존 Series 기반 전략 호환용 Series
+
+        copy=False 이면 링 버퍼 메모리를 그대로 감싸므로 이후 append 로 버퍼가 한 바퀴 돌면
+        이미 반환한 Series 의 값/시각이 조용히 바뀐다. 다음 append 전에 쓰고 버리는 경우에만 사용한다.
+        """
+        values = self.view(column)
+        if copy:
+            values = values.copy()
+        return pd.Series(values, index=self.index(copy), name=column, copy=False)
@@ -1,8 +1,7 @@
 import os
 from pathlib import Path
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import declarative_base, sessionmaker
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from src.config import config
 
 # from src.db.sqlite.model.asset import stock_table_sql, futures_table_sql, cash_table_sql
@@ -13,6 +12,10 @@ from src.infra.postgresql.model.info_ddl import insert_exchanges
 # 공통 경로
 if config.DATABASE_ACCESS == "ORM":
     # print("🔵 SQLAlchemy ORM 모드 활성화")
+    # SQLAlchemy 는 import 비용이 커서 ORM 모드에서만 로드
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import declarative_base, sessionmaker
+
     engine = create_engine(config.DATABASE_URL)
     SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
     Base = declarative_base()
@@ -37,6 +40,22 @@ elif config.DATABASE_ACCESS == "Raw SQL":
             password=config.POSTGRES_PASSWORD
         )
 
+    _pool = None
+
+    def get_pool(maxconn: int = 8) -> ThreadedConnectionPool:
+        # 스레드 간 공유 연결 풀 - 첫 호출 시 생성 (가격 데이터 동시 로딩용)
+        global _pool
+        if _pool is None or _pool.closed:
+            _pool = ThreadedConnectionPool(
+                1, maxconn,
+                host=config.POSTGRES_HOST,
+                port=config.POSTGRES_PORT,
+                database=config.POSTGRES_DB,
+                user=config.POSTGRES_USER,
+                password=config.POSTGRES_PASSWORD
+            )
+        return _pool
+
 elif config.DATABASE_ACCESS == "Query Builder":
     pass
     # print("🟢 Query Builder 방식 활성화")
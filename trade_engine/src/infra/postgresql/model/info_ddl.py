@@ -64,6 +64,7 @@ CREATE TABLE IF NOT EXISTS con_x_data (
     con_id INTEGER PRIMARY KEY,
     contract TEXT NOT NULL,
     -- database TEXT,                 -- 예: 'CN, US, EU'
+    data_path TEXT,                -- BarStore 디렉터리 (BAR_STORE_DIR 기준 {con_id}/{interval})
     interval TEXT,                 -- 예: '5s,1m,1R' (쉼표 구분)
     -- 만기일자
     is_active TEXT DEFAULT 'Y',    -- 'Y' or 'N'
@@ -153,14 +154,14 @@ insert_contracts = """
 
 insert_con_x_data = """
     INSERT INTO con_x_data (contract, con_id, data_path, interval, is_active, is_live) VALUES
-        ('ES',     200001, 'US.sqlite.ES',     '5s,1m,1R', 'Y', 'Y'),
-        ('NQ',     200002, 'US.sqlite.NQ',     '5s,1m,1R', 'Y', 'Y'),
-        ('YM',     200003, 'US.sqlite.YM',     '5s,1m,1R', 'Y', 'Y'),
-        ('RTY',    200004, 'US.sqlite.RTY',    '5s,1m,1R', 'Y', 'Y'),
-        ('CL',     200005, 'US.sqlite.CL',     '5s,1m,1R', 'Y', 'Y'),
-        ('GC',     200006, 'US.sqlite.GC',     '5s,1m,1R', 'Y', 'Y'),
-        ('SI',     200007, 'US.sqlite.SI',     '5s,1m,1R', 'Y', 'Y'),
-        ('A50',    200008, 'CN.sqlite.A50',    '5s,1m,1R', 'Y', 'Y'),
-        ('NK225',  200009, 'JP.sqlite.NK225',  '5s,1m,1R', 'Y', 'Y'),
-        ('HSI',    200010, 'HK.sqlite.HSI',    '5s,1m,1R', 'Y', 'Y');
+        ('ES',     200001, '200001', '5s,1m,1R', 'Y', 'Y'),
+        ('NQ',     200002, '200002', '5s,1m,1R', 'Y', 'Y'),
+        ('YM',     200003, '200003', '5s,1m,1R', 'Y', 'Y'),
+        ('RTY',    200004, '200004', '5s,1m,1R', 'Y', 'Y'),
+        ('CL',     200005, '200005', '5s,1m,1R', 'Y', 'Y'),
+        ('GC',     200006, '200006', '5s,1m,1R', 'Y', 'Y'),
+        ('SI',     200007, '200007', '5s,1m,1R', 'Y', 'Y'),
+        ('A50',    200008, '200008', '5s,1m,1R', 'Y', 'Y'),
+        ('NK225',  200009, '200009', '5s,1m,1R', 'Y', 'Y'),
+        ('HSI',    200010, '200010', '5s,1m,1R', 'Y', 'Y');
 """
@@ -0,0 +1,79 @@
+import io
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+# trade_batch/src/jobs/market_data.py 의 거래소 → 지역 테이블 매핑 (GLOBEX 는 엔진 Contract 의 CME 표기)
+REGION_BY_EXCHANGE = {
+    'CME': 'us', 'GLOBEX': 'us', 'CBOT': 'us', 'NYMEX': 'us', 'COMEX': 'us',
+    'EUREX': 'eu', 'ICEEU': 'eu',
+    'HKFE': 'cn', 'SGX': 'cn', 'JPX': 'cn', 'KSE': 'cn'
+}
+REGIONS = ("us", "eu", "cn")
+
+# COPY 로 읽는 컬럼 - (이름, SELECT 식, 바이너리 타입). NULL 은 SELECT 에서 채워 행 길이를 고정한다
+PRICE_FIELDS = (
+    ("utc", "utc::timestamptz", ">i8"),                     # 2000-01-01 UTC 기준 us (컬럼 타입과 무관하게 고정)
+    ("open", "COALESCE(open, 'NaN')::float8", ">f8"),
+    ("high", "COALESCE(high, 'NaN')::float8", ">f8"),
+    ("low", "COALESCE(low, 'NaN')::float8", ">f8"),
+    ("close", "COALESCE(close, 'NaN')::float8", ">f8"),
+    ("volume", "COALESCE(volume, 0)::float8", ">f8"),
+    ("count", "COALESCE(count, 0)::int8", ">i8"),
+    ("vwap", "COALESCE(vwap, 'NaN')::float8", ">f8"),
+)
+
+_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_PG_EPOCH_US = 946_684_800_000_000  # 1970-01-01 → 2000-01-01 (us)
+
+
+def price_table(exchange: Optional[str]) -> str:
+    """거래소 → price_time_{region} (모르는 거래소는 us)"""
+    return f"price_time_{REGION_BY_EXCHANGE.get(exchange or '', 'us')}"
+
+
+def copy_query(cursor, table: str, con_id: int, stt_dt: datetime, end_dt: datetime) -> str:
+    """con_id 의 [stt_dt, end_dt] 구간 바이너리 COPY 문 - COPY 는 바인드 파라미터가 없어 mogrify 로 값 삽입"""
+    if table not in {f"price_time_{region}" for region in REGIONS}:
+        raise ValueError(f"알 수 없는 가격 테이블: {table}")
+    columns = ", ".join(expr for _, expr, _ in PRICE_FIELDS)
+    select = cursor.mogrify(
+        f"SELECT {columns} FROM {table} WHERE con_id = %s AND utc >= %s AND utc <= %s ORDER BY utc",
+        (con_id, stt_dt, end_dt)).decode()
+    return f"COPY ({select}) TO STDOUT WITH (FORMAT binary)"
+
+
+def decode_copy_binary(buffer: bytes) -> Dict[str, np.ndarray]:
+    """PostgreSQL 바이너리 COPY 출력 → 컬럼 배열
+
+    PRICE_FIELDS 는 모두 NULL 없는 고정 길이라 행마다 크기가 같으므로, 헤더/트레일러를 뗀 본문을
+    구조화 dtype 으로 np.frombuffer 해 행 단위 파싱 없이 한 번에 디코딩한다.
+    """
+    view = memoryview(buffer)
+    if bytes(view[:len(_SIGNATURE)]) != _SIGNATURE:
+        raise ValueError("바이너리 COPY 형식이 아닙니다.")
+    extension = int.from_bytes(view[15:19], "big")
+    body = view[19 + extension:len(view) - 2]  # 트레일러(int16 -1) 제외
+
+    row = [("fields", ">i2")]
+    for name, _, dtype in PRICE_FIELDS:
+        row += [(f"{name}_len", ">i4"), (name, dtype)]
+    rows = np.frombuffer(body, dtype=np.dtype(row))
+    if len(rows) and (rows["fields"] != len(PRICE_FIELDS)).any():
+        raise ValueError("예상과 다른 COPY 컬럼 수")
+
+    columns = {"timestamp": ((rows["utc"].astype(np.int64) + _PG_EPOCH_US) * 1000).view("datetime64[ns]")}
+    for name, _, dtype in PRICE_FIELDS[1:]:
+        columns[name] = rows[name].astype(np.int64 if dtype == ">i8" else np.float64)  # native 바이트 순서
+    return columns
+
+
+def copy_prices(conn, table: str, con_id: int, stt_dt: datetime, end_dt: datetime) -> Dict[str, np.ndarray]:
+    """연결 1개로 con_id 구간을 바이너리 COPY 로 받아 컬럼 배열로 반환 (시각은 UTC naive)"""
+    buffer = io.BytesIO()
+    with conn.cursor() as cursor:
+        cursor.execute("SET TIME ZONE 'UTC'")
+        cursor.copy_expert(copy_query(cursor, table, con_id, stt_dt, end_dt), buffer)
+    conn.rollback()  # 읽기 전용 트랜잭션 종료 후 풀에 반환
+    return decode_copy_binary(buffer.getbuffer())
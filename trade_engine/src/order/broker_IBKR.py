@@ -1,103 +1,133 @@
 from ib_insync import IB, Order, Contract
 from typing import Dict, List, Optional
 from src.order.broker_interface import BrokerInterface
+from src.order.order_handle import OrderHandle
+from src.order.order_book import OrderBook
+from src.order.position_cache import PositionCache
 
 
 class BrokerIBKR(BrokerInterface):
 
     def __init__(self, ib: IB):
         self.ib = ib
+        self.orders = OrderBook()  # 주문 이벤트로 갱신되는 주문 인덱스
+        self.orders.attach(ib)
+        self.positions = PositionCache()  # 포지션/체결 이벤트로 갱신되는 포지션 캐시
+        self.positions.attach(ib)
 
-    def send_order(self, contract: Contract, side: str, quantity: float,
-                   order_type: str = "market", price: Optional[float] = None,
-                   tag: Optional[str] = None) -> Dict:
-        # contract는 이미 Contract 객체이므로 그대로 사용
+    @staticmethod
+    def _build_order(side: str, quantity: float, order_type: str = "market",
+                     price: Optional[float] = None, tag: Optional[str] = None) -> Order:
         if order_type == "market":
             order = Order(action=side.upper(), totalQuantity=quantity, orderType="MKT")
         elif order_type == "limit":
             order = Order(action=side.upper(), totalQuantity=quantity, orderType="LMT", lmtPrice=price)
+        elif order_type == "stop":
+            order = Order(action=side.upper(), totalQuantity=quantity, orderType="STP", auxPrice=price)
         else:
             raise ValueError(f"지원되지 않는 주문 유형: {order_type}")
+        if tag:
+            order.orderRef = tag
+        return order
 
+    def _place(self, contract: Contract, order: Order, side: str, order_type: str,
+               price: Optional[float], tag: Optional[str]) -> OrderHandle:
         trade = self.ib.placeOrder(contract, order)
-        self.ib.sleep(1)  # 체결 대기
+        self.orders.update(trade)
+        return OrderHandle.from_trade(trade, side, order_type, price, tag)
 
-        status = trade.orderStatus.status
-        fill_price = trade.fills[0].execution.price if trade.fills else None
+    def submit_order(self, contract: Contract, side: str, quantity: float,
+                     order_type: str = "market", price: Optional[float] = None,
+                     tag: Optional[str] = None) -> OrderHandle:
+        """주문 전송 후 바로 핸들 반환 - 체결/부분 체결/상태 변화는 IBKR 주문 이벤트로 갱신"""
+        # contract는 이미 Contract 객체이므로 그대로 사용
+        order = self._build_order(side, quantity, order_type, price, tag)
+        return self._place(contract, order, side, order_type, price, tag)
 
-        return {
-            "order_id": trade.order.permId,
-            "symbol": contract.symbol,
-            "side": side,
-            "quantity": quantity,
-            "price": fill_price,
-            "status": status,
-            "tag": tag
-        }
+    def submit_bracket(self, contract: Contract, side: str, quantity: float,
+                       order_type: str = "market", price: Optional[float] = None,
+                       stop_loss: Optional[float] = None, take_profit: Optional[float] = None,
+                       tag: Optional[str] = None) -> List[OrderHandle]:
+        """진입 + 익절(LMT)/손절(STP) 자식 주문을 한 번에 전송 → [진입, 익절, 손절] 핸들
+
+        자식 주문은 parentId 로 묶여 진입 체결 후 활성화되고 하나가 체결되면 나머지는 취소된다.
+        마지막 주문만 transmit=True 로 보내 세 주문이 함께 접수된다.
+        """
+        exit_side = "sell" if side == "buy" else "buy"
+        parent = self._build_order(side, quantity, order_type, price, tag)
+        parent.orderId = self.ib.client.getReqId()
+        legs = [(parent, side, order_type, price)]
+        if take_profit is not None:
+            legs.append((self._build_order(exit_side, quantity, "limit", take_profit, tag),
+                         exit_side, "limit", take_profit))
+        if stop_loss is not None:
+            legs.append((self._build_order(exit_side, quantity, "stop", stop_loss, tag),
+                         exit_side, "stop", stop_loss))
+
+        for i, (order, *_) in enumerate(legs):
+            if i > 0:
+                order.orderId = self.ib.client.getReqId()
+                order.parentId = parent.orderId
+            order.transmit = i == len(legs) - 1
+        return [self._place(contract, order, leg_side, leg_type, leg_price, tag)
+                for order, leg_side, leg_type, leg_price in legs]
+
+    def send_order(self, contract: Contract, side: str, quantity: float,
+                   order_type: str = "market", price: Optional[float] = None,
+                   tag: Optional[str] = None) -> Dict:
+        # 체결을 기다리지 않음 - 전송 시점 상태 반환 (체결 추적은 submit_order 핸들 사용)
+        return self.submit_order(contract, side, quantity, order_type, price, tag).to_dict()
 
     def cancel_order(self, order_id: str) -> bool:
-        for trade in self.ib.trades():
-            if str(trade.order.permId) == order_id:
-                self.ib.cancelOrder(trade.order)
-                return True
-        return False
+        trade = self.orders.get(order_id)
+        if trade is None:
+            return False
+        self.ib.cancelOrder(trade.order)
+        return True
 
     def cancel_all_orders(self, symbol: Optional[str] = None) -> int:
-        count = 0
-        for trade in self.ib.trades():
-            if trade.orderStatus.status == "Submitted":
-                if symbol is None or trade.contract.symbol == symbol:
-                    self.ib.cancelOrder(trade.order)
-                    count += 1
-        return count
+        trades = self.orders.open_trades(symbol)
+        for trade in trades:
+            self.ib.cancelOrder(trade.order)
+        return len(trades)
 
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         result = []
-        for trade in self.ib.trades():
-            if trade.orderStatus.status == "Submitted":
-                if symbol is None or trade.contract.symbol == symbol:
-                    result.append({
-                        "order_id": trade.order.permId,
-                        "symbol": trade.contract.symbol,
-                        "side": trade.order.action.lower(),
-                        "quantity": trade.order.totalQuantity,
-                        "status": trade.orderStatus.status
-                    })
+        for trade in self.orders.open_trades(symbol):
+            result.append({
+                "order_id": trade.order.permId,
+                "symbol": trade.contract.symbol,
+                "side": trade.order.action.lower(),
+                "quantity": trade.order.totalQuantity,
+                "status": trade.orderStatus.status
+            })
         return result
 
     def get_order_status(self, order_id: str) -> Dict:
-        for trade in self.ib.trades():
-            if str(trade.order.permId) == order_id:
-                return {
-                    "order_id": order_id,
-                    "symbol": trade.contract.symbol,
-                    "status": trade.orderStatus.status,
-                    "filled": trade.orderStatus.filled,
-                    "remaining": trade.orderStatus.remaining
-                }
-        return {"order_id": order_id, "status": "unknown"}
+        trade = self.orders.get(order_id)
+        if trade is None:
+            return {"order_id": order_id, "status": "unknown"}
+        return {
+            "order_id": order_id,
+            "symbol": trade.contract.symbol,
+            "status": trade.orderStatus.status,
+            "filled": trade.orderStatus.filled,
+            "remaining": trade.orderStatus.remaining
+        }
 
     def get_position(self, contract: Contract) -> Dict:
-        self.ib.reqPositions()
-        for pos in self.ib.positions():
-            # 종목 종류별(주식, 선물 등) 비교 필요시 contract_vo의 기타 필드도 활용 가능
-            if pos.contract.symbol == contract.symbol:
-                return {
-                    "symbol": contract.symbol,
-                    "size": pos.position,
-                    "avg_price": pos.avgCost
-                }
-        return {"symbol": contract.symbol, "size": 0.0, "avg_price": 0.0}
+        # reqPositions 왕복 없이 이벤트로 갱신된 캐시에서 조회
+        pos = self.positions.get(contract.symbol, contract.conId)
+        if pos is None:
+            return {"symbol": contract.symbol, "size": 0.0, "avg_price": 0.0}
+        return {"symbol": contract.symbol, **pos}
 
     def get_all_positions(self) -> Dict[str, Dict]:
-        positions = {}
-        self.ib.reqPositions()
-        for pos in self.ib.positions():
-            positions[pos.contract.symbol] = {
-                "size": pos.position,
-                "avg_price": pos.avgCost
-            }
-        return positions
+        return self.positions.all()
+
+    def reconcile_positions(self) -> Dict[str, Dict]:
+        self.positions.reconcile(self.ib)
+        return self.positions.all()
 
     def get_account_info(self) -> Dict:
         account = self.ib.accountSummary()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict
 from ib_insync import Contract
+from src.order.order_handle import OrderHandle
 
 
 class BrokerInterface(ABC):
@@ -14,6 +15,20 @@ class BrokerInterface(ABC):
                    tag: Optional[str] = None) -> Dict:
         """시장/지정가 주문 전송"""
 
+    def submit_order(self, contract: Contract, side: str, quantity: float,
+                     order_type: str = "market", price: Optional[float] = None,
+                     tag: Optional[str] = None) -> OrderHandle:
+        """주문 전송 후 핸들 반환 (기본: send_order 결과로 만든 완료 핸들)"""
+        result = self.send_order(contract, side, quantity, order_type, price, tag)
+        return OrderHandle.from_result(result, order_type)
+
+    def submit_bracket(self, contract: Contract, side: str, quantity: float,
+                       order_type: str = "market", price: Optional[float] = None,
+                       stop_loss: Optional[float] = None, take_profit: Optional[float] = None,
+                       tag: Optional[str] = None) -> List[OrderHandle]:
+        """진입 + 손절/익절 브라켓 주문 전송 → [진입, 익절, 손절] 핸들"""
+        raise NotImplementedError(f"{type(self).__name__} 는 브라켓 주문을 지원하지 않습니다.")
+
     @abstractmethod
     def cancel_order(self, order_id: str) -> bool:
         """특정 주문 취소"""
@@ -39,6 +54,10 @@ class BrokerInterface(ABC):
     def get_all_positions(self) -> Dict[str, Dict]:
         """모든 보유 포지션 반환"""
 
+    def reconcile_positions(self) -> Dict[str, Dict]:
+        """브로커와 포지션 재동기화 후 전체 포지션 반환 (기본: get_all_positions)"""
+        return self.get_all_positions()
+
     @abstractmethod
     def get_account_info(self) -> Dict:
         """총 자산, 잔고, 미실현 손익 등 계좌 정보"""
@@ -0,0 +1,241 @@
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pandas as pd
+from ib_insync import Contract
+
+from src.order.broker_interface import BrokerInterface
+from src.order.order_handle import OrderHandle
+
+
+@dataclass
+class FillModel:
+    """모의 체결 규칙
+
+    :param slippage: 시장가 체결 시 불리한 방향으로 더하는 가격 비율 (0.0001 = 1bp)
+    :param latency: 주문 후 체결 가능해지기까지의 시뮬레이션 시간(초)
+    :param max_fill_quantity: 가격 업데이트 1회당 최대 체결 수량 (None 이면 전량, 부분 체결 재현용)
+    :param commission: 체결 수량당 수수료
+    """
+    slippage: float = 0.0
+    latency: float = 0.0
+    max_fill_quantity: Optional[float] = None
+    commission: float = 0.0
+
+
+class SimBroker(BrokerInterface):
+    """프로세스 내 모의 브로커 - TWS 없이 OrderManager/실시간 루프 부하 테스트용
+
+    update_price(symbol, price, timestamp) 로 시세와 시뮬레이션 시계를 진행시키면
+    미체결 주문을 FillModel 규칙으로 체결한다. 시장가는 latency 가 지난 뒤 첫 시세에서,
+    지정가는 시세가 지정가에 닿으면, 스탑은 시세가 스탑가에 닿으면 그 시세(+슬리피지)로 체결된다.
+    브라켓 자식 주문은 진입 주문이 전량 체결되면 활성화되고, 하나가 체결되면 나머지는 취소된다.
+    심볼별 미체결 주문만 확인하므로
+    가격 업데이트 비용은 해당 심볼의 미체결 주문 수에 비례한다.
+
+    orders 에는 utils/reporter.py 가 읽는 주문 이력(dict)이 쌓인다.
+    """
+
+    def __init__(self, starting_cash: float = 100_000, fill_model: Optional[FillModel] = None):
+        self.fill_model = fill_model or FillModel()
+        self.cash = starting_cash
+        self.now = 0.0                                   # 시뮬레이션 시각 (초)
+        self.prices: Dict[str, float] = {}
+        self.positions: Dict[str, Dict] = {}
+        self.orders: Dict[int, Dict] = {}                # 주문 이력
+        self._handles: Dict[int, OrderHandle] = {}
+        self._open: Dict[str, Dict[int, OrderHandle]] = {}  # 심볼별 미체결 주문
+        self._ready_at: Dict[int, float] = {}
+        self._held: Dict[int, List[OrderHandle]] = {}    # 진입 주문 id → 체결 대기 중인 브라켓 자식 주문
+        self._oco: Dict[int, List[OrderHandle]] = {}     # 브라켓 자식 주문 id → 함께 취소할 나머지 자식
+        self._ids = itertools.count(1)
+
+    # ───── 시세 ─────
+    def update_price(self, symbol: str, price: float, timestamp=None):
+        """시세 반영 후 해당 심볼의 체결 가능한 주문 처리"""
+        if timestamp is not None:
+            self.now = _to_seconds(timestamp)
+        self.prices[symbol] = price
+        open_orders = self._open.get(symbol)
+        if open_orders:
+            for handle in list(open_orders.values()):
+                # 같은 시세에서 먼저 체결된 브라켓 자식이 나머지를 취소했을 수 있음
+                if not handle.is_done:
+                    self._try_fill(handle, price)
+
+    def _try_fill(self, handle: OrderHandle, price: float):
+        if self.now < self._ready_at[handle.order_id]:
+            return
+        model = self.fill_model
+        buy = handle.side == "buy"
+        if handle.order_type == "limit":
+            if (buy and price > handle.price) or (not buy and price < handle.price):
+                return
+            fill_price = min(price, handle.price) if buy else max(price, handle.price)
+        elif handle.order_type == "stop":
+            if (buy and price < handle.price) or (not buy and price > handle.price):
+                return
+            fill_price = price * (1 + model.slippage) if buy else price * (1 - model.slippage)
+        else:
+            fill_price = price * (1 + model.slippage) if buy else price * (1 - model.slippage)
+
+        quantity = handle.remaining
+        if model.max_fill_quantity is not None:
+            quantity = min(quantity, model.max_fill_quantity)
+        self._fill(handle, quantity, fill_price)
+
+    def _fill(self, handle: OrderHandle, quantity: float, price: float):
+        signed = quantity if handle.side == "buy" else -quantity
+        self.cash -= signed * price + quantity * self.fill_model.commission
+        self._apply_position(handle.symbol, signed, price)
+
+        handle.add_fill(quantity, price)
+        record = self.orders[handle.order_id]
+        record.update(filled=handle.filled, remaining=handle.remaining, price=handle.avg_fill_price)
+        if handle.remaining <= 0:
+            self._close(handle, "Filled")
+        else:
+            record["status"] = "partially_filled"
+
+    def _apply_position(self, symbol: str, signed: float, price: float):
+        pos = self.positions.setdefault(symbol, {"size": 0.0, "avg_price": 0.0})
+        size = pos["size"]
+        new_size = size + signed
+        if size == 0 or (size > 0) == (signed > 0):
+            # 신규/추가 진입 - 평균가 가중 평균
+            pos["avg_price"] = (pos["avg_price"] * abs(size) + price * abs(signed)) / abs(new_size)
+        elif (size > 0) != (new_size > 0) and new_size != 0:
+            # 반대 방향으로 넘어감 - 남은 수량은 체결가로 새로 진입
+            pos["avg_price"] = price
+        elif new_size == 0:
+            pos["avg_price"] = 0.0
+        pos["size"] = new_size
+
+    def _close(self, handle: OrderHandle, status: str):
+        self._open[handle.symbol].pop(handle.order_id, None)
+        self._ready_at.pop(handle.order_id, None)
+        self.orders[handle.order_id]["status"] = status.lower()
+        handle.set_status(status, handle.filled, handle.avg_fill_price)
+
+        children = self._held.pop(handle.order_id, [])
+        for child in children:
+            if status == "Filled":
+                self._activate(child)
+            else:
+                self._close(child, "Cancelled")
+        for sibling in self._oco.pop(handle.order_id, []):
+            self._oco.pop(sibling.order_id, None)
+            if status == "Filled" and not sibling.is_done:
+                self._close(sibling, "Cancelled")
+
+    def _activate(self, handle: OrderHandle):
+        """미체결 주문으로 등록 - 지연이 없고 시세가 있으면 즉시 체결 시도"""
+        self._open.setdefault(handle.symbol, {})[handle.order_id] = handle
+        self._ready_at[handle.order_id] = self.now + self.fill_model.latency
+        self.orders[handle.order_id]["status"] = "submitted"
+        handle.set_status("Submitted")
+        last = self.prices.get(handle.symbol)
+        if last is not None and self.fill_model.latency <= 0:
+            self._try_fill(handle, last)
+
+    # ───── 주문 ─────
+    def submit_order(self, contract: Contract, side: str, quantity: float,
+                     order_type: str = "market", price: Optional[float] = None,
+                     tag: Optional[str] = None) -> OrderHandle:
+        handle = self._new_order(contract, side, quantity, order_type, price, tag)
+        self._activate(handle)
+        return handle
+
+    def _new_order(self, contract: Contract, side: str, quantity: float, order_type: str,
+                   price: Optional[float], tag: Optional[str]) -> OrderHandle:
+        if order_type not in ("market", "limit", "stop"):
+            raise ValueError(f"지원되지 않는 주문 유형: {order_type}")
+        if order_type != "market" and price is None:
+            # 가격 없는 지정가/스탑은 update_price() 에서 None 비교로 실패하므로 전송 시점에 거부
+            raise ValueError(f"{order_type} 주문에는 price 가 필요합니다.")
+        if quantity <= 0:
+            raise ValueError(f"주문 수량은 0 보다 커야 합니다: {quantity}")
+        order_id = next(self._ids)
+        handle = OrderHandle(order_id, contract.symbol, side, quantity, order_type, price, tag)
+        self._handles[order_id] = handle
+        self.orders[order_id] = {
+            "order_id": order_id, "symbol": contract.symbol, "side": side, "quantity": quantity,
+            "order_type": order_type, "limit_price": price, "price": None, "status": "held",
+            "filled": 0.0, "remaining": quantity, "timestamp": self.now, "tag": tag
+        }
+        self._open.setdefault(contract.symbol, {})
+        return handle
+
+    def submit_bracket(self, contract: Contract, side: str, quantity: float,
+                       order_type: str = "market", price: Optional[float] = None,
+                       stop_loss: Optional[float] = None, take_profit: Optional[float] = None,
+                       tag: Optional[str] = None) -> List[OrderHandle]:
+        """진입 + 익절(지정가)/손절(스탑) 자식 주문 → [진입, 익절, 손절] 핸들 (BrokerIBKR 와 같은 순서)"""
+        exit_side = "sell" if side == "buy" else "buy"
+        parent = self._new_order(contract, side, quantity, order_type, price, tag)
+        children = []
+        if take_profit is not None:
+            children.append(self._new_order(contract, exit_side, quantity, "limit", take_profit, tag))
+        if stop_loss is not None:
+            children.append(self._new_order(contract, exit_side, quantity, "stop", stop_loss, tag))
+        for child in children:
+            child.set_status("PreSubmitted")  # 진입 체결 전까지 대기
+            self._oco[child.order_id] = [other for other in children if other is not child]
+        self._held[parent.order_id] = children
+        self._activate(parent)
+        return [parent, *children]
+
+    def send_order(self, contract: Contract, side: str, quantity: float,
+                   order_type: str = "market", price: Optional[float] = None,
+                   tag: Optional[str] = None) -> Dict:
+        return self.submit_order(contract, side, quantity, order_type, price, tag).to_dict()
+
+    def cancel_order(self, order_id: str) -> bool:
+        handle = self._handles.get(int(order_id))
+        if handle is None or handle.is_done:
+            return False
+        self._close(handle, "Cancelled")
+        return True
+
+    def cancel_all_orders(self, symbol: Optional[str] = None) -> int:
+        symbols = [symbol] if symbol is not None else list(self._open)
+        handles = [h for s in symbols for h in self._open.get(s, {}).values()]
+        for handle in handles:
+            self._close(handle, "Cancelled")
+        return len(handles)
+
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
+        symbols = [symbol] if symbol is not None else list(self._open)
+        return [dict(self.orders[order_id]) for s in symbols for order_id in self._open.get(s, {})]
+
+    def get_order_status(self, order_id: str) -> Dict:
+        record = self.orders.get(int(order_id))
+        if record is None:
+            return {"order_id": order_id, "status": "unknown"}
+        return dict(record)
+
+    # ───── 포지션 및 계좌 정보 ─────
+    def get_position(self, contract: Contract) -> Dict:
+        pos = self.positions.get(contract.symbol, {"size": 0.0, "avg_price": 0.0})
+        return {"symbol": contract.symbol, **pos}
+
+    def get_all_positions(self) -> Dict[str, Dict]:
+        return {symbol: dict(pos) for symbol, pos in self.positions.items() if pos["size"]}
+
+    def get_account_info(self) -> Dict:
+        market_value = sum(pos["size"] * self.prices.get(symbol, pos["avg_price"])
+                           for symbol, pos in self.positions.items())
+        return {
+            "cash": self.cash,
+            "buying_power": self.cash,
+            "margin": 0.0,
+            "positions": self.get_all_positions(),
+            "total_equity": self.cash + market_value,
+        }
+
+
+def _to_seconds(timestamp) -> float:
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    return pd.Timestamp(timestamp).value / 1e9
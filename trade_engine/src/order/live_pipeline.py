@@ -0,0 +1,147 @@
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+from ib_insync import Contract
+
+from src.data.bar_aggregator import Bar, TimeBarAggregator
+from src.order.order_manager import OrderManager
+from src.order.runner import Runner
+from src.strategies.indicator_graph import IndicatorGraph
+
+
+STAGES = ("aggregate", "signal", "order")
+
+
+class LivePipeline:
+    """실시간 처리 경로: 소스 봉 → TimeBarAggregator → Runner 시그널 → OrderManager
+
+    run_live_trade 와 ReplayEngine 이 같은 객체를 사용해 실거래와 리플레이 경로가 어긋나지 않게 한다.
+    심볼 1개에 전략 여러 개를 등록할 수 있고, 집계기와 지표 그래프는 심볼 단위로 1개만 둔다
+    (그래프는 봉마다 1회 갱신 후 전략들이 공유 지표를 읽는다).
+    단계별 누적 소요 시간(timings)과 호출 수(counts)를 기록한다.
+    """
+
+    def __init__(self, interval: str = "1m", source_seconds: int = 5,
+                 order_manager: Optional[OrderManager] = None, quantity: float = 1):
+        self.interval = interval
+        self.source_seconds = source_seconds
+        self.order_manager = order_manager
+        self.quantity = quantity
+        self.runners: Dict[str, Dict] = {}
+        self.timings: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.counts: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.signals = 0
+
+    def add_symbol(self, symbol: str, strategy, contract: Optional[Contract] = None,
+                   graph: Optional[IndicatorGraph] = None):
+        """같은 심볼로 다시 호출하면 전략을 추가 - graph: 전략이 공유 지표를 쓰는 경우 봉마다 전략 실행 전에 1회 갱신"""
+        strategy.prepare_live()  # 증분 지표 warm-up 을 첫 봉이 아니라 등록 시점에 수행
+        item = self.runners.get(symbol)
+        if item is None:
+            item = self.runners[symbol] = {"runners": [], "contract": contract, "graphs": [],
+                                           "aggregator": TimeBarAggregator(self.interval, self.source_seconds)}
+        elif contract is not None:
+            item["contract"] = contract
+        item["runners"].append(Runner(strategy))
+        graph = graph if graph is not None else getattr(strategy, "graph", None)
+        if graph is not None and all(graph is not known for known in item["graphs"]):
+            item["graphs"].append(graph)
+
+    def reset_timings(self):
+        for stage in STAGES:
+            self.timings[stage] = 0.0
+            self.counts[stage] = 0
+        self.signals = 0
+
+    def on_stream(self, symbol: str, contract: Contract, realtime_bar):
+        """IBKRData.stream_live handler - ib_insync RealTimeBar 1개"""
+        self.on_source_bar(symbol, contract, realtime_bar.time, realtime_bar.open_, realtime_bar.high,
+                           realtime_bar.low, realtime_bar.close, realtime_bar.volume)
+
+    def on_source_bar(self, symbol: str, contract: Contract, timestamp, open_: float, high: float,
+                      low: float, close: float, volume: float):
+        # 소스 봉은 집계만 하고, interval 봉이 닫힐 때만 전략 실행
+        started = time.perf_counter()
+        bars = self.runners[symbol]["aggregator"].update(timestamp, open_, high, low, close, volume)
+        self.timings["aggregate"] += time.perf_counter() - started
+        self.counts["aggregate"] += 1
+        for bar in bars:
+            self.on_bar(symbol, contract, bar)
+
+    def on_time(self, now=None, grace_seconds: Optional[float] = None) -> int:
+        """타이머용 - 구간이 끝났는데 소스 봉이 더 오지 않는 미완성 봉을 종료하고 전략 실행
+
+        마지막 소스 봉은 구간 끝 직후 도착하므로 grace_seconds(기본 소스 봉 길이)만큼 늦춰 판단한다.
+        :return: 종료한 봉 수
+        """
+        now = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+        cutoff = now - pd.Timedelta(seconds=self.source_seconds if grace_seconds is None else grace_seconds)
+        closed = 0
+        for symbol, item in self.runners.items():
+            for bar in item["aggregator"].on_time(cutoff):
+                self.on_bar(symbol, item["contract"], bar)
+                closed += 1
+        return closed
+
+    def flush(self, contracts: Optional[Dict[str, Contract]] = None) -> int:
+        """세션 종료 - 모든 심볼의 미완성 봉을 종료하고 전략 실행
+
+        :param contracts: 심볼별 Contract (없으면 add_symbol 에 준 contract 사용)
+        """
+        contracts = contracts or {}
+        closed = 0
+        for symbol, item in self.runners.items():
+            contract = contracts.get(symbol) or item["contract"]
+            for bar in item["aggregator"].flush():
+                self.on_bar(symbol, contract, bar)
+                closed += 1
+        return closed
+
+    def on_bar(self, symbol: str, contract: Contract, bar: Bar) -> List[str]:
+        """닫힌 봉 1개 처리 - 심볼에 등록된 전략 순서대로의 시그널 목록 반환"""
+        started = time.perf_counter()
+        item = self.runners[symbol]
+        for graph in item["graphs"]:
+            graph.update(bar.close)
+        signals = []
+        for runner in item["runners"]:
+            if runner.strategy.incremental:
+                # 증분 지표 경로 - Series 재구성 없이 봉 1개로 시그널 갱신
+                entry, exit_, direction = runner.run_live_bar(bar.close, bar.timestamp)
+            else:
+                price_series = pd.Series([bar.close], index=[bar.timestamp])
+                entries, exits, direction = runner.run_live_signal(price_series)
+                entry, exit_ = entries.iloc[-1], exits.iloc[-1]
+
+            # '외부에서 요청이 있을시'
+            # live_pf = runner.analyze_portfolio(entries, exits, direction)
+
+            if entry:
+                signals.append("buy")
+            elif exit_:
+                signals.append("sell")
+            else:
+                signals.append("hold")
+        self.timings["signal"] += time.perf_counter() - started
+        self.counts["signal"] += 1
+
+        for signal in signals:
+            if signal not in ("buy", "sell"):
+                continue
+            self.signals += 1
+            if self.order_manager is None:
+                print(f"[{symbol}] {signal.upper()} SIGNAL 발생 (주문 처리 스킵 - OrderManager 미설정)")
+            else:
+                started = time.perf_counter()
+                self.order_manager.handle_signal(contract or item["contract"], signal, self.quantity)
+                self.timings["order"] += time.perf_counter() - started
+                self.counts["order"] += 1
+        return signals
+
+    def stage_report(self) -> Dict[str, Dict]:
+        """단계별 누적 시간(초), 호출 수, 호출당 평균(us)"""
+        return {stage: {"seconds": self.timings[stage], "calls": self.counts[stage],
+                        "avg_us": self.timings[stage] / self.counts[stage] * 1e6 if self.counts[stage] else 0.0}
+                for stage in STAGES}
+
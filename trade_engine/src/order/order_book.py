@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from ib_insync import OrderStatus, Trade
+
+
+# 미체결(취소 가능) 주문 상태
+OPEN_STATUSES = set(OrderStatus.ActiveStates)
+
+
+class OrderBook:
+    """세션 주문(ib_insync Trade) 인덱스 - permId/orderId, 심볼, 상태별 조회
+
+    ib.trades() 전체를 매번 훑는 대신 주문 이벤트(newOrder/openOrder/orderStatus)로
+    인덱스를 갱신해 단건 조회는 O(1), 심볼/상태별 조회와 일괄 취소는 O(k) 로 처리한다.
+    """
+
+    def __init__(self):
+        self._trades: Dict[int, Trade] = {}          # id(trade) → trade
+        self._by_order_id: Dict[int, int] = {}
+        self._by_perm_id: Dict[int, int] = {}
+        self._by_symbol: Dict[str, Set[int]] = {}
+        self._by_status: Dict[str, Set[int]] = {}
+        self._status: Dict[int, str] = {}
+
+    def __len__(self):
+        return len(self._trades)
+
+    def attach(self, ib):
+        """IB 이벤트에 연결하고 이미 있는 주문을 인덱싱"""
+        for trade in ib.trades():
+            self.update(trade)
+        ib.newOrderEvent += self.update
+        ib.openOrderEvent += self.update
+        ib.orderStatusEvent += self.update
+
+    def detach(self, ib):
+        ib.newOrderEvent -= self.update
+        ib.openOrderEvent -= self.update
+        ib.orderStatusEvent -= self.update
+
+    def update(self, trade: Trade):
+        """주문 추가 또는 permId/상태 인덱스 갱신"""
+        key = id(trade)
+        if key not in self._trades:
+            self._trades[key] = trade
+            self._by_symbol.setdefault(trade.contract.symbol, set()).add(key)
+        if trade.order.orderId:
+            self._by_order_id[trade.order.orderId] = key
+        if trade.order.permId:
+            self._by_perm_id[trade.order.permId] = key
+
+        status = trade.orderStatus.status
+        previous = self._status.get(key)
+        if status != previous:
+            if previous is not None:
+                self._by_status[previous].discard(key)
+            self._by_status.setdefault(status, set()).add(key)
+            self._status[key] = status
+
+    def get(self, order_id) -> Optional[Trade]:
+        """permId 우선, 없으면 orderId 로 조회 (문자열 id 허용)"""
+        try:
+            order_id = int(order_id)
+        except (TypeError, ValueError):
+            return None
+        key = self._by_perm_id.get(order_id)
+        if key is None:
+            key = self._by_order_id.get(order_id)
+        return self._trades.get(key) if key is not None else None
+
+    def by_symbol(self, symbol: str) -> List[Trade]:
+        return [self._trades[key] for key in self._by_symbol.get(symbol, ())]
+
+    def by_status(self, statuses: Iterable[str], symbol: Optional[str] = None) -> List[Trade]:
+        """상태별 주문 - symbol 을 주면 심볼 인덱스와 교집합"""
+        keys: Set[int] = set()
+        for status in statuses:
+            keys |= self._by_status.get(status, set())
+        if symbol is not None:
+            keys &= self._by_symbol.get(symbol, set())
+        return [self._trades[key] for key in keys]
+
+    def open_trades(self, symbol: Optional[str] = None) -> List[Trade]:
+        return self.by_status(OPEN_STATUSES, symbol)
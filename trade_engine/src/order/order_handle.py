@@ -0,0 +1,167 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ib_insync import Trade
+
+
+# 더 이상 상태가 바뀌지 않는 주문 상태 (Inactive: 거절/비활성)
+DONE_STATUSES = {"Filled", "Cancelled", "ApiCancelled", "Inactive"}
+# 브로커 접수 전 상태
+UNACKED_STATUSES = {"PendingSubmit", "ApiPending"}
+
+
+class OrderHandle:
+    """전송된 주문 핸들 - 주문 직후 바로 반환되고 체결/상태 변화는 이벤트로 갱신
+
+    - add_listener(callback) : callback(handle, event) 등록 (event: "status" | "fill")
+    - await wait(timeout)    : 주문 종료(체결/취소/거절)까지 대기, 시간 초과 시 False
+    - await wait_ack(timeout): 브로커 접수(PreSubmitted/Submitted 등)까지 대기
+    """
+
+    def __init__(self, order_id, symbol: str, side: str, quantity: float,
+                 order_type: str = "market", price: Optional[float] = None, tag: Optional[str] = None):
+        self.order_id = order_id
+        self.perm_id = None
+        self.symbol = symbol
+        self.side = side
+        self.quantity = quantity
+        self.order_type = order_type
+        self.price = price
+        self.tag = tag
+
+        self.status = "PendingSubmit"
+        self.filled = 0.0
+        self.avg_fill_price: Optional[float] = None
+        self.last_fill_quantity = 0.0
+        self.fills: List[Tuple[float, float]] = []  # (체결 수량, 체결가)
+        self.trade: Optional[Trade] = None
+        self._listeners: List[Callable] = []
+        self._done: Optional[asyncio.Event] = None
+        self._acked: Optional[asyncio.Event] = None
+
+    @property
+    def remaining(self) -> float:
+        return self.quantity - self.filled
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in DONE_STATUSES
+
+    @property
+    def is_acknowledged(self) -> bool:
+        return self.status not in UNACKED_STATUSES
+
+    @property
+    def is_filled(self) -> bool:
+        return self.status == "Filled"
+
+    def add_listener(self, callback: Callable):
+        self._listeners.append(callback)
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """주문 종료까지 대기 - 종료되면 True, timeout 초과 시 False"""
+        if self.is_done:
+            return True
+        if self._done is None:
+            self._done = asyncio.Event()
+        return await _wait_event(self._done, timeout)
+
+    async def wait_ack(self, timeout: Optional[float] = None) -> bool:
+        """브로커 접수까지 대기 - 접수되면 True, timeout 초과 시 False"""
+        if self.is_acknowledged:
+            return True
+        if self._acked is None:
+            self._acked = asyncio.Event()
+        return await _wait_event(self._acked, timeout)
+
+    # ───── 상태 갱신 (브로커 이벤트에서 호출) ─────
+    def set_status(self, status: str, filled: Optional[float] = None, avg_fill_price: Optional[float] = None):
+        self.status = status
+        if filled is not None:
+            # 체결 이벤트와 상태 이벤트 중 먼저 온 쪽 기준 (누적 수량)
+            self.filled = max(self.filled, filled)
+        if avg_fill_price:
+            self.avg_fill_price = avg_fill_price
+        self._emit("status")
+        if self.is_acknowledged and self._acked is not None:
+            self._acked.set()
+        if self.is_done and self._done is not None:
+            self._done.set()
+
+    def add_fill(self, quantity: float, price: float):
+        """부분 체결 반영 - 평균 체결가 누적"""
+        self.fills.append((quantity, price))
+        total = sum(q for q, _ in self.fills)
+        self.avg_fill_price = sum(q * p for q, p in self.fills) / total
+        self.filled = max(self.filled, total)
+        self.last_fill_quantity = quantity
+        self._emit("fill")
+
+    def _emit(self, event: str):
+        for callback in self._listeners:
+            try:
+                callback(self, event)
+            except Exception as e:
+                print(f"order_handle.listener ({self.symbol}): {e}")
+
+    def to_dict(self) -> Dict:
+        """send_order() 반환 형식"""
+        return {
+            "order_id": self.perm_id or self.order_id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "quantity": self.quantity,
+            "price": self.avg_fill_price,
+            "status": self.status.lower(),
+            "filled": self.filled,
+            "remaining": self.remaining,
+            "tag": self.tag
+        }
+
+    def __repr__(self):
+        return (f"OrderHandle({self.order_id}, {self.symbol}, {self.side} {self.filled}/{self.quantity}, "
+                f"{self.status})")
+
+    # ───── 생성 ─────
+    @classmethod
+    def from_trade(cls, trade: Trade, side: str, order_type: str = "market",
+                   price: Optional[float] = None, tag: Optional[str] = None) -> "OrderHandle":
+        """ib_insync Trade 이벤트(statusEvent/fillEvent)에 연결된 핸들"""
+        handle = cls(trade.order.orderId, trade.contract.symbol, side, trade.order.totalQuantity,
+                     order_type, price, tag)
+        handle.trade = trade
+
+        def on_status(t: Trade):
+            handle.perm_id = t.order.permId or handle.perm_id
+            handle.set_status(t.orderStatus.status, t.orderStatus.filled, t.orderStatus.avgFillPrice)
+
+        def on_fill(t: Trade, fill):
+            handle.perm_id = t.order.permId or handle.perm_id
+            handle.add_fill(fill.execution.shares, fill.execution.price)
+
+        trade.statusEvent += on_status
+        trade.fillEvent += on_fill
+        handle.perm_id = trade.order.permId or None
+        handle.status = trade.orderStatus.status or handle.status
+        return handle
+
+    @classmethod
+    def from_result(cls, result: Dict, order_type: str = "market") -> "OrderHandle":
+        """send_order() 결과 dict 로 만든 (이미 처리된) 핸들 - 이벤트가 없는 브로커용"""
+        handle = cls(result.get("order_id"), result.get("symbol"), result.get("side"),
+                     result.get("quantity", 0.0), order_type, result.get("price"), result.get("tag"))
+        status = (result.get("status") or "").lower()
+        handle.status = {"filled": "Filled", "cancelled": "Cancelled",
+                         "submitted": "Submitted"}.get(status, "Inactive")
+        if handle.is_filled:
+            handle.filled = handle.quantity
+            handle.avg_fill_price = result.get("price")
+        return handle
+
+
+async def _wait_event(event: asyncio.Event, timeout: Optional[float]) -> bool:
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
@@ -1,22 +1,47 @@
-from typing import Optional, Dict
+import asyncio
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Set
 from src.order.broker_interface import BrokerInterface
+from src.order.order_handle import OrderHandle
 from ib_insync import Contract
 import logging
 
 logger = logging.getLogger("OrderManager")
 
 
+@dataclass
+class OrderRequest:
+    """일괄 전송용 주문 요청"""
+    contract: Contract
+    side: str
+    quantity: float
+    order_type: str = "market"
+    price: Optional[float] = None
+    tag: Optional[str] = None
+
+
 class OrderManager:
 
     def __init__(self, broker: BrokerInterface):
         self.broker = broker
         self.symbol_positions: Dict[str, float] = {}
+        self.pending_orders: Dict[str, List[OrderHandle]] = {}  # 심볼별 미종료 주문
+        self._protective: Set[int] = set()  # 브래킷 손절/익절 자식 주문 id(handle) - 진입 수량 계산에서 제외
+        self._applied: Dict[int, float] = {}  # id(handle) → 포지션에 반영한 누적 체결 수량
 
     def handle_signal(self, contract: Contract, signal: str, quantity: float, order_type: str = "market",
-                      price: Optional[float] = None, tag: Optional[str] = None):
+                      price: Optional[float] = None, tag: Optional[str] = None) -> Optional[OrderHandle]:
+        """시그널을 주문으로 변환해 전송 - 체결을 기다리지 않고 주문 핸들(없으면 None) 반환
+
+        포지션은 체결된 수량 + 미체결 주문의 남은 수량으로 판단하므로, 주문이 체결되기 전에
+        같은 시그널이 반복되어도 중복 주문을 내지 않는다.
+        """
 
         symbol = contract.symbol
-        current_pos = self.get_position_size(contract)
+        pending = self.pending_quantity(symbol)
+        current_pos = self.get_position_size(contract) + pending
+        if pending:
+            logger.info(f"[{symbol}] 미체결 주문 {pending:+g} 포함 포지션 {current_pos:+g} 기준으로 판단")
 
         if signal == "buy":
             if current_pos > 0:
@@ -24,10 +49,10 @@ class OrderManager:
                 return
             elif current_pos < 0:
                 logger.info(f"[{symbol}] 숏 청산 후 롱 진입")
-                self._send_order(contract, "buy", abs(current_pos) + quantity, order_type, price, tag)
+                return self._send_order(contract, "buy", abs(current_pos) + quantity, order_type, price, tag)
             else:
                 logger.info(f"[{symbol}] 신규 롱 진입")
-                self._send_order(contract, "buy", quantity, order_type, price, tag)
+                return self._send_order(contract, "buy", quantity, order_type, price, tag)
 
         elif signal == "sell":
             if current_pos < 0:
@@ -35,23 +60,24 @@ class OrderManager:
                 return
             elif current_pos > 0:
                 logger.info(f"[{symbol}] 롱 청산 후 숏 진입")
-                self._send_order(contract, "sell", abs(current_pos) + quantity, order_type, price, tag)
+                return self._send_order(contract, "sell", abs(current_pos) + quantity, order_type, price, tag)
             else:
                 logger.info(f"[{symbol}] 신규 숏 진입")
-                self._send_order(contract, "sell", quantity, order_type, price, tag)
+                return self._send_order(contract, "sell", quantity, order_type, price, tag)
 
         elif signal == "exit":
             # 주식 등 롱만 진입하고 exit 신호에 롱 청산
             if current_pos > 0:
                 logger.info(f"[{symbol}] 롱 포지션 청산")
-                self._send_order(contract, "sell", current_pos, order_type, price, tag)
+                return self._send_order(contract, "sell", current_pos, order_type, price, tag)
             elif current_pos < 0:
                 logger.info(f"[{symbol}] 숏 포지션 청산")
-                self._send_order(contract, "buy", abs(current_pos), order_type, price, tag)
+                return self._send_order(contract, "buy", abs(current_pos), order_type, price, tag)
 
     def _send_order(self, contract: Contract, side: str, quantity: float, order_type: str,
-                    price: Optional[float], tag: Optional[str] ):
-        order = self.broker.send_order(
+                    price: Optional[float], tag: Optional[str] ) -> OrderHandle:
+        # 체결을 기다리지 않고 바로 반환 - 체결/상태는 핸들 이벤트로 반영
+        handle = self.broker.submit_order(
             contract=contract,
             side=side,
             quantity=quantity,
@@ -59,20 +85,111 @@ class OrderManager:
             price=price,
             tag=tag
         )
-
-        symbol = contract.symbol
-        if order.get("status") == "filled":
-            logger.info(f"[{symbol}] 주문 체결 완료: {order}")
-        elif order.get("status") == "submitted":
-            logger.info(f"[{symbol}] 주문 제출됨: {order}")
+        return self._track(handle)
+
+    def _track(self, handle: OrderHandle) -> OrderHandle:
+        """핸들 이벤트 구독 및 미종료 주문 등록"""
+        handle.add_listener(self._on_order_event)
+        logger.info(f"[{handle.symbol}] 주문 제출됨: {handle}")
+
+        # 리스너 등록 전에 이미 일어난 체결(즉시 체결/이벤트 없는 브로커) 반영
+        self._applied[id(handle)] = 0.0
+        self._sync_fill(handle)
+        if handle.is_done:
+            self._applied.pop(id(handle), None)
+            self._log_done(handle)
         else:
-            logger.warning(f"[{symbol}] 주문 실패 또는 거절: {order}")
-
-        self._update_position(contract)
+            self.pending_orders.setdefault(handle.symbol, []).append(handle)
+        return handle
+
+    def submit_batch(self, requests: List[OrderRequest]) -> List[OrderHandle]:
+        """주문 여러 건을 체결/포지션 조회 대기 없이 한 번에 전송"""
+        return [self._send_order(r.contract, r.side, r.quantity, r.order_type, r.price, r.tag)
+                for r in requests]
+
+    async def submit_batch_async(self, requests: List[OrderRequest],
+                                 ack_timeout: Optional[float] = 5.0) -> List[OrderHandle]:
+        """submit_batch 후 모든 주문의 브로커 접수를 동시에 대기"""
+        handles = self.submit_batch(requests)
+        acked = await asyncio.gather(*(h.wait_ack(ack_timeout) for h in handles))
+        for handle, ok in zip(handles, acked):
+            if not ok:
+                logger.warning(f"[{handle.symbol}] 주문 접수 확인 시간 초과: {handle}")
+        return handles
+
+    def submit_bracket(self, contract: Contract, side: str, quantity: float,
+                       stop_loss: Optional[float] = None, take_profit: Optional[float] = None,
+                       order_type: str = "market", price: Optional[float] = None,
+                       tag: Optional[str] = None) -> List[OrderHandle]:
+        """진입 주문 + 손절/익절 자식 주문을 한 번에 전송 → [진입, 익절, 손절] 핸들"""
+        handles = self.broker.submit_bracket(contract, side, quantity, order_type, price,
+                                             stop_loss=stop_loss, take_profit=take_profit, tag=tag)
+        for child in handles[1:]:
+            self._protective.add(id(child))
+        return [self._track(handle) for handle in handles]
+
+    def pending_quantity(self, symbol: str) -> float:
+        """미종료 진입/청산 주문의 남은 수량 합 (매수 +, 매도 -) - 브래킷 자식 주문 제외"""
+        total = 0.0
+        for handle in self.pending_orders.get(symbol, ()):
+            if handle.is_done or id(handle) in self._protective:
+                continue
+            # handle.remaining 은 체결 이벤트 전에 상태 이벤트로 줄어들 수 있으므로 반영한 수량 기준
+            remaining = handle.quantity - self._applied.get(id(handle), 0.0)
+            total += remaining if handle.side == "buy" else -remaining
+        return total
+
+    def _on_order_event(self, handle: OrderHandle, event: str):
+        quantity = self._sync_fill(handle)
+        if quantity:
+            logger.info(f"[{handle.symbol}] 체결 {quantity} @ {handle.avg_fill_price} "
+                        f"({handle.filled}/{handle.quantity})")
+        if handle.is_done:
+            pending = self.pending_orders.get(handle.symbol, [])
+            if handle in pending:
+                pending.remove(handle)
+                self._protective.discard(id(handle))
+                self._applied.pop(id(handle), None)
+                self._log_done(handle)
+
+    def _sync_fill(self, handle: OrderHandle) -> float:
+        """핸들의 누적 체결 수량 중 아직 포지션에 반영하지 않은 만큼 반영 → 반영한 수량"""
+        applied = self._applied.get(id(handle))
+        if applied is None:
+            # 이미 종료 처리된 핸들
+            return 0.0
+        quantity = handle.filled - applied
+        if quantity <= 0:
+            return 0.0
+        self._applied[id(handle)] = handle.filled
+        signed = quantity if handle.side == "buy" else -quantity
+        self.symbol_positions[handle.symbol] = self.symbol_positions.get(handle.symbol, 0.0) + signed
+        return quantity
+
+    @staticmethod
+    def _log_done(handle: OrderHandle):
+        if handle.is_filled:
+            logger.info(f"[{handle.symbol}] 주문 체결 완료: {handle.to_dict()}")
+        else:
+            logger.warning(f"[{handle.symbol}] 주문 실패 또는 거절: {handle.to_dict()}")
+
+    async def wait_orders(self, handles: Optional[List[OrderHandle]] = None,
+                          timeout: Optional[float] = None) -> bool:
+        """주문들이 모두 종료될 때까지 대기 (기본: 미종료 주문 전체) - timeout 초과 시 False"""
+        if handles is None:
+            handles = [h for pending in self.pending_orders.values() for h in pending]
+        if not handles:
+            return True
+        results = await asyncio.gather(*(h.wait(timeout) for h in handles))
+        return all(results)
 
     def get_position_size(self, contract: Contract) -> float:
-        pos = self.broker.get_position(contract)
-        return pos.get("size", 0.0)
+        """메모리 포지션 조회 - 처음 보는 심볼만 브로커에서 1회 조회 후 체결 이벤트로 갱신"""
+        size = self.symbol_positions.get(contract.symbol)
+        if size is None:
+            size = self.broker.get_position(contract).get("size", 0.0)
+            self.symbol_positions[contract.symbol] = size
+        return size
 
     def _update_position(self, contract: Contract):
         pos = self.broker.get_position(contract)
@@ -83,10 +200,19 @@ class OrderManager:
             pos = self.broker.get_position(contract)
             self.symbol_positions[contract.symbol] = pos.get("size", 0.0)
 
-    def close_all_positions(self, contract_list):
+    def reconcile_positions(self) -> Dict[str, float]:
+        """브로커 포지션으로 메모리 캐시 교체 (이벤트 누락 의심 시/주기적으로 호출)"""
+        positions = self.broker.reconcile_positions()
+        self.symbol_positions = {symbol: pos.get("size", 0.0) for symbol, pos in positions.items()}
+        return self.symbol_positions
+
+    def close_all_positions(self, contract_list) -> List[OrderHandle]:
+        """보유 포지션 전체를 시장가 일괄 주문으로 청산"""
+        requests = []
         for contract in contract_list:
             size = self.symbol_positions.get(contract.symbol, 0.0)
             if size > 0:
-                self._send_order(contract, "sell", size, order_type="market", price=None, tag="close_all")
+                requests.append(OrderRequest(contract, "sell", size, tag="close_all"))
             elif size < 0:
-                self._send_order(contract, "buy", abs(size), order_type="market", price=None, tag="close_all")
+                requests.append(OrderRequest(contract, "buy", abs(size), tag="close_all"))
+        return self.submit_batch(requests)
@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.order.runner import Runner
+
+
+@dataclass
+class BacktestJob:
+    """워커 1회 실행 단위 - 심볼 x 전략 x 방향 (x 파라미터)"""
+    symbol: str
+    strategy_cls: type
+    direction: str = "both"
+    params: Dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        suffix = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.symbol}|{self.strategy_cls.__name__}|{self.direction}" + (f"|{suffix}" if suffix else "")
+
+
+class SharedPriceBlock:
+    """심볼별 종가/인덱스를 공유 메모리 2개(float64, int64)에 연속 배치
+
+    워커는 이름으로 attach 하여 DataFrame 피클링 없이 배열을 그대로 읽는다.
+    """
+
+    def __init__(self, prices: Dict[str, pd.Series]):
+        self.layout: Dict[str, Tuple[int, int, Optional[str], bool]] = {}
+        self._segments: List[shared_memory.SharedMemory] = []
+        try:
+            self._fill(prices)
+        except BaseException:
+            # 생성 도중 실패하면 이미 만든 공유 메모리가 남지 않도록 정리
+            self.close()
+            raise
+
+    def _fill(self, prices: Dict[str, pd.Series]):
+        total = sum(len(s) for s in prices.values())
+        self._values = self._create(max(total, 1) * 8)
+        self._index = self._create(max(total, 1) * 8)
+        values = np.ndarray((total,), dtype=np.float64, buffer=self._values.buf)
+        index = np.ndarray((total,), dtype=np.int64, buffer=self._index.buf)
+
+        offset = 0
+        for symbol, series in prices.items():
+            n = len(series)
+            values[offset:offset + n] = series.to_numpy(dtype=float)
+            is_time = isinstance(series.index, pd.DatetimeIndex)
+            if is_time:
+                index[offset:offset + n] = series.index.as_unit("ns").asi8
+                tz = str(series.index.tz) if series.index.tz is not None else None
+            else:
+                index[offset:offset + n] = np.arange(n)
+                tz = None
+            self.layout[symbol] = (offset, n, tz, is_time)
+            offset += n
+        del values, index
+
+    def _create(self, size: int) -> shared_memory.SharedMemory:
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        self._segments.append(shm)
+        return shm
+
+    def spec(self) -> Dict:
+        return {"values": self._values.name, "index": self._index.name, "layout": self.layout}
+
+    def close(self):
+        while self._segments:
+            shm = self._segments.pop()
+            shm.close()
+            shm.unlink()
+
+
+# 워커 프로세스별 attach 상태 (initializer 에서 1회 설정)
+_WORKER_BLOCK: Dict = {}
+
+
+def _init_worker(spec: Dict):
+    for key in ("values", "index"):
+        # 소유/unlink 는 부모 프로세스 담당 (워커는 attach 만)
+        _WORKER_BLOCK[key] = shared_memory.SharedMemory(name=spec[key])
+    _WORKER_BLOCK["layout"] = spec["layout"]
+
+
+def _shared_series(symbol: str, name: str) -> pd.Series:
+    offset, n, tz, is_time = _WORKER_BLOCK["layout"][symbol]
+    values = np.ndarray((n,), dtype=np.float64, buffer=_WORKER_BLOCK["values"].buf, offset=offset * 8)
+    raw_index = np.ndarray((n,), dtype=np.int64, buffer=_WORKER_BLOCK["index"].buf, offset=offset * 8)
+    if is_time:
+        index = pd.DatetimeIndex(raw_index.view("M8[ns]"))
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+    else:
+        index = pd.RangeIndex(n)
+    return pd.Series(values, index=index, name=name, copy=False)
+
+
+def _run_job(job: BacktestJob, return_portfolio: bool):
+    price = _shared_series(job.symbol, job.key)
+    strategy = job.strategy_cls(price, direction=job.direction, **job.params)
+    strategy.run()
+    runner = Runner(strategy)
+    entries, exits, direction = runner.run_back_signal()
+    pf = runner.analyze_portfolio(entries, exits, direction)
+    return job.key, pf.stats(), (pf if return_portfolio else None)
+
+
+def run_parallel_backtest(prices: Dict[str, pd.Series], jobs: List[BacktestJob],
+                          max_workers: Optional[int] = None, return_portfolios: bool = False):
+    """잡 목록을 프로세스 풀로 분산 실행
+
+    잡이 하나라도 실패하면 남은 잡을 취소하고 RuntimeError 로 알린다 (원인 예외는 __cause__).
+    return_portfolios=True 이면 Portfolio 전체를 워커에서 피클링해 받아오므로 잡이 많으면 느리고 메모리를 많이 쓴다.
+
+    :return: (key -> Portfolio (return_portfolios=False 이면 빈 dict), key 별 stats 를 열로 합친 DataFrame)
+    """
+    if not jobs:
+        return {}, pd.DataFrame()
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+
+    block = SharedPriceBlock({symbol: prices[symbol] for symbol in {job.symbol for job in jobs}})
+    portfolios, stats = {}, {}
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(block.spec(),)) as pool:
+            futures = {pool.submit(_run_job, job, return_portfolios): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    key, job_stats, pf = future.result()
+                except Exception as e:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise RuntimeError(f"[Backtest] {job.key} 실패: {e}") from e
+                stats[key] = job_stats
+                if pf is not None:
+                    portfolios[key] = pf
+    finally:
+        block.close()
+
+    order = [job.key for job in jobs if job.key in stats]
+    return {key: portfolios[key] for key in order if key in portfolios}, pd.DataFrame({key: stats[key] for key in order})
+
+
+def merge_portfolios(portfolios: Dict[str, object]):
+    """run_parallel_backtest(return_portfolios=True) 의 잡별 Portfolio 를 열 방향으로 합친 단일 Portfolio
+
+    열 이름은 잡 key (워커가 가격 Series 이름으로 사용), 인덱스는 합집합으로 정렬된다.
+    """
+    if not portfolios:
+        raise ValueError("합칠 Portfolio 가 없습니다 - return_portfolios=True 로 실행해야 합니다.")
+    import vectorbtpro as vbt
+    return vbt.Portfolio.column_stack(*portfolios.values())
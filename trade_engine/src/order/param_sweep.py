@@ -0,0 +1,67 @@
+from itertools import product
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.order.runner import Runner
+from src.strategies.base_strategy import BaseStrategy
+
+
+SWEEP_METRICS = ("total_return", "sharpe_ratio", "max_drawdown", "trade_count")
+
+
+def window_grid(fast_windows: Iterable[int], slow_windows: Iterable[int]) -> List[Tuple[int, int]]:
+    """fast < slow 인 (fast_window, slow_window) 조합"""
+    return [(fast, slow) for fast, slow in product(fast_windows, slow_windows) if fast < slow]
+
+
+def rolling_means(price: pd.Series, windows: Iterable[int]) -> dict:
+    """필요한 window 별 이동평균을 한 번씩만 계산"""
+    return {w: price.rolling(w).mean().to_numpy() for w in sorted(set(windows))}
+
+
+def sweep_ma_windows(price: pd.Series, strategy_cls, fast_windows: Iterable[int], slow_windows: Iterable[int],
+                     direction: str = "both", metric: str = "sharpe_ratio", chunk_size: Optional[int] = None,
+                     **pf_kwargs) -> pd.DataFrame:
+    """fast/slow 이동평균 전략의 파라미터 그리드를 한 번의 브로드캐스트로 평가
+
+    조합별 객체를 만들지 않고 window 별 이동평균을 1회 계산한 뒤 (봉 x 조합) 2-D 시그널
+    행렬을 만들어 Runner.analyze_portfolio 에 열 단위 포트폴리오로 넘긴다.
+    chunk_size 를 주면 조합을 나눠 평가해 메모리 사용량을 제한한다.
+
+    :param strategy_cls: crossover_signals(fast_ma, slow_ma) 를 제공하는 전략 클래스
+    :return: (fast_window, slow_window) 인덱스, metric 내림차순으로 정렬된 지표 DataFrame
+    """
+    if metric not in SWEEP_METRICS:
+        raise ValueError(f"지원하지 않는 metric: {metric} ({', '.join(SWEEP_METRICS)})")
+
+    combos = window_grid(fast_windows, slow_windows)
+    if not combos:
+        return pd.DataFrame(columns=list(SWEEP_METRICS))
+
+    means = rolling_means(price, [w for combo in combos for w in combo])
+    runner = Runner(price=price)  # 시그널은 여기서 직접 만들므로 전략 인스턴스 없이 포트폴리오 분석만 사용
+    chunk_size = chunk_size or len(combos)
+
+    results = []
+    for i in range(0, len(combos), chunk_size):
+        chunk = combos[i:i + chunk_size]
+        columns = pd.MultiIndex.from_tuples(chunk, names=["fast_window", "slow_window"])
+        fast = np.column_stack([means[f] for f, _ in chunk])
+        slow = np.column_stack([means[s] for _, s in chunk])
+
+        signals = [pd.DataFrame(sig, index=price.index, columns=columns)
+                   for sig in strategy_cls.crossover_signals(fast, slow)]
+        entries, exits, pf_direction = BaseStrategy.combine_signals(direction, *signals)
+
+        pf = runner.analyze_portfolio(entries, exits, pf_direction, **pf_kwargs)
+        results.append(pd.DataFrame({
+            "total_return": pf.total_return,
+            "sharpe_ratio": pf.sharpe_ratio,
+            "max_drawdown": pf.max_drawdown,
+            "trade_count": pf.trades.count(),
+        }))
+
+    # vectorbt 의 max_drawdown 은 음수이므로 모든 지표가 클수록 좋다
+    return pd.concat(results).sort_values(metric, ascending=False)
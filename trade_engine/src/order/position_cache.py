@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from ib_insync import Fill, Position, Trade
+
+
+PositionKey = Tuple[str, int]  # (account, conId)
+
+
+class PositionCache:
+    """계좌/계약(conId)별 포지션 메모리 캐시 - 포지션/체결 이벤트로 갱신
+
+    - positionEvent : IBKR 가 보내는 절대 포지션(수량, 평균가)으로 덮어쓰고 그 계약의 체결 누적분을 비움
+    - execDetailsEvent : 포지션 업데이트가 오기 전 체결 수량을 즉시 반영 (execId 중복 제거)
+    시각 비교 없이 이벤트 순서로만 맞춘다. IBKR 는 체결마다 포지션 업데이트를 보내므로
+    스냅샷 뒤에 도착한 체결은 임시로 더해 두고 다음 스냅샷의 절대 수량으로 교체된다.
+    conId/심볼 인덱스로 조회하며, 이벤트 누락이 의심되면 reconcile() 로 IBKR 와 다시 맞춘다.
+    """
+
+    def __init__(self):
+        self._positions: Dict[PositionKey, Dict] = {}
+        self._by_con_id: Dict[int, Set[PositionKey]] = {}
+        self._by_symbol: Dict[str, Set[PositionKey]] = {}
+        self._exec_ids: Dict[PositionKey, Set[str]] = {}  # 마지막 스냅샷 이후 반영한 체결 execId
+
+    def attach(self, ib):
+        for pos in ib.positions():
+            self.on_position(pos)
+        ib.positionEvent += self.on_position
+        ib.execDetailsEvent += self.on_execution
+
+    def detach(self, ib):
+        ib.positionEvent -= self.on_position
+        ib.execDetailsEvent -= self.on_execution
+
+    def on_position(self, pos: Position):
+        key = (pos.account, pos.contract.conId)
+        entry = self._entry(key, pos.contract.symbol)
+        # 먼저 도착한 체결은 스냅샷에 포함되어 있으므로 임시로 더한 수량은 절대 수량으로 교체
+        entry["size"] = pos.position
+        entry["avg_price"] = pos.avgCost
+        self._exec_ids.pop(key, None)
+
+    def on_execution(self, trade: Trade, fill: Fill):
+        execution = fill.execution
+        key = (execution.acctNumber, fill.contract.conId)
+        exec_ids = self._exec_ids.setdefault(key, set())
+        if execution.execId in exec_ids:
+            return
+        exec_ids.add(execution.execId)
+        signed = execution.shares if execution.side == "BOT" else -execution.shares
+        self._entry(key, fill.contract.symbol)["size"] += signed
+
+    def _entry(self, key: PositionKey, symbol: str) -> Dict:
+        entry = self._positions.get(key)
+        if entry is None:
+            entry = self._positions[key] = {"symbol": symbol, "size": 0.0, "avg_price": 0.0}
+            self._by_con_id.setdefault(key[1], set()).add(key)
+            self._by_symbol.setdefault(symbol, set()).add(key)
+        return entry
+
+    def _entries(self, symbol: Optional[str] = None, con_id: Optional[int] = None) -> List[Dict]:
+        keys = self._by_con_id.get(con_id, ()) if con_id else self._by_symbol.get(symbol, ())
+        return [self._positions[key] for key in keys]
+
+    def get(self, symbol: Optional[str] = None, con_id: Optional[int] = None) -> Optional[Dict]:
+        """conId(우선) 또는 심볼의 포지션 - 여러 계좌/계약이면 수량 합, 평균가는 수량 가중"""
+        entries = self._entries(symbol, con_id)
+        if not entries:
+            return None
+        return _combine(entries)
+
+    def all(self) -> Dict[str, Dict]:
+        result = {}
+        for symbol in self._by_symbol:
+            entries = [entry for entry in self._entries(symbol) if entry["size"]]
+            if entries:
+                result[symbol] = _combine(entries)
+        return result
+
+    def reconcile(self, ib):
+        """reqPositions 로 IBKR 포지션을 다시 받아 캐시를 교체"""
+        ib.reqPositions()
+        self._positions.clear()
+        self._by_con_id.clear()
+        self._by_symbol.clear()
+        self._exec_ids.clear()
+        for pos in ib.positions():
+            self.on_position(pos)
+
+
+def _combine(entries: List[Dict]) -> Dict:
+    size = sum(entry["size"] for entry in entries)
+    if len(entries) == 1 or not size:
+        avg_price = entries[0]["avg_price"] if len(entries) == 1 else 0.0
+    else:
+        avg_price = sum(entry["avg_price"] * entry["size"] for entry in entries) / size
+    return {"size": size, "avg_price": avg_price}
@@ -0,0 +1,71 @@
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from ib_insync import Contract
+
+from src.order.broker_sim import SimBroker
+from src.order.live_pipeline import LivePipeline
+
+
+class ReplayEngine:
+    """저장된 과거 봉을 실시간 경로(LivePipeline → OrderManager → SimBroker)로 최대 속도 재생
+
+    모든 심볼의 봉을 timestamp 순으로 병합해 1개씩 흘려보내며, 각 봉마다
+    SimBroker 시세/시뮬레이션 시계를 먼저 갱신(미체결 주문 체결)한 뒤 pipeline.on_source_bar 를 호출한다.
+    실거래 전에 실시간 경로의 결과 검증과 처리량(bars/sec, 단계별 시간) 측정에 사용한다.
+    """
+
+    def __init__(self, pipeline: LivePipeline, broker: SimBroker):
+        self.pipeline = pipeline
+        self.broker = broker
+
+    def run(self, bars: Dict[str, pd.DataFrame], contracts: Optional[Dict[str, Contract]] = None) -> Dict:
+        """
+        :param bars: 심볼별 봉 DataFrame (timestamp, open, high, low, close, volume)
+        :param contracts: 심볼별 Contract (없으면 pipeline.add_symbol 에 준 contract 사용)
+        :return: 처리 봉 수, 소요 시간, bars_per_sec, 단계별 시간, 시그널/주문 수, 계좌 정보
+        """
+        contracts = contracts or {}
+        frames = [df.assign(_symbol=i) for i, df in enumerate(bars.values()) if len(df)]
+        symbols = list(bars)
+        if not frames:
+            return {"bars": 0, "elapsed": 0.0, "bars_per_sec": 0.0}
+
+        # 심볼 간 시간순 병합 (같은 시각은 심볼 순서 유지)
+        merged = pd.concat(frames, ignore_index=True)
+        merged = merged.sort_values("timestamp", kind="mergesort")
+        ts_ns = merged["timestamp"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        columns = [ts_ns.tolist(), merged["_symbol"].tolist()] + \
+                  [merged[c].to_numpy(dtype=float).tolist() for c in ("open", "high", "low", "close", "volume")]
+
+        pipeline, broker = self.pipeline, self.broker
+        contract_of = [contracts.get(s) or pipeline.runners[s]["contract"] for s in symbols]
+        pipeline.reset_timings()
+        broker_seconds = 0.0
+
+        started = time.perf_counter()
+        for ts, idx, open_, high, low, close, volume in zip(*columns):
+            symbol = symbols[idx]
+            t0 = time.perf_counter()
+            broker.update_price(symbol, close, ts / 1e9)
+            broker_seconds += time.perf_counter() - t0
+            pipeline.on_source_bar(symbol, contract_of[idx], ts, open_, high, low, close, volume)
+
+        # 마지막 미완성 봉 처리
+        pipeline.flush(dict(zip(symbols, contract_of)))
+        elapsed = time.perf_counter() - started
+
+        stages = pipeline.stage_report()
+        stages["broker"] = {"seconds": broker_seconds, "calls": len(ts_ns),
+                            "avg_us": broker_seconds / len(ts_ns) * 1e6}
+        return {
+            "bars": len(ts_ns),
+            "elapsed": elapsed,
+            "bars_per_sec": len(ts_ns) / elapsed if elapsed else float("inf"),
+            "stages": stages,
+            "signals": pipeline.signals,
+            "orders": len(broker.orders),
+            "account": broker.get_account_info(),
+        }
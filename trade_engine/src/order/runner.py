@@ -1,12 +1,12 @@
-import vectorbtpro as vbt
 import pandas as pd
 
 
 class Runner:
 
-    def __init__(self, strategy):
+    def __init__(self, strategy=None, price: pd.Series = None):
+        """strategy 없이 price 만 주면 포트폴리오 분석(analyze_portfolio) 전용"""
         self.strategy = strategy
-        self.price = strategy.price
+        self.price = price if price is not None else strategy.price
 
     def run_back_signal(self):
         entries, exits, direction = self.strategy.get_signals()
@@ -14,19 +14,27 @@ class Runner:
 
     def run_live_signal(self, new_price: pd.Series):
         self.strategy.update_price(new_price)
+        self.strategy.run()
         entries, exits, direction = self.strategy.get_signals()
         return entries, exits, direction
 
+    def run_live_bar(self, new_price: float, timestamp=None):
+        """증분 전략 전용 - 새 봉 1개로 O(1) 시그널 갱신, (entry, exit, direction) 스칼라 반환"""
+        return self.strategy.on_bar(new_price, timestamp)
+
     def analyze_portfolio(self, entries, exits, direction, **kwargs):
         print('이후에 portfolio 옵션관련함수추가.')
+        import vectorbtpro as vbt  # import 비용이 커서 포트폴리오 분석 시점에 로드
+        fees = kwargs.pop('fees', 0.0)  # **kwargs 와 중복 전달되지 않도록 꺼낸다
+        slippage = kwargs.pop('slippage', 0.0)
         return vbt.Portfolio.from_signals(
             close=self.price,
             entries=entries,
             exits=exits,
             direction=direction,
+            fees=fees,
+            slippage=slippage,
             **kwargs,
-            fees=kwargs.get('fees', 0.0),
-            slippage=kwargs.get('slippage', 0.0),
         )
 
 
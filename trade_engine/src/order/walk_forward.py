@@ -0,0 +1,141 @@
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.config import config
+from src.order.param_sweep import sweep_ma_windows
+from src.order.runner import Runner
+
+
+def walk_forward_windows(n: int, train_bars: int, test_bars: int,
+                         step: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """(train_start, test_start, test_end) 위치 목록 - train 은 [train_start, test_start), test 는 [test_start, test_end)
+
+    step < test_bars 이면 test 구간이 겹쳐 같은 봉의 수익률이 누적 자산에 여러 번 곱해지므로 거부한다.
+    """
+    step = step or test_bars
+    if step < test_bars:
+        raise ValueError(f"step({step}) 은 test_bars({test_bars}) 이상이어야 합니다 (test 구간 중복).")
+    windows = []
+    start = 0
+    while start + train_bars < n:
+        test_start = start + train_bars
+        windows.append((start, test_start, min(test_start + test_bars, n)))
+        start += step
+    return windows
+
+
+def _window_key(train: pd.Series, test: pd.Series, strategy_cls, fast_windows, slow_windows,
+                direction: str, metric: str, pf_kwargs: Dict) -> str:
+    """구간 데이터 + 설정 해시 - 데이터/설정이 바뀌지 않은 구간은 재실행 시 캐시 사용"""
+    digest = hashlib.sha256()
+    for series in (train, test):
+        digest.update(series.to_numpy(dtype=float).tobytes())
+        digest.update(np.asarray(series.index.asi8 if isinstance(series.index, pd.DatetimeIndex)
+                                 else series.index).tobytes())
+    config_repr = (strategy_cls.__module__, strategy_cls.__qualname__, tuple(fast_windows), tuple(slow_windows),
+                   direction, metric, sorted(pf_kwargs.items()))
+    digest.update(repr(config_repr).encode())
+    return digest.hexdigest()
+
+
+def _run_window(train: pd.Series, test: pd.Series, strategy_cls, fast_windows, slow_windows,
+                direction: str, metric: str, pf_kwargs: Dict) -> Dict:
+    """train 구간 파라미터 스윕 → 최적 파라미터로 test 구간 out-of-sample 평가"""
+    sweep = sweep_ma_windows(train, strategy_cls, fast_windows, slow_windows, direction=direction,
+                             metric=metric, **pf_kwargs)
+    fast_window, slow_window = (int(w) for w in sweep.index[0])
+
+    # 이동평균 계산을 위해 train 끝부분을 앞에 붙여 시그널을 만든 뒤 test 구간만 평가
+    extended = pd.concat([train.iloc[-slow_window:], test])
+    strategy = strategy_cls(extended, fast_window=fast_window, slow_window=slow_window, direction=direction)
+    strategy.run()
+    runner = Runner(strategy)
+    entries, exits, pf_direction = runner.run_back_signal()
+    runner.price = test
+    pf = runner.analyze_portfolio(entries.loc[test.index], exits.loc[test.index], pf_direction, **pf_kwargs)
+
+    return {
+        "fast_window": fast_window,
+        "slow_window": slow_window,
+        "train_" + metric: float(sweep[metric].iloc[0]),
+        "test_total_return": float(pf.total_return),
+        "test_sharpe_ratio": float(pf.sharpe_ratio),
+        "returns": pf.returns,
+    }
+
+
+def walk_forward(price: pd.Series, strategy_cls, fast_windows: Iterable[int], slow_windows: Iterable[int],
+                 train_bars: int, test_bars: int, step: Optional[int] = None, direction: str = "both",
+                 metric: str = "sharpe_ratio", max_workers: Optional[int] = None,
+                 cache_dir: Union[str, Path, None] = None, use_cache: bool = True, **pf_kwargs):
+    """워크포워드 최적화 - train 구간 스윕으로 고른 파라미터를 다음 test 구간에 적용
+
+    구간들은 프로세스 풀에서 병렬로 실행하고, 구간 결과는 cache_dir 에 데이터/설정 해시로
+    저장해 재실행 시 바뀌지 않은 구간은 건너뛴다. test 구간마다 포지션 없이 시작한다.
+    구간이 하나라도 실패하면 RuntimeError 로 알린다 (원인 예외는 __cause__).
+
+    :return: (구간별 결과 DataFrame, 이어 붙인 out-of-sample 수익률 Series, 누적 자산 곡선 Series)
+    """
+    fast_windows, slow_windows = list(fast_windows), list(slow_windows)
+    windows = walk_forward_windows(len(price), train_bars, test_bars, step)
+    if not windows:
+        return pd.DataFrame(), pd.Series(dtype=float), pd.Series(dtype=float)
+
+    cache = Path(cache_dir or config.WALK_FORWARD_CACHE_DIR)
+    results: Dict[int, Dict] = {}
+    pending = {}
+    for i, (train_start, test_start, test_end) in enumerate(windows):
+        train, test = price.iloc[train_start:test_start], price.iloc[test_start:test_end]
+        key = _window_key(train, test, strategy_cls, fast_windows, slow_windows, direction, metric, pf_kwargs)
+        path = cache / f"{key}.pkl"
+        if use_cache and path.exists():
+            with open(path, "rb") as f:
+                results[i] = {**pickle.load(f), "cached": True}
+        else:
+            pending[i] = (path, (train, test, strategy_cls, fast_windows, slow_windows, direction, metric, pf_kwargs))
+
+    if pending:
+        max_workers = max_workers or min(len(pending), os.cpu_count() or 1)
+        cache.mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_run_window, *args): (i, path) for i, (path, args) in pending.items()}
+            for future in as_completed(futures):
+                i, path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # 빠진 구간을 건너뛰고 이어 붙이면 누적 자산이 왜곡되므로 중단 (완료된 구간은 캐시에 남음)
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise RuntimeError(f"[WalkForward] 구간 {i} 실패: {e}") from e
+                _write_cache(path, result)
+                results[i] = {**result, "cached": False}
+
+    rows, returns = [], []
+    for i, (train_start, test_start, test_end) in enumerate(windows):
+        result = dict(results[i])
+        returns.append(result.pop("returns"))
+        rows.append({"train_start": price.index[train_start], "test_start": price.index[test_start],
+                     "test_end": price.index[test_end - 1], **result})
+
+    oos_returns = pd.concat(returns) if returns else pd.Series(dtype=float)
+    equity = (1 + oos_returns).cumprod()
+    return pd.DataFrame(rows), oos_returns, equity
+
+
+def _write_cache(path: Path, result: Dict):
+    """임시 파일에 쓴 뒤 교체 - 중단되거나 동시에 실행돼도 깨진 캐시 파일이 남지 않음"""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
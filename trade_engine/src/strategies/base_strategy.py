@@ -1,42 +1,179 @@
 # from abc import ABC, abstractmethod
+from typing import List, Optional, Union
+import numpy as np
 import pandas as pd
+from src.data.ring_buffer import PriceStore
+from src.strategies.indicator_graph import INCREMENTAL, VECTORIZED, IndicatorGraph, SharedIndicator
+from src.strategies.indicators import Indicator
 
 
 class BaseStrategy:
 
-    def __init__(self, price: pd.Series, direction: str = "both"):
+    # True 인 전략은 setup_indicators()/compute_bar_signals() 를 구현하고
+    # 실시간 모드에서 on_bar() 로 봉 1개당 O(1) 시그널을 갱신한다.
+    # 지표 갱신은 전략이 하지 않는다 - 전용 지표는 on_bar() 가, 공유 지표는 IndicatorGraph.update() 가 담당하고
+    # 전략은 compute_bar_signals() 에서 지표의 .value 만 읽는다.
+    incremental = False
+
+    def __init__(self, price: pd.Series, direction: str = "both", graph: Optional[IndicatorGraph] = None):
+        self.store: Optional[PriceStore] = None
+        self._stale = False  # store 에 봉이 추가된 뒤 아직 Series 로 만들지 않음
         self.price = price
+        self.graph = graph  # 같은 심볼 전략끼리 공유하는 지표 그래프 (없으면 전략별 계산)
         self.direction = direction.lower()
         self.long_entry = pd.Series(False, index=price.index)
         self.long_exit = pd.Series(False, index=price.index)
         self.short_entry = pd.Series(False, index=price.index)
         self.short_exit = pd.Series(False, index=price.index)
+        self.bar_signals = {"long_entry": False, "long_exit": False,
+                            "short_entry": False, "short_exit": False}
+        self._indicators: List[Indicator] = []  # 그래프 없이 전략이 소유한 증분 지표 (on_bar 가 갱신)
+        # 증분 지표는 실시간 경로에서 처음 필요할 때(prepare_live/on_bar) 초기화 - 벡터 백테스트는 비용 없음
+        self.live_ready = False
+
+    @property
+    def price(self) -> pd.Series:
+        """가격 Series - store 사용 시 봉이 추가된 뒤 처음 읽을 때만 링 버퍼에서 만든다"""
+        if self._stale:
+            self._price = self.store.to_series("close")  # 복사본 - 이후 append 가 이미 반환한 Series 를 바꾸지 않음
+            self._stale = False
+        return self._price
+
+    @price.setter
+    def price(self, price: pd.Series):
+        self._price = price
+        self._stale = False
+
+    def price_window(self, n: Optional[int] = None) -> np.ndarray:
+        """최근 n 봉 종가 배열 - store 사용 시 복사 없는 읽기 전용 뷰(다음 봉 추가 전까지만 유효)"""
+        if self.store is not None:
+            return self.store.window("close", n)
+        values = self._price.to_numpy()
+        return values if n is None else values[max(len(values) - n, 0):]
 
     def generate_signals(self):
         pass
 
+    def rolling(self, kind: str, window: int, **params) -> pd.Series:
+        """벡터 지표 - 그래프와 같은 가격을 보고 있으면 공유 결과(읽기 전용), 아니면 직접 계산"""
+        if self.graph is not None and self.graph.price is self.price:
+            return self.graph.rolling(kind, window, **params)
+        return VECTORIZED[kind](self.price, window, **params)
+
+    def indicator(self, kind: str, window: int, **params) -> Union[Indicator, SharedIndicator]:
+        """증분 지표 - 그래프가 있으면 공유 지표(갱신은 graph.update() 가 담당), 아니면 on_bar() 가 갱신하는 전용 지표"""
+        if self.graph is not None:
+            return self.graph.indicator(kind, window, **params)
+        indicator = INCREMENTAL[kind](window, **params)
+        self._indicators.append(indicator)
+        return indicator
+
     def run(self):
         self.generate_signals()
 
     def get_signals(self) -> tuple:
-        if self.direction == "long":
-            entries = self.long_entry
-            exits = self.long_exit
+        return self.combine_signals(self.direction, self.long_entry, self.long_exit,
+                                    self.short_entry, self.short_exit)
+
+    @staticmethod
+    def combine_signals(direction: str, long_entry, long_exit, short_entry, short_exit) -> tuple:
+        """방향별 (entries, exits, direction) 선택 - Series/DataFrame 공용"""
+        if direction == "long":
+            entries = long_entry
+            exits = long_exit
             direction = "long"
-        elif self.direction == "short":
-            entries = self.short_entry
-            exits = self.short_exit
+        elif direction == "short":
+            entries = short_entry
+            exits = short_exit
             direction = "short"
-        elif self.direction == "both":
-            entries = self.long_entry.combine_first(self.short_entry)
-            exits = self.long_exit.combine_first(self.short_exit)
+        elif direction == "both":
+            entries = long_entry.combine_first(short_entry)
+            exits = long_exit.combine_first(short_exit)
             direction = "both"
         else:
             raise ValueError("direction 은 'long', 'short', 'both' 중 하나 여야 합니다.")
 
         return entries, exits, direction
 
+    def use_price_store(self, capacity: int = 4096, retention: Optional[str] = "2h"):
+        """실시간 가격을 고정 용량 링 버퍼(PriceStore)에 유지 - 봉마다 concat/.last() 대신 제자리 추가"""
+        self.store = PriceStore(columns=("close",), capacity=capacity, retention=retention)
+        self.store.extend(self.price.iloc[-capacity:])
+        self._stale = True
+        return self.store
+
     def update_price(self, new_price: pd.Series):
         """실시간 가격 1봉 추가 및 유지"""
+        if self.store is not None:
+            # Series → DataFrame 변환 없이 봉 값을 바로 링 버퍼에 추가
+            for timestamp, value in zip(new_price.index, new_price.to_numpy(dtype=float)):
+                self.store.append(timestamp, close=value)
+            self._stale = True  # Series 는 price 를 읽을 때 1회만 생성 - 증분 전략은 만들지 않음
+            return
         self.price = pd.concat([self.price, new_price])
         self.price = self.price.last("2h")  # 롤링 유지 시간 조절 가능
+
+    # ───── 증분(incremental) 모드 ─────
+    def setup_indicators(self):
+        """증분 지표 객체 생성 (incremental 전략에서 구현)"""
+
+    def compute_bar_signals(self, price: float):
+        """지표가 새 봉까지 갱신된 뒤 호출 - 지표 .value 로 set_bar_signals() 호출 (incremental 전략에서 구현)"""
+        raise NotImplementedError(f"{type(self).__name__} 는 증분 모드를 지원하지 않습니다.")
+
+    def _advance_indicators(self, price: float):
+        for indicator in self._indicators:
+            indicator.update(price)
+
+    def prepare_live(self):
+        """증분 지표 생성 + 현재 self.price 로 warm-up (1회) - LivePipeline 등록 시 또는 첫 on_bar 에서 호출"""
+        if self.live_ready or not self.incremental:
+            return
+        self.setup_indicators()
+        self.warm_up(self.price)
+        self.live_ready = True
+
+    def warm_up(self, price: pd.Series):
+        """과거 가격으로 증분 지표 상태 초기화 (1회, O(n))"""
+        values = price.to_numpy(dtype=float)
+        if self.graph is None:
+            for value in values:
+                self._advance_indicators(value)
+        # 공유 지표는 그래프가 이미 초기화 - 어느 경우든 마지막 봉 시그널만 계산
+        if len(values):
+            self.compute_bar_signals(values[-1])
+
+    def set_bar_signals(self, long_entry: bool, long_exit: bool,
+                        short_entry: bool = False, short_exit: bool = False):
+        signals = self.bar_signals
+        signals["long_entry"] = bool(long_entry)
+        signals["long_exit"] = bool(long_exit)
+        signals["short_entry"] = bool(short_entry)
+        signals["short_exit"] = bool(short_exit)
+
+    def get_bar_signals(self) -> tuple:
+        """마지막 봉의 (entry, exit, direction) - get_signals() 와 같은 방향 규칙"""
+        signals = self.bar_signals
+        if self.direction == "long":
+            return signals["long_entry"], signals["long_exit"], "long"
+        elif self.direction == "short":
+            return signals["short_entry"], signals["short_exit"], "short"
+        elif self.direction == "both":
+            # get_signals() 의 combine_first 와 동일하게 롱 시그널 우선
+            return signals["long_entry"], signals["long_exit"], "both"
+        raise ValueError("direction 은 'long', 'short', 'both' 중 하나 여야 합니다.")
+
+    def on_bar(self, price: float, timestamp=None) -> tuple:
+        """실시간 1봉 처리 - Series 재생성 없이 지표/시그널 갱신"""
+        if not self.live_ready:
+            self.prepare_live()
+        if self.graph is not None and self.graph.last() != price:
+            # 공유 지표가 이전 봉 값이면 시그널이 조용히 한 봉씩 밀리므로 거부
+            raise ValueError(f"{type(self).__name__}: 공유 지표 그래프가 이 봉({price})으로 갱신되지 않았습니다 "
+                             f"- on_bar() 전에 graph.update() 를 호출해야 합니다.")
+        if self.store is not None and timestamp is not None:
+            self.store.append(timestamp, close=price)
+            self._stale = True
+        self._advance_indicators(price)
+        self.compute_bar_signals(price)
+        return self.get_bar_signals()
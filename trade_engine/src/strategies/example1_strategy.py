@@ -1,23 +1,41 @@
+from typing import Optional
 import pandas as pd
 from src.strategies.base_strategy import BaseStrategy
+from src.strategies.indicator_graph import IndicatorGraph
 
 
 class Example1Strategy(BaseStrategy):
-    def __init__(self, price: pd.Series, fast_window: int = 10, slow_window: int = 20, direction: str = "both"):
-        super().__init__(price, direction)
+    incremental = True
+
+    def __init__(self, price: pd.Series, fast_window: int = 10, slow_window: int = 20, direction: str = "both",
+                 graph: Optional[IndicatorGraph] = None):
         self.fast_window = fast_window
         self.slow_window = slow_window
+        super().__init__(price, direction, graph)
+
+    @staticmethod
+    def crossover_signals(fast_ma, slow_ma) -> tuple:
+        """(long_entry, long_exit, short_entry, short_exit) - Series/ndarray(2-D 포함) 공용"""
+        return (fast_ma > slow_ma), (fast_ma < slow_ma), (fast_ma < slow_ma), (fast_ma > slow_ma)
 
     def generate_signals(self):
-        fast_ma = self.price.rolling(self.fast_window).mean()
-        slow_ma = self.price.rolling(self.slow_window).mean()
+        fast_ma = self.rolling("mean", self.fast_window)
+        slow_ma = self.rolling("mean", self.slow_window)
+        long_entry, long_exit, short_entry, short_exit = self.crossover_signals(fast_ma, slow_ma)
 
         if self.direction == "long":
-            self.long_entry = (fast_ma > slow_ma)
-            self.long_exit = (fast_ma < slow_ma)
+            self.long_entry = long_entry
+            self.long_exit = long_exit
 
         elif self.direction == "both":
-            self.long_entry = (fast_ma > slow_ma)
-            self.long_exit = (fast_ma < slow_ma)
-            self.short_entry = (fast_ma < slow_ma)
-            self.short_exit = (fast_ma > slow_ma)
+            self.long_entry = long_entry
+            self.long_exit = long_exit
+            self.short_entry = short_entry
+            self.short_exit = short_exit
+
+    def setup_indicators(self):
+        self.fast_ma = self.indicator("mean", self.fast_window)
+        self.slow_ma = self.indicator("mean", self.slow_window)
+
+    def compute_bar_signals(self, price: float):
+        self.set_bar_signals(*self.crossover_signals(self.fast_ma.value, self.slow_ma.value))
@@ -0,0 +1,156 @@
+import math
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, Optional, Tuple, Union
+
+import pandas as pd
+
+from src.strategies.indicators import EMA, Indicator, RollingMax, RollingMean, RollingMin, RollingStd, RollingSum
+
+
+# 증분 지표 클래스
+INCREMENTAL: Dict[str, Callable[..., Indicator]] = {
+    "mean": RollingMean,
+    "sum": RollingSum,
+    "std": RollingStd,
+    "min": RollingMin,
+    "max": RollingMax,
+    "ema": EMA,
+}
+
+# 벡터 지표 (증분 지표와 같은 결과)
+VECTORIZED: Dict[str, Callable[..., pd.Series]] = {
+    "mean": lambda s, window: s.rolling(window).mean(),
+    "sum": lambda s, window: s.rolling(window).sum(),
+    "std": lambda s, window, ddof=1: s.rolling(window).std(ddof=ddof),
+    "min": lambda s, window: s.rolling(window).min(),
+    "max": lambda s, window: s.rolling(window).max(),
+    "ema": lambda s, window: s.ewm(span=window, adjust=False).mean(),
+}
+
+IndicatorKey = Tuple[str, str, int, Tuple]
+
+
+class SharedIndicator:
+    """그래프가 소유한 증분 지표의 읽기 전용 핸들
+
+    값 갱신은 IndicatorGraph.update() 가 봉마다 1회 수행하므로 update() 가 없다.
+    전략은 전용 지표와 똑같이 .value 로 현재 값을 읽는다.
+    """
+
+    __slots__ = ("_indicator",)
+
+    def __init__(self, indicator: Indicator):
+        self._indicator = indicator
+
+    @property
+    def value(self) -> float:
+        return self._indicator.value
+
+    @property
+    def ready(self) -> bool:
+        return self._indicator.ready
+
+    @property
+    def window(self) -> int:
+        return self._indicator.window
+
+    @property
+    def count(self) -> int:
+        return self._indicator.count
+
+
+class IndicatorGraph:
+    """심볼별 지표 공유 그래프 - 같은 (종류, 입력 컬럼, window, 파라미터) 요청은 한 번만 계산
+
+    - rolling(kind, window) : 벡터 지표를 가격 버전당 1회 계산하고 읽기 전용 Series 반환
+    - indicator(kind, window) : 증분 지표를 1개만 만들고 SharedIndicator 로 공유
+    - update(price) : 봉마다 1회 호출 - 모든 증분 지표를 한 번씩 갱신
+
+    같은 심볼의 전략 여러 개가 하나의 그래프를 공유하면 지표 비용은 전략 수와 무관해진다.
+
+    history: 늦게 등록되는 증분 지표의 warm-up 에 쓰는 최근 봉 수 (초기 가격 + update() 로 받은 봉).
+    update() 로 받은 봉은 이 길이의 deque 에만 보관하므로 실행 시간과 무관하게 메모리가 고정된다.
+    rolling 지표는 window <= history 이면 정확하고, EMA 는 history 봉으로 초기화한 근사값이다.
+    """
+
+    def __init__(self, price: Union[pd.Series, pd.DataFrame], column: str = "close", history: int = 4096):
+        self.column = column
+        self.price = price
+        self.history = history
+        self._version = 0
+        self._series: Dict[IndicatorKey, Tuple[int, pd.Series]] = {}
+        self._nodes: Dict[IndicatorKey, Indicator] = {}
+        self._live: Deque[Union[float, Dict[str, float]]] = deque(maxlen=history)  # 최근 update() 봉
+        self.computed = 0      # 실제 계산 횟수 (중복 제거 확인용)
+        self.requested = 0
+
+    def _input(self, column: str) -> pd.Series:
+        if isinstance(self.price, pd.DataFrame):
+            return self.price[column]
+        return self.price
+
+    @staticmethod
+    def _key(kind: str, column: str, window: int, params: Dict[str, Hashable]) -> IndicatorKey:
+        return kind, column, int(window), tuple(sorted(params.items()))
+
+    def set_price(self, price: Union[pd.Series, pd.DataFrame]):
+        """입력 가격 교체 - 벡터 지표 캐시 무효화"""
+        self.price = price
+        self._version += 1
+
+    # ───── 벡터 모드 ─────
+    def rolling(self, kind: str, window: int, column: str = None, **params) -> pd.Series:
+        column = column or self.column
+        key = self._key(kind, column, window, params)
+        self.requested += 1
+        cached = self._series.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        values = VECTORIZED[kind](self._input(column), int(window), **params)
+        # 소비자 간 공유되는 결과이므로 쓰기 금지
+        values = pd.Series(values.to_numpy(copy=True), index=values.index, name=values.name)
+        values.to_numpy().flags.writeable = False
+        self._series[key] = (self._version, values)
+        self.computed += 1
+        return values
+
+    # ───── 증분 모드 ─────
+    def indicator(self, kind: str, window: int, column: str = None, **params) -> SharedIndicator:
+        column = column or self.column
+        key = self._key(kind, column, window, params)
+        self.requested += 1
+        node = self._nodes.get(key)
+        if node is None:
+            if int(window) > self.history:
+                raise ValueError(f"window({window}) 가 그래프 history({self.history}) 보다 큽니다.")
+            node = INCREMENTAL[kind](int(window), **params)
+            # 최근 history 봉(초기 가격 끝부분 + update() 로 받은 봉)으로 초기화 - 다른 지표와 같은 봉까지 진행
+            need = self.history - len(self._live)
+            if need > 0:
+                for value in self._input(column).to_numpy(dtype=float)[-need:]:
+                    node.update(value)
+            for price in self._live:
+                node.update(price[column] if isinstance(price, dict) else price)
+            self._nodes[key] = node
+            self.computed += 1
+        return SharedIndicator(node)
+
+    def last(self, column: str = None) -> Optional[float]:
+        """그래프가 마지막으로 받은 값 (update() 봉이 없으면 초기 가격의 마지막 값)"""
+        column = column or self.column
+        if self._live:
+            price = self._live[-1]
+            return price[column] if isinstance(price, dict) else price
+        values = self._input(column)
+        return float(values.iloc[-1]) if len(values) else None
+
+    def update(self, price: Union[float, Dict[str, float]]):
+        """새 봉 1개로 모든 증분 지표를 한 번씩 갱신 (price: 단일 값 또는 {컬럼: 값})"""
+        self._live.append(price)
+        for (_, column, _, _), node in self._nodes.items():
+            value = price[column] if isinstance(price, dict) else price
+            node.update(value)
+
+    def values(self) -> Dict[IndicatorKey, float]:
+        return {key: (node.value if node.count else math.nan) for key, node in self._nodes.items()}
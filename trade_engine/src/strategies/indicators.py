@@ -0,0 +1,157 @@
+import math
+from collections import deque
+
+
+class Indicator:
+    """증분 지표 기본 클래스 - update() 1회당 O(1) 로 현재 값을 갱신"""
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError(f"window 는 1 이상이어야 합니다: {window}")
+        self.window = window
+        self.value = math.nan
+        self.count = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.window
+
+    def update(self, x: float) -> float:
+        raise NotImplementedError
+
+    def reset(self):
+        self.value = math.nan
+        self.count = 0
+
+
+class RollingSum(Indicator):
+    """rolling(window).sum() 과 동일한 결과를 누적합으로 유지"""
+
+    def __init__(self, window: int):
+        super().__init__(window)
+        self._buf = deque(maxlen=window)
+        self._sum = 0.0
+
+    def update(self, x: float) -> float:
+        if len(self._buf) == self.window:
+            self._sum -= self._buf[0]
+        self._buf.append(x)
+        self._sum += x
+        self.count += 1
+        # 부동소수점 누적 오차 방지 - window 마다 재계산 (분할상환 O(1))
+        if self.count % self.window == 0:
+            self._sum = math.fsum(self._buf)
+        self.value = self._sum if self.ready else math.nan
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._buf.clear()
+        self._sum = 0.0
+
+
+class RollingMean(RollingSum):
+    """rolling(window).mean()"""
+
+    def update(self, x: float) -> float:
+        total = super().update(x)
+        self.value = total / self.window if self.ready else math.nan
+        return self.value
+
+
+class RollingStd(Indicator):
+    """rolling(window).std(ddof) - 합/제곱합 기반"""
+
+    def __init__(self, window: int, ddof: int = 1):
+        super().__init__(window)
+        self.ddof = ddof
+        self._buf = deque(maxlen=window)
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def update(self, x: float) -> float:
+        if len(self._buf) == self.window:
+            old = self._buf[0]
+            self._sum -= old
+            self._sum_sq -= old * old
+        self._buf.append(x)
+        self._sum += x
+        self._sum_sq += x * x
+        self.count += 1
+        if self.count % self.window == 0:
+            self._sum = math.fsum(self._buf)
+            self._sum_sq = math.fsum(v * v for v in self._buf)
+
+        n = self.window
+        if not self.ready or n - self.ddof <= 0:
+            self.value = math.nan
+            return self.value
+        var = (self._sum_sq - self._sum * self._sum / n) / (n - self.ddof)
+        self.value = math.sqrt(max(var, 0.0))
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._buf.clear()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+
+class _RollingExtreme(Indicator):
+    """단조 deque 로 구간 최솟값/최댓값 유지 (분할상환 O(1))"""
+
+    def __init__(self, window: int):
+        super().__init__(window)
+        self._deque = deque()  # (index, value)
+
+    def _dominates(self, new: float, old: float) -> bool:
+        raise NotImplementedError
+
+    def update(self, x: float) -> float:
+        idx = self.count
+        while self._deque and self._dominates(x, self._deque[-1][1]):
+            self._deque.pop()
+        self._deque.append((idx, x))
+        if self._deque[0][0] <= idx - self.window:
+            self._deque.popleft()
+        self.count += 1
+        self.value = self._deque[0][1] if self.ready else math.nan
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._deque.clear()
+
+
+class RollingMin(_RollingExtreme):
+    """rolling(window).min()"""
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new <= old
+
+
+class RollingMax(_RollingExtreme):
+    """rolling(window).max()"""
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new >= old
+
+
+class EMA(Indicator):
+    """ewm(span=window, adjust=False).mean() - 첫 값으로 초기화"""
+
+    def __init__(self, window: int):
+        super().__init__(window)
+        self.alpha = 2.0 / (window + 1)
+
+    @property
+    def ready(self) -> bool:
+        return self.count > 0
+
+    def update(self, x: float) -> float:
+        if self.count == 0:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        self.count += 1
+        return self.value
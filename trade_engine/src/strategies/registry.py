@@ -0,0 +1,123 @@
+import importlib
+import inspect
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+
+# 외부 패키지가 전략을 등록하는 entry point 그룹 (값: "module:Class")
+ENTRY_POINT_GROUP = "trade_engine.strategies"
+
+# 전략 생성자에서 파라미터 스키마로 노출하지 않는 인자
+_RESERVED_PARAMS = ("self", "price", "direction", "graph")
+
+
+@dataclass
+class StrategySpec:
+    """전략 등록 정보 - 클래스는 target("module:Class") 로만 들고 있다가 처음 사용할 때 import"""
+    name: str
+    target: str
+    description: str = ""
+    version: str = "1.0.0"
+
+
+class StrategyRegistry:
+    """이름 → 전략 클래스 지연 로딩 레지스트리
+
+    register() 는 모듈을 import 하지 않고 경로만 기록하며, get()/create() 첫 호출 시 import 후 캐시한다.
+    파라미터 스키마(생성자 시그니처 기반)도 전략별로 1회만 계산한다.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, StrategySpec] = {}
+        self._classes: Dict[str, type] = {}
+        self._schemas: Dict[str, Dict[str, Dict]] = {}
+        self._entry_points_loaded = False
+
+    def register(self, name: str, target: str, description: str = "", version: str = "1.0.0"):
+        self._specs[name] = StrategySpec(name, target, description, version)
+        self._classes.pop(name, None)
+        self._schemas.pop(name, None)
+
+    def load_entry_points(self):
+        """설치된 패키지의 trade_engine.strategies entry point 등록 (import 없음)"""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name not in self._specs:
+                self.register(entry_point.name, entry_point.value)
+
+    def names(self) -> List[str]:
+        self.load_entry_points()
+        return list(self._specs)
+
+    def spec(self, name: str) -> StrategySpec:
+        if name not in self._specs:
+            self.load_entry_points()
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 전략: {name} ({', '.join(self._specs)})") from None
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._classes
+
+    def get(self, name: str) -> type:
+        """전략 클래스 - 첫 호출 시에만 모듈 import"""
+        cls = self._classes.get(name)
+        if cls is None:
+            module_name, _, attr = self.spec(name).target.partition(":")
+            cls = getattr(importlib.import_module(module_name), attr)
+            self._classes[name] = cls
+        return cls
+
+    def schema(self, name: str) -> Dict[str, Dict]:
+        """생성자 파라미터 스키마 {param: {"default", "type"}} (캐시)"""
+        schema = self._schemas.get(name)
+        if schema is None:
+            schema = {}
+            for param in inspect.signature(self.get(name).__init__).parameters.values():
+                if param.name in _RESERVED_PARAMS or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                    continue
+                default = None if param.default is param.empty else param.default
+                annotation = param.annotation if param.annotation is not param.empty else type(default)
+                schema[param.name] = {"default": default,
+                                      "type": getattr(annotation, "__name__", str(annotation))}
+            self._schemas[name] = schema
+        return schema
+
+    def validate(self, name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """알 수 없는 파라미터 거부, 기본값과 같은 타입(int/float/bool)으로 변환"""
+        schema = self.schema(name)
+        validated = {}
+        for key, value in (params or {}).items():
+            if key not in schema:
+                raise ValueError(f"{name} 에 없는 파라미터: {key} ({', '.join(schema)})")
+            default = schema[key]["default"]
+            if isinstance(default, (bool, int, float)) and not isinstance(value, type(default)):
+                value = type(default)(value)
+            validated[key] = value
+        return validated
+
+    def create(self, name: str, price: pd.Series, direction: str = "both", graph=None, **params):
+        """이름으로 전략 인스턴스 생성 (graph: 같은 심볼 전략끼리 공유할 IndicatorGraph)"""
+        params = self.validate(name, params)
+        if graph is not None:
+            params["graph"] = graph
+        return self.get(name)(price, direction=direction, **params)
+
+    def describe(self, name: str) -> Dict[str, Any]:
+        """대시보드용 전략 정보 (이름, 설명, 버전, 기본 파라미터)"""
+        spec = self.spec(name)
+        return {"name": spec.name, "description": spec.description, "version": spec.version,
+                "parameters": {key: item["default"] for key, item in self.schema(name).items()}}
+
+
+strategy_registry = StrategyRegistry()
+strategy_registry.register("Example1Strategy", "src.strategies.example1_strategy:Example1Strategy",
+                           "예제 전략 1 - 이동평균 크로스오버 (fast > slow 롱)")
+strategy_registry.register("Example2Strategy", "src.strategies.example2_strategy:Example2Strategy",
+                           "예제 전략 2 - 이동평균 역추세 (fast < slow 롱)")
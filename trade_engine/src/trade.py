@@ -5,14 +5,23 @@ sys.path.append('/home/freeksj/Workspace_Rule/trade')
 from datetime import datetime, timedelta
 from typing import List
 from src.data.data_loader import IBKRData, target_symbols
+from src.data.bar_cache import BarCache
+from src.data.bar_store import BarStore
 from src.config import config
 from ib_insync import IB, util, Contract
 from src.data.connect_IBKR import ConnectIBKR
 from src.order.runner import Runner
-from src.strategies.example1_strategy import Example1Strategy
+from src.order.parallel_backtest import BacktestJob, merge_portfolios, run_parallel_backtest
+from src.order.walk_forward import walk_forward
+from src.strategies.indicator_graph import IndicatorGraph
+from src.strategies.registry import strategy_registry
 from src.order.order_manager import OrderManager
 from src.order.broker_IBKR import BrokerIBKR
+from src.order.broker_sim import SimBroker
+from src.order.live_pipeline import LivePipeline
+from src.order.replay import ReplayEngine
 import logging
+import pandas as pd
 
 # Setup basic logging
 logging.basicConfig(level=logging.INFO)
@@ -27,17 +36,39 @@ class Trade:
         self.stt_dt = self.end_dt - timedelta(days=7)
         self.interval = '1m'
         self.symbols = ['ES', 'NQ']
-        self.strategy_name = "ExampleStrategy"
+        self.strategy_name = "Example1Strategy"  # 레지스트리 이름, 백테스트는 쉼표로 여러 전략 지정 가능
+        self.directions = ["both"]
+        self.parallel = False       # True: 심볼 x 방향 조합을 프로세스 풀로 분산 백테스트
+        self.parallel_merge = False  # 병렬 백테스트 시 잡별 Portfolio 를 받아 하나로 합침 (피클링 비용 큼)
+        self.max_workers = None
+        self.replay_warmup = 200    # 리플레이 시 전략 초기화에 쓰는 앞쪽 봉 수
+        self.walk_forward = False   # True: 백테스트 대신 워크포워드 최적화
+        self.wf_train_bars = 2000
+        self.wf_test_bars = 500
+        self.wf_fast_windows = range(5, 30, 5)
+        self.wf_slow_windows = range(20, 120, 10)
 
         self.host = config.IBKR_HOST
         self.port = config.IBKR_PORT
         self.client_id = config.IBKR_CLIENT_ID
+        # IBKR 연결/브로커는 처음 사용할 때 생성 - 모듈 import 시 연결하지 않는다
         self.ibkr_conn = ConnectIBKR(self.host, self.port, self.client_id)
-        self.ib = self.ibkr_conn.get_client()
-
-        self.broker = BrokerIBKR(self.ib)
+        self._broker = None
         self.order_manager = None
 
+    @property
+    def ib(self) -> IB:
+        """IBKR 클라이언트 - 연결되어 있지 않으면 이 시점에 연결"""
+        if not self.ibkr_conn.is_connected():
+            self.ibkr_conn.connect()
+        return self.ibkr_conn.ib
+
+    @property
+    def broker(self) -> BrokerIBKR:
+        if self._broker is None:
+            self._broker = BrokerIBKR(self.ib)
+        return self._broker
+
     def reload(self, symbols: List[str], trade_mode: str, real_mode: str,
                stt_dt: datetime, end_dt: datetime, strategy: str):
         self.symbols = symbols
@@ -48,15 +79,24 @@ class Trade:
         self.strategy_name = strategy
         self.port = config.IBKR_PORT
         self.client_id = config.IBKR_CLIENT_ID
+        if self.ibkr_conn.is_connected():
+            self.ibkr_conn.ib.disconnect()
         self.ibkr_conn = ConnectIBKR(self.host, self.port, self.client_id)
-        self.ib = self.ibkr_conn.get_client()
-        self.broker = BrokerIBKR(self.ib)
+        self._broker = None
         self.run()
 
+    @property
+    def strategy_names(self) -> List[str]:
+        names = self.strategy_name if isinstance(self.strategy_name, (list, tuple)) else self.strategy_name.split(",")
+        return [name.strip() for name in names if name.strip()]
+
+    def strategy_cls(self):
+        """워크포워드에 쓰는 (첫 번째) 전략 클래스 - 처음 사용할 때 import"""
+        return strategy_registry.get(self.strategy_names[0])
+
     def run(self):
-        ibkr_data = IBKRData(self.ib)
+        ibkr_data = IBKRData(self.ib, cache=BarCache(config.BAR_CACHE_DIR), store=BarStore(config.BAR_STORE_DIR))
         contracts = target_symbols(self.symbols)
-        self.broker = BrokerIBKR(self.ib)
         # OrderManager 개발 중이므로 주석 처리 유지
         # self.order_manager = OrderManager(self.broker)
 
@@ -64,24 +104,75 @@ class Trade:
             return self.run_back_test(ibkr_data, contracts)
         elif self.trade_mode == "live":
             return self.run_live_trade(ibkr_data, contracts)
+        elif self.trade_mode == "replay":
+            return self.run_replay(ibkr_data, contracts)
 
         self.ib.run()
 
     def run_back_test(self, ibkr_data: IBKRData, contracts: List[Contract]):
         print(f"[Backtest] {self.symbols} | {self.stt_dt} ~ {self.end_dt} | interval: {self.interval}")
-        prices = ibkr_data.download(contracts, self.stt_dt, self.end_dt, self.interval)
-
+        # 저장소(BarStore)에 전 구간이 있는 계약은 memmap 으로 바로 사용 (다른 엔진 프로세스와 공유)
+        prices = ibkr_data.stored(contracts, self.stt_dt, self.end_dt, self.interval)
+        missing = [contract for contract in contracts if contract.symbol not in prices]
+        if missing:
+            # 나머지는 계약 x 청크 요청을 pacing 한도 내에서 동시에 다운로드
+            prices.update(self.ib.run(ibkr_data.download_async(missing, self.stt_dt, self.end_dt, self.interval)))
+
+        if self.parallel:
+            return self.run_parallel_back_test(prices)
+        if self.walk_forward:
+            return self.run_walk_forward(prices)
+
+        names = self.strategy_names
         results = {}
         for symbol, df in prices.items():
-            strategy = Example1Strategy(df["close"], direction="both")
-            strategy.run()
-            runner = Runner(strategy)
-            entries, exits, direction = runner.run_back_signal()
-            back_pf = runner.analyze_portfolio(entries, exits, direction)
+            # 같은 심볼의 전략들은 지표 그래프를 공유 - 같은 이동평균은 한 번만 계산
+            close = df.set_index("timestamp")["close"]
+            graph = IndicatorGraph(close)
+            for name in names:
+                strategy = strategy_registry.create(name, close, direction="both", graph=graph)
+                strategy.run()
+                runner = Runner(strategy)
+                entries, exits, direction = runner.run_back_signal()
+                back_pf = runner.analyze_portfolio(entries, exits, direction)
+
+                key = symbol if len(names) == 1 else f"{symbol}|{name}"
+                print(f"[{key}] Backtest 결과:")
+                print(back_pf.stats())
+                results[key] = back_pf
+
+        print(f"[Backtest] End")
+        return results
+
+    def run_parallel_back_test(self, prices):
+        strategy_classes = [strategy_registry.get(name) for name in self.strategy_names]
+        jobs = [BacktestJob(symbol, strategy_cls, direction)
+                for symbol in prices for strategy_cls in strategy_classes for direction in self.directions]
+        close = {symbol: df.set_index("timestamp")["close"] for symbol, df in prices.items()}
+        portfolios, stats = run_parallel_backtest(close, jobs, max_workers=self.max_workers,
+                                                  return_portfolios=self.parallel_merge)
+
+        print(f"[Backtest] {stats.shape[1]}/{len(jobs)} 잡 완료 (병렬)")
+        print(stats)
+        merged = None
+        if self.parallel_merge:
+            merged = merge_portfolios(portfolios)
+            print(f"[Backtest] 합친 Portfolio ({len(portfolios)} 열):")
+            print(merged.stats())
+        print(f"[Backtest] End")
+        return merged, stats
 
-            print(f"[{symbol}] Backtest 결과:")
-            print(back_pf.stats())
-            results[symbol] = back_pf
+    def run_walk_forward(self, prices):
+        results = {}
+        for symbol, df in prices.items():
+            windows, returns, equity = walk_forward(
+                df.set_index("timestamp")["close"], self.strategy_cls(), self.wf_fast_windows, self.wf_slow_windows,
+                self.wf_train_bars, self.wf_test_bars, max_workers=self.max_workers)
+            print(f"[{symbol}] Walk-forward 결과 ({len(windows)} 구간):")
+            print(windows)
+            if len(equity):
+                print(f"[{symbol}] Out-of-sample 누적 수익률: {equity.iloc[-1] - 1:.2%}")
+            results[symbol] = (windows, equity)
 
         print(f"[Backtest] End")
         return results
@@ -90,44 +181,62 @@ class Trade:
         print(f"[Live] {self.symbols} | {self.stt_dt} ~ {self.end_dt} | interval: {self.interval}")
         prices = ibkr_data.database(contracts, self.stt_dt, self.end_dt, self.interval)
 
-        runners = {}
-        for symbol, df in prices.items():
-            strategy = Example1Strategy(df["close"], direction="both")
-            strategy.run()
-            runner = Runner(strategy)
-            runners[symbol] = {"strategy": strategy, "runner": runner}
+        pipeline = LivePipeline(self.interval, source_seconds=5, order_manager=self.order_manager)
+        for contract in contracts:
+            df = prices.get(contract.symbol)
+            if df is None:
+                continue
+            self.add_live_strategies(pipeline, contract, df.set_index("timestamp")["close"])
 
         print("[LIVE MODE] 실시간 데이터 수신 시작...")
 
-        def on_stream(item_symbol, item_contract, item_df):
-            print('... ')
-            last_bar = item_df.iloc[-1]
-            price_series = item_df["close"].iloc[-1:]
-
-            item_runner = runners[item_symbol]["runner"]
-            entries, exits, direction = item_runner.run_live_signal(price_series)
-
-            # '외부에서 요청이 있을시'
-            # live_pf = runner.analyze_portfolio(entries, exits, direction)
-
-            signal = ""
-            if entries.iloc[-1]:
-                signal = "buy"
-            elif exits.iloc[-1]:
-                signal = "sell"
-            else:
-                signal = "hold"
-
-            if signal in ("buy", "sell"):
-                # OrderManager가 아직 개발되지 않았으므로 시그널만 출력
-                print(f"[{item_symbol}] {signal.upper()} SIGNAL 발생 (주문 처리 스킵 - OrderManager 미구현)")
-
-        ibkr_data.stream(contracts, on_stream)
+        # 모든 심볼을 하나의 이벤트 루프에서 구독 - 새 5초봉마다 심볼별 큐로 전달
+        try:
+            dropped = self.ib.run(ibkr_data.stream_live(contracts, pipeline.on_stream, on_timer=pipeline.on_time))
+            print(f"[Live] 큐 초과로 버린 봉: {dropped}")
+        except KeyboardInterrupt:
+            pass
+        pipeline.flush()  # 세션 종료 - 미완성 봉 처리
         print(f"[Live] End")
-        return runners
-
-
-tradeApp = Trade()
+        return pipeline.runners
+
+    def add_live_strategies(self, pipeline: LivePipeline, contract: Contract, close: pd.Series):
+        """심볼 1개에 strategy_names 전략들을 등록 - 같은 심볼 전략끼리 지표 그래프 공유"""
+        graph = IndicatorGraph(close)
+        for name in self.strategy_names:
+            strategy = strategy_registry.create(name, close, direction="both", graph=graph)
+            strategy.use_price_store(retention="2h")  # 봉마다 concat 대신 링 버퍼에 제자리 추가
+            strategy.run()
+            pipeline.add_symbol(contract.symbol, strategy, contract)
+
+    def run_replay(self, ibkr_data: IBKRData, contracts: List[Contract]):
+        """과거 봉을 실시간 경로(LivePipeline → OrderManager → SimBroker)로 재생해 검증/처리량 측정"""
+        print(f"[Replay] {self.symbols} | {self.stt_dt} ~ {self.end_dt} | interval: {self.interval}")
+        prices = self.ib.run(ibkr_data.download_async(contracts, self.stt_dt, self.end_dt, self.interval))
+
+        broker = SimBroker()
+        pipeline = LivePipeline(self.interval, source_seconds=int(pd.Timedelta(self.interval).total_seconds()),
+                                order_manager=OrderManager(broker))
+        bars = {}
+        for contract in contracts:
+            df = prices.get(contract.symbol)
+            if df is None or len(df) <= self.replay_warmup:
+                continue
+            # 앞쪽 replay_warmup 봉으로 전략 초기화, 나머지를 재생
+            warmup = df.iloc[:self.replay_warmup]
+            self.add_live_strategies(pipeline, contract, warmup.set_index("timestamp")["close"])
+            bars[contract.symbol] = df.iloc[self.replay_warmup:]
+
+        report = ReplayEngine(pipeline, broker).run(bars)
+        print(f"[Replay] {report['bars']} bars | {report['bars_per_sec']:,.0f} bars/sec | "
+              f"시그널 {report.get('signals', 0)} | 주문 {report.get('orders', 0)}")
+        for stage, timing in report.get("stages", {}).items():
+            print(f"  {stage:<10} {timing['seconds']:.4f}s ({timing['avg_us']:.1f}us x {timing['calls']})")
+        print(f"[Replay] End")
+        return report
+
+
+tradeApp = Trade()  # 연결은 run() 등에서 self.ib 를 처음 사용할 때
 
 if __name__ == "__main__":
     tradeApp.run()
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from src.data.bar_aggregator import TimeBarAggregator
+from src.data.resampler import time_bar
+from src.order.live_pipeline import LivePipeline
+from src.strategies.example1_strategy import Example1Strategy
+
+
+def make_source(n: int = 240, start: str = "2024-01-02 09:30", tz=None, seed: int = 0) -> pd.DataFrame:
+    """5초 실시간 봉 (time = 봉 시작 시각)"""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.1, n).cumsum()
+    spread = rng.random(n) * 0.1
+    return pd.DataFrame({"Open": close - 0.01, "High": close + spread, "Low": close - spread, "Close": close,
+                         "Volume": rng.integers(1, 50, n).astype(float)},
+                        index=pd.date_range(start, periods=n, freq="5s", tz=tz))
+
+
+def feed(aggregator: TimeBarAggregator, df: pd.DataFrame) -> list:
+    bars = []
+    for ts, row in df.iterrows():
+        bars += aggregator.update(ts, row["Open"], row["High"], row["Low"], row["Close"], row["Volume"])
+    return bars
+
+
+def test_aggregator_matches_time_bar():
+    """구간 마지막 소스 봉에서 즉시 종료 - time_bar 결과와 동일"""
+    df = make_source(tz="US/Eastern")
+    bars = feed(TimeBarAggregator("1min", 5), df)
+    expected = time_bar(df, "1min")
+    assert len(bars) == len(expected)
+    assert [bar.timestamp for bar in bars] == list(expected.index)
+    np.testing.assert_allclose([bar[1:] for bar in bars], expected.to_numpy())
+
+
+def test_aggregator_drops_late_bar_for_closed_interval():
+    df = make_source(24)
+    aggregator = TimeBarAggregator("1min", 5)
+    bars = feed(aggregator, df)
+    assert len(bars) == 2
+    # 이미 종료한 09:30 구간의 늦은 봉 - 같은 라벨 봉을 다시 내지 않음
+    assert aggregator.update(pd.Timestamp("2024-01-02 09:30:55"), 1, 1, 1, 1, 1) == []
+    assert not aggregator.has_open_bar
+
+
+def test_aggregator_on_time_and_flush():
+    """소스 봉이 끊기면 on_time 이 구간 끝 이후에만 미완성 봉을 종료"""
+    df = make_source(6)  # 09:30:00 ~ 09:30:25, 구간 미완성
+    aggregator = TimeBarAggregator("1min", 5)
+    assert feed(aggregator, df) == []
+    assert aggregator.on_time(pd.Timestamp("2024-01-02 09:30:59")) == []
+    bars = aggregator.on_time(pd.Timestamp("2024-01-02 09:31:00"))
+    assert len(bars) == 1 and bars[0].timestamp == pd.Timestamp("2024-01-02 09:30")
+    assert bars[0].volume == df["Volume"].sum() and bars[0].close == df["Close"].iloc[-1]
+    assert aggregator.on_time(pd.Timestamp("2024-01-02 09:32:00")) == []
+
+    feed(aggregator, make_source(3, start="2024-01-02 09:31"))
+    assert len(aggregator.flush()) == 1
+    assert aggregator.flush() == []
+
+
+def test_pipeline_on_time_and_flush_run_strategy():
+    """LivePipeline.on_time/flush 로 닫힌 봉도 전략을 실행"""
+    history = pd.Series(100 + np.arange(30, dtype=float) * 0.01,
+                        index=pd.date_range("2024-01-02 09:00", periods=30, freq="1min", tz="UTC"))
+    pipeline = LivePipeline(interval="1min", source_seconds=5)
+    pipeline.add_symbol("ES", Example1Strategy(history, fast_window=3, slow_window=5))
+
+    source = make_source(6, start="2024-01-02 09:30", tz="UTC")
+    for ts, row in source.iterrows():
+        pipeline.on_source_bar("ES", None, ts, row["Open"], row["High"], row["Low"], row["Close"], row["Volume"])
+    assert pipeline.counts["signal"] == 0
+
+    # 유예(grace) 시간 전에는 종료하지 않음
+    assert pipeline.on_time(pd.Timestamp("2024-01-02 09:31:03", tz="UTC")) == 0
+    assert pipeline.on_time(pd.Timestamp("2024-01-02 09:31:05", tz="UTC")) == 1
+    assert pipeline.counts["signal"] == 1
+
+    pipeline.on_source_bar("ES", None, pd.Timestamp("2024-01-02 09:31", tz="UTC"), 1, 1, 1, 1, 1)
+    assert pipeline.flush() == 1
+    assert pipeline.counts["signal"] == 2
+    assert pipeline.flush() == 0
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.bar_cache import BarCache
+
+
+def make_bars(start: str, n: int, tz=None) -> pd.DataFrame:
+    timestamp = pd.date_range(start, periods=n, freq="1h", tz=tz)
+    close = np.arange(n, dtype=float)
+    return pd.DataFrame({"timestamp": timestamp, "open": close, "high": close, "low": close, "close": close,
+                         "volume": np.ones(n)})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BarCache(tmp_path)
+
+
+def test_store_load_and_coverage(cache):
+    df = make_bars("2024-01-02 00:00", 48)
+    cache.store(1, "1h", df, datetime(2024, 1, 2), datetime(2024, 1, 3, 23))
+    assert cache.missing_ranges(1, "1h", datetime(2024, 1, 2), datetime(2024, 1, 3)) == []
+    gaps = cache.missing_ranges(1, "1h", datetime(2024, 1, 1), datetime(2024, 1, 5))
+    assert gaps == [(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02")),
+                    (pd.Timestamp("2024-01-03 23:00"), pd.Timestamp("2024-01-05"))]
+
+    loaded = cache.load(1, "1h", datetime(2024, 1, 2, 5), datetime(2024, 1, 3, 2))
+    assert loaded["close"].tolist() == list(range(5, 27))
+
+    # 같은 날짜 재저장 - 중복 시각은 새 값으로 교체
+    cache.store(1, "1h", make_bars("2024-01-02 05:00", 1).assign(close=99.0))
+    assert cache.load(1, "1h", datetime(2024, 1, 2, 5), datetime(2024, 1, 2, 5))["close"].tolist() == [99.0]
+
+
+def test_load_naive_bounds_against_tz_aware_bars(cache):
+    """IB 봉은 tz-aware, Trade 는 naive datetime.now() 경계 - naive 경계는 봉의 tz 시각으로 해석"""
+    df = make_bars("2024-01-02 00:00", 48, tz="US/Eastern")
+    cache.store(1, "1h", df)
+
+    loaded = cache.load(1, "1h", datetime(2024, 1, 2, 22), datetime(2024, 1, 3, 1))
+    assert loaded["close"].tolist() == [22.0, 23.0, 24.0, 25.0]
+    assert str(loaded["timestamp"].dt.tz) == "US/Eastern"
+
+    # tz 가 다른 경계 - 변환 후 비교 (UTC 03:00 = 동부 22:00 전날), 파티션 날짜가 달라도 포함
+    utc = cache.load(1, "1h", pd.Timestamp("2024-01-03 03:00", tz="UTC"), pd.Timestamp("2024-01-03 06:00", tz="UTC"))
+    assert utc["close"].tolist() == [22.0, 23.0, 24.0, 25.0]
+
+
+def test_load_empty(cache):
+    assert cache.load(1, "1h", datetime(2024, 1, 2), datetime(2024, 1, 3)).empty
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.data.bar_columns import merge_chunks
+
+
+def make_chunk(times, close, tz=None):
+    index = pd.DatetimeIndex(pd.to_datetime(times)).as_unit("ns")
+    if tz is not None:
+        index = index.tz_localize(tz)
+    close = np.asarray(close, dtype=float)
+    return {"date": index, "close": close, "barCount": np.arange(len(close), dtype=np.int64)}
+
+
+def expected(chunks, stt_dt, end_dt):
+    """pandas 기준 결과 - 이어 붙여 시각별 첫 봉만 남기고 구간 필터"""
+    df = pd.concat([pd.DataFrame(chunk) for chunk in chunks if chunk is not None])
+    df = df.sort_values("date", kind="stable").drop_duplicates("date", keep="first")
+    return df[(df["date"] >= stt_dt) & (df["date"] <= end_dt)]
+
+
+def test_merge_adjacent_chunks():
+    """경계에서만 겹치는 청크 - 중복 시각은 앞 청크 봉 유지, 구간 밖 제거"""
+    first = make_chunk(["2024-01-02 09:00", "2024-01-02 10:00", "2024-01-02 11:00"], [1, 2, 3])
+    second = make_chunk(["2024-01-02 11:00", "2024-01-02 12:00", "2024-01-02 13:00"], [30, 4, 5])
+    merged = merge_chunks([second, None, first], datetime(2024, 1, 2, 10), datetime(2024, 1, 2, 12))
+
+    assert list(merged["timestamp"]) == list(pd.to_datetime(["2024-01-02 10:00", "2024-01-02 11:00",
+                                                              "2024-01-02 12:00"]))
+    np.testing.assert_array_equal(merged["close"], [2, 3, 4])
+
+
+def test_merge_overlapping_chunks_keeps_gap_bars():
+    """뒤 청크가 앞 청크 구간 안에서 시작 - 앞 청크에 없는 봉도 유지"""
+    first = make_chunk(["2024-01-02 09:00", "2024-01-02 12:00"], [1, 4])  # 10, 11시 누락
+    second = make_chunk(["2024-01-02 10:00", "2024-01-02 11:00", "2024-01-02 12:00", "2024-01-02 13:00"],
+                        [2, 3, 40, 5])
+    stt_dt, end_dt = datetime(2024, 1, 2), datetime(2024, 1, 3)
+    merged = merge_chunks([second, first], stt_dt, end_dt)
+    want = expected([first, second], stt_dt, end_dt)
+
+    assert list(merged["timestamp"]) == list(want["date"])
+    np.testing.assert_array_equal(merged["close"], [1, 2, 3, 4, 5])
+    np.testing.assert_array_equal(merged["barCount"], want["barCount"].to_numpy())
+
+
+def test_merge_random_overlaps_match_pandas():
+    """임의 겹침/미정렬 청크 - pandas concat + 중복 제거 결과와 동일"""
+    rng = np.random.default_rng(0)
+    base = pd.date_range("2024-01-02", periods=200, freq="1min", tz="US/Eastern")
+    chunks = []
+    for _ in range(6):
+        start = rng.integers(0, 150)
+        picks = np.sort(rng.choice(np.arange(start, start + 50), size=30, replace=False))
+        times = base[picks]
+        if rng.random() < 0.3:
+            times = times[::-1]
+        chunks.append(make_chunk(times.tz_localize(None), rng.random(len(times)), tz="US/Eastern"))
+    # 같은 시각은 첫 시각이 이른 청크의 봉이 남으므로 기대값도 그 순서로 계산
+    chunks.sort(key=lambda chunk: chunk["date"].min())
+    stt_dt, end_dt = base[20].to_pydatetime(), base[180].to_pydatetime()
+
+    merged = merge_chunks(chunks, stt_dt, end_dt)
+    want = expected(chunks, stt_dt, end_dt)
+    assert list(merged["timestamp"]) == list(want["date"])
+    np.testing.assert_array_equal(merged["close"], want["close"].to_numpy())
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.bar_store import INDEX_STRIDE, BarStore
+
+
+def make_bars(n: int, start: str = "2024-01-02", freq: str = "1min", tz=None) -> pd.DataFrame:
+    timestamp = pd.date_range(start, periods=n, freq=freq, tz=tz)
+    close = np.arange(n, dtype=float)
+    return pd.DataFrame({"timestamp": timestamp, "open": close, "high": close + 1, "low": close - 1,
+                         "close": close, "volume": np.ones(n)})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BarStore(tmp_path)
+
+
+def test_append_and_range_search(store):
+    """append 후 구간 조회 - 블록 경계 포함 pandas 필터와 동일"""
+    df = make_bars(3 * INDEX_STRIDE + 17)
+    for i in range(0, len(df), 5000):
+        store.append(1, "1m", df.iloc[i:i + 5000 + 3])  # 청크 간 겹침
+    assert store.count(1, "1m") == len(df)
+
+    ts = df["timestamp"]
+    for lo, hi in [(0, 10), (INDEX_STRIDE, INDEX_STRIDE), (INDEX_STRIDE - 1, 2 * INDEX_STRIDE + 1),
+                   (len(df) - 5, len(df) - 1)]:
+        result = store.read(1, "1m", ts.iloc[lo], ts.iloc[hi])
+        np.testing.assert_array_equal(result["close"], df["close"].iloc[lo:hi + 1].to_numpy())
+    before = store.read(1, "1m", pd.Timestamp("2023-01-01"), pd.Timestamp("2023-12-31"))
+    assert len(before["close"]) == 0
+
+
+def test_read_is_zero_copy(store):
+    store.append(1, "1m", make_bars(100))
+    series = store.series(1, "1m")
+    assert isinstance(store.read(1, "1m")["close"], np.memmap)
+    assert not series.to_numpy().flags.writeable
+
+
+def test_backfill_merges_older_bars(store):
+    """새 구간을 먼저 저장한 뒤 이전 구간을 저장해도 버리지 않고 병합"""
+    df = make_bars(1000)
+    store.append(1, "1m", df.iloc[500:])
+    assert store.append(1, "1m", df.iloc[:500]) == 500
+    np.testing.assert_array_equal(store.read(1, "1m")["close"], df["close"].to_numpy())
+
+
+def test_gap_fill_and_coverage(store):
+    """1월 → 3월 저장 후 2월 채우기 - 커버리지로 빠진 구간 확인"""
+    jan = make_bars(10, "2024-01-02")
+    feb = make_bars(10, "2024-02-01")
+    mar = make_bars(10, "2024-03-01")
+    store.append(1, "1m", jan)
+    store.append(1, "1m", mar)
+    assert not store.covers(1, "1m", "2024-01-02", "2024-03-01 00:09")
+    assert len(store.missing_ranges(1, "1m", "2024-01-02", "2024-03-01 00:09")) == 1
+
+    store.append(1, "1m", feb, "2024-01-02 00:09", "2024-03-01")
+    assert store.covers(1, "1m", "2024-01-02", "2024-03-01 00:09")
+    times = store.read(1, "1m")["timestamp"]
+    assert len(times) == 30 and (np.diff(times.view(np.int64)) > 0).all()
+
+
+def test_overwrite_same_timestamp(store):
+    df = make_bars(10)
+    store.append(1, "1m", df)
+    fixed = df.iloc[3:5].assign(close=[-1.0, -2.0])
+    store.append(1, "1m", fixed)
+    np.testing.assert_array_equal(store.read(1, "1m")["close"][3:5], [-1.0, -2.0])
+    assert store.count(1, "1m") == 10
+
+
+def test_tz_round_trip(store):
+    """tz-aware 데이터는 같은 tz 로 돌려주고, naive 경계는 그 tz 시각으로 해석"""
+    df = make_bars(60, "2024-01-02 09:30", tz="US/Eastern")
+    store.append(1, "1m", df)
+    frame = store.frame(1, "1m", "2024-01-02 09:40", "2024-01-02 09:49")
+    assert str(frame["timestamp"].dt.tz) == "US/Eastern"
+    assert frame["timestamp"].iloc[0] == df["timestamp"].iloc[10]
+    assert len(frame) == 10
+
+
+def test_append_other_tz_keeps_stored_tz(store):
+    """같은 시점을 다른 tz 로 받아도 저장 tz 로 이어 붙임 - tz 없는/있는 데이터 혼합만 거부"""
+    store.append(1, "1m", make_bars(30, "2024-01-02 09:30", tz="US/Eastern"))
+    utc = make_bars(30, "2024-01-02 15:00", tz="UTC")  # 10:00 US/Eastern 부터
+    assert store.append(1, "1m", utc) == 30
+    frame = store.frame(1, "1m")
+    assert len(frame) == 60 and str(frame["timestamp"].dt.tz) == "US/Eastern"
+    assert frame["timestamp"].iloc[30] == utc["timestamp"].iloc[0]
+
+    with pytest.raises(ValueError):
+        store.append(1, "1m", make_bars(5, "2024-01-03"))
+
+
+def test_reader_retries_after_generation_switch(store, monkeypatch):
+    """meta.json 을 읽은 직후 세대가 바뀌어 이전 세대가 삭제돼도 빈 결과 대신 현재 세대를 읽음"""
+    store.append(1, "1m", make_bars(100, "2024-01-02 10:00"))
+    stale_meta = store.meta(1, "1m")
+    store.append(1, "1m", make_bars(10, "2024-01-02 09:00"))  # backfill → 새 세대, 이전 세대 삭제
+    assert store.meta(1, "1m")["generation"] == stale_meta["generation"] + 1
+
+    reader = BarStore(store.root)
+    meta = reader.meta
+    calls = []
+
+    def racing_meta(key, interval):
+        calls.append(key)
+        return dict(stale_meta) if len(calls) == 1 else meta(key, interval)
+
+    monkeypatch.setattr(reader, "meta", racing_meta)
+    assert len(reader.frame(1, "1m")) == 110
+
+
+def test_download_keeps_frame_when_store_tz_differs(store):
+    from ib_insync import Future
+    from src.data.data_loader import IBKRData, cache_key
+
+    contract = Future("ES", conId=495512563)
+    store.append(cache_key(contract), "1m", make_bars(10, "2024-01-02 09:30"))
+    data = IBKRData(None, store=store)
+    df = make_bars(10, "2024-01-03 09:30", tz="US/Eastern")
+    data._keep(contract, "1m", df, df["timestamp"].iloc[0], df["timestamp"].iloc[-1], complete=True)
+    assert len(store.frame(cache_key(contract), "1m")) == 10
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from utils import benchmarks
+
+
+@pytest.fixture
+def fake_benchmarks(monkeypatch):
+    """등록 목록을 가짜 벤치마크로 교체 - CLI/비교 로직만 빠르게 확인"""
+    monkeypatch.setattr(benchmarks, "BENCHMARKS", {})
+    monkeypatch.setattr(benchmarks, "DEFAULT_SIZES", {"fake.fast": 100})
+    calls = []
+
+    @benchmarks.register("fake.fast")
+    def bench_fast(size):
+        return lambda: calls.append(size)
+
+    @benchmarks.register("fake.skipped")
+    def bench_skipped(size):
+        raise benchmarks.SkipBenchmark("no dependency")
+
+    return calls
+
+
+def test_all_registered_benchmarks_run_at_small_scale():
+    """실제 벤치마크 setup 이 현재 코드와 어긋나지 않았는지 - 선택 의존성이 없으면 skip 으로 기록"""
+    result = benchmarks.run_benchmarks(repeat=1, scale=0.001)
+    assert set(result["results"]) == set(benchmarks.BENCHMARKS)
+    for name, item in result["results"].items():
+        assert "skipped" in item or item["median"] >= 0, name
+
+
+def test_cli_output_only_repeat_scale(fake_benchmarks, tmp_path):
+    output = tmp_path / "bench" / "result.json"
+    assert benchmarks.main(["--output", str(output), "--only", "fake", "--repeat", "3", "--scale", "0.5"]) == 0
+
+    result = json.loads(output.read_text(encoding="utf-8"))
+    assert result["meta"]["scale"] == 0.5
+    assert result["results"]["fake.fast"]["size"] == 50
+    assert result["results"]["fake.fast"]["repeat"] == 3
+    assert result["results"]["fake.skipped"] == {"skipped": "no dependency"}
+    assert fake_benchmarks == [50] * 4  # warmup 1 + repeat 3
+
+    assert benchmarks.main(["--output", str(output), "--only", "other"]) == 0
+    assert json.loads(output.read_text(encoding="utf-8"))["results"] == {}
+
+
+def test_cli_baseline_threshold(fake_benchmarks, tmp_path, monkeypatch):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"fake.fast": {"size": 100, "median": 1.0}}}), encoding="utf-8")
+    output = tmp_path / "current.json"
+
+    monkeypatch.setattr(benchmarks, "measure", lambda func, repeat: {"min": 1.1, "median": 1.1, "mean": 1.1,
+                                                                     "repeat": repeat})
+    assert benchmarks.main(["--baseline", str(baseline), "--threshold", "0.2", "--output", str(output)]) == 0
+    assert benchmarks.main(["--baseline", str(baseline), "--threshold", "0.05", "--output", str(output)]) == 1
+    comparison = json.loads(output.read_text(encoding="utf-8"))["comparison"]
+    assert comparison["fake.fast"]["ratio"] == pytest.approx(1.1)
+    assert comparison["fake.fast"]["regression"]
+
+    # 데이터 크기가 다르면 비교하지 않음
+    assert benchmarks.main(["--baseline", str(baseline), "--threshold", "0.05", "--scale", "2",
+                            "--output", str(output)]) == 0
@@ -0,0 +1,72 @@
+from eventkit import Event
+from ib_insync import Order, OrderStatus, Stock, Trade
+
+from src.order.broker_IBKR import BrokerIBKR
+
+
+class FakeIB:
+    """주문/포지션 이벤트와 trades() 만 흉내낸 IB - cancelOrder 호출 기록"""
+
+    def __init__(self, trades):
+        self._trades = trades
+        self.cancelled = []
+        self.newOrderEvent = Event("newOrderEvent")
+        self.openOrderEvent = Event("openOrderEvent")
+        self.orderStatusEvent = Event("orderStatusEvent")
+        self.positionEvent = Event("positionEvent")
+        self.execDetailsEvent = Event("execDetailsEvent")
+
+    def trades(self):
+        return list(self._trades)
+
+    def positions(self):
+        return []
+
+    def cancelOrder(self, order):
+        self.cancelled.append(order.orderId)
+
+
+def _trade(order_id: int, symbol: str, status: str) -> Trade:
+    order = Order(orderId=order_id, permId=1000 + order_id, action="BUY", totalQuantity=1)
+    return Trade(Stock(symbol, "SMART", "USD"), order, OrderStatus(orderId=order_id, status=status))
+
+
+def _broker():
+    trades = [
+        _trade(1, "AAPL", "PendingSubmit"),
+        _trade(2, "AAPL", "PreSubmitted"),
+        _trade(3, "AAPL", "Submitted"),
+        _trade(4, "AAPL", "Filled"),
+        _trade(5, "AAPL", "Cancelled"),
+        _trade(6, "MSFT", "ApiPending"),
+        _trade(7, "MSFT", "Inactive"),
+    ]
+    ib = FakeIB(trades)
+    return ib, BrokerIBKR(ib), trades
+
+
+def test_open_orders_cover_all_active_states():
+    # Submitted 만이 아니라 접수 전/PreSubmitted 주문도 미체결로 본다
+    _, broker, _ = _broker()
+    open_orders = broker.get_open_orders()
+    assert sorted(o["order_id"] for o in open_orders) == [1001, 1002, 1003, 1006]
+    assert sorted(o["status"] for o in broker.get_open_orders("AAPL")) == \
+        ["PendingSubmit", "PreSubmitted", "Submitted"]
+
+
+def test_cancel_all_orders_cancels_active_states():
+    ib, broker, _ = _broker()
+    assert broker.cancel_all_orders("AAPL") == 3
+    assert sorted(ib.cancelled) == [1, 2, 3]
+
+    ib.cancelled.clear()
+    assert broker.cancel_all_orders() == 4
+    assert sorted(ib.cancelled) == [1, 2, 3, 6]
+
+
+def test_status_event_moves_order_out_of_open_set():
+    ib, broker, trades = _broker()
+    trades[1].orderStatus.status = "Filled"
+    ib.orderStatusEvent.emit(trades[1])
+    assert [o["order_id"] for o in broker.get_open_orders("AAPL") if o["order_id"] == 1002] == []
+    assert broker.get_order_status("2")["status"] == "Filled"
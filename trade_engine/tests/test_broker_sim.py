@@ -0,0 +1,76 @@
+import pytest
+from ib_insync import Stock
+
+from src.order.broker_sim import FillModel, SimBroker
+
+
+AAPL = Stock("AAPL", "SMART", "USD")
+
+
+def test_bracket_children_wait_for_entry_fill():
+    broker = SimBroker()
+    entry, take_profit, stop_loss = broker.submit_bracket(AAPL, "buy", 10, "limit", 99.0,
+                                                          stop_loss=95.0, take_profit=105.0)
+    assert (take_profit.side, take_profit.order_type) == ("sell", "limit")
+    assert (stop_loss.side, stop_loss.order_type) == ("sell", "stop")
+
+    # 진입 전에는 자식 주문이 미체결 목록에 없고 시세가 닿아도 체결되지 않음
+    broker.update_price("AAPL", 106.0)
+    assert take_profit.status == "PreSubmitted" and not take_profit.filled
+    assert [o["order_id"] for o in broker.get_open_orders("AAPL")] == [entry.order_id]
+
+    broker.update_price("AAPL", 99.0)
+    assert entry.is_filled
+    assert take_profit.status == stop_loss.status == "Submitted"
+
+
+def test_bracket_take_profit_cancels_stop_loss():
+    broker = SimBroker()
+    broker.update_price("AAPL", 100.0)
+    entry, take_profit, stop_loss = broker.submit_bracket(AAPL, "buy", 10, stop_loss=95.0, take_profit=105.0)
+    assert entry.is_filled
+
+    broker.update_price("AAPL", 105.5)
+    assert take_profit.is_filled and take_profit.avg_fill_price == 105.5  # 지정가보다 유리한 시세로 체결
+    assert stop_loss.status == "Cancelled"
+    assert broker.positions["AAPL"]["size"] == 0
+    assert broker.get_open_orders() == []
+
+
+def test_bracket_stop_loss_cancels_take_profit():
+    broker = SimBroker(fill_model=FillModel(slippage=0.01))
+    broker.update_price("AAPL", 100.0)
+    _, take_profit, stop_loss = broker.submit_bracket(AAPL, "sell", 5, stop_loss=110.0, take_profit=90.0)
+
+    broker.update_price("AAPL", 110.0)
+    assert stop_loss.is_filled and stop_loss.side == "buy"
+    assert stop_loss.avg_fill_price == pytest.approx(111.1)
+    assert take_profit.status == "Cancelled"
+    assert broker.orders[take_profit.order_id]["status"] == "cancelled"
+
+
+def test_cancelled_entry_cancels_children():
+    broker = SimBroker()
+    entry, take_profit, stop_loss = broker.submit_bracket(AAPL, "buy", 10, "limit", 90.0,
+                                                          stop_loss=85.0, take_profit=95.0)
+    assert broker.cancel_order(str(entry.order_id))
+    assert entry.status == take_profit.status == stop_loss.status == "Cancelled"
+    assert not broker.cancel_order(str(take_profit.order_id))
+
+
+@pytest.mark.parametrize("order_type", ["limit", "stop"])
+def test_priced_order_without_price_is_rejected(order_type):
+    broker = SimBroker()
+    with pytest.raises(ValueError):
+        broker.submit_order(AAPL, "buy", 1, order_type)
+    with pytest.raises(ValueError):
+        broker.submit_bracket(AAPL, "buy", 1, order_type, stop_loss=95.0)
+    assert broker.orders == {}
+
+
+def test_invalid_order_type_and_quantity_are_rejected():
+    broker = SimBroker()
+    with pytest.raises(ValueError):
+        broker.submit_order(AAPL, "buy", 1, "trailing")
+    with pytest.raises(ValueError):
+        broker.submit_order(AAPL, "buy", 0)
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.example1_strategy import Example1Strategy
+from src.strategies.example2_strategy import Example2Strategy
+from src.strategies.indicator_graph import INCREMENTAL, VECTORIZED, IndicatorGraph
+
+
+def make_price(n: int = 500, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 + rng.normal(0, 1, n).cumsum(), index=pd.date_range("2024-01-02", periods=n, freq="1min"))
+
+
+@pytest.mark.parametrize("kind, params", [("mean", {}), ("sum", {}), ("std", {}), ("std", {"ddof": 0}),
+                                          ("min", {}), ("max", {}), ("ema", {})])
+@pytest.mark.parametrize("window", [1, 7, 50])
+def test_incremental_matches_pandas(kind, params, window):
+    """증분 지표 값이 봉마다 pandas rolling/ewm 결과와 동일"""
+    price = make_price()
+    indicator = INCREMENTAL[kind](window, **params)
+    values = [indicator.update(x) for x in price.to_numpy()]
+    np.testing.assert_allclose(values, VECTORIZED[kind](price, window, **params).to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+def test_indicator_reset():
+    indicator = INCREMENTAL["mean"](3)
+    for x in (1.0, 2.0, 3.0):
+        indicator.update(x)
+    indicator.reset()
+    assert not indicator.ready and np.isnan(indicator.value)
+    assert [indicator.update(x) for x in (4.0, 5.0, 6.0)][-1] == 5.0
+
+
+def test_shared_indicator_is_read_only():
+    """공유 지표는 그래프만 갱신 - 전략은 .value 로 읽기만"""
+    price = make_price(50)
+    graph = IndicatorGraph(price)
+    shared = graph.indicator("mean", 5)
+    assert not hasattr(shared, "update")
+    assert shared.value == pytest.approx(price.iloc[-5:].mean())
+    graph.update(1000.0)
+    assert shared.value == pytest.approx((price.iloc[-4:].sum() + 1000.0) / 5)
+
+
+@pytest.mark.parametrize("use_graph", [False, True])
+def test_strategy_on_bar_matches_vectorized(use_graph):
+    """on_bar 로 1봉씩 진행한 시그널이 전체 가격의 벡터 시그널과 동일"""
+    price = make_price()
+    warm, live = price.iloc[:100], price.iloc[100:]
+    graph = IndicatorGraph(warm) if use_graph else None
+    strategy = Example1Strategy(warm, fast_window=5, slow_window=20, graph=graph)
+    strategy.prepare_live()
+
+    entries, exits = [], []
+    for timestamp, close in live.items():
+        if graph is not None:
+            graph.update(close)
+        entry, exit_, _ = strategy.on_bar(close, timestamp)
+        entries.append(entry)
+        exits.append(exit_)
+
+    vector = Example1Strategy(price, fast_window=5, slow_window=20)
+    vector.run()
+    want_entries, want_exits, _ = vector.get_signals()
+    assert entries == want_entries.iloc[100:].tolist()
+    assert exits == want_exits.iloc[100:].tolist()
+
+
+def test_strategies_sharing_graph_match_separate_runs():
+    """같은 그래프를 공유한 전략들의 봉별 시그널이 각자 지표를 가진 경우와 동일, 같은 지표는 1번만 계산"""
+    price = make_price()
+    warm, live = price.iloc[:100], price.iloc[100:]
+    configs = [(Example1Strategy, 5, 20), (Example2Strategy, 5, 20), (Example1Strategy, 3, 20)]
+
+    graph = IndicatorGraph(warm)
+    shared = [cls(warm, fast_window=fast, slow_window=slow, graph=graph) for cls, fast, slow in configs]
+    separate = [cls(warm, fast_window=fast, slow_window=slow) for cls, fast, slow in configs]
+    for strategy in shared + separate:
+        strategy.prepare_live()
+    assert graph.computed == 3 and graph.requested == 6
+
+    for timestamp, close in live.items():
+        graph.update(close)
+        for with_graph, alone in zip(shared, separate):
+            assert with_graph.on_bar(close, timestamp) == alone.on_bar(close, timestamp)
+
+
+def test_on_bar_rejects_stale_graph():
+    price = make_price(50)
+    graph = IndicatorGraph(price)
+    strategy = Example1Strategy(price, fast_window=3, slow_window=5, graph=graph)
+    strategy.prepare_live()
+    with pytest.raises(ValueError):
+        strategy.on_bar(price.iloc[-1] + 1.0)
+    graph.update(price.iloc[-1] + 1.0)
+    strategy.on_bar(price.iloc[-1] + 1.0)
@@ -0,0 +1,59 @@
+from ib_insync import Stock
+
+from src.order.broker_sim import FillModel, SimBroker
+from src.order.order_handle import OrderHandle
+from src.order.order_manager import OrderManager
+
+
+def _partial_fill_manager():
+    broker = SimBroker(fill_model=FillModel(max_fill_quantity=1))
+    broker.update_price("AAPL", 100.0)
+    return broker, OrderManager(broker)
+
+
+def test_fill_before_listener_is_applied():
+    # 지연 없는 SimBroker 는 submit_order 안에서 바로 1주 체결 → 리스너 등록 전 체결
+    broker, manager = _partial_fill_manager()
+    contract = Stock("AAPL", "SMART", "USD")
+
+    handle = manager.handle_signal(contract, "buy", 3)
+    assert handle.filled == 1 and not handle.is_done
+    assert manager.symbol_positions["AAPL"] == 1
+    assert manager.pending_quantity("AAPL") == 2
+
+    broker.update_price("AAPL", 101.0)
+    broker.update_price("AAPL", 102.0)
+    assert handle.is_filled
+    assert manager.symbol_positions["AAPL"] == broker.positions["AAPL"]["size"] == 3
+    assert manager.pending_quantity("AAPL") == 0
+
+
+def test_reversal_sized_from_full_position():
+    broker, manager = _partial_fill_manager()
+    contract = Stock("AAPL", "SMART", "USD")
+
+    manager.handle_signal(contract, "buy", 3)
+    broker.update_price("AAPL", 101.0)
+    broker.update_price("AAPL", 102.0)
+
+    reversal = manager.handle_signal(contract, "sell", 1)
+    assert reversal.quantity == 4
+
+
+def test_status_filled_ahead_of_fill_event():
+    # IB 는 orderStatus(filled) 가 execDetails 보다 먼저 올 수 있음 - 체결은 한 번만 반영
+    manager = OrderManager(SimBroker())
+    manager.symbol_positions["AAPL"] = 0.0
+    handle = manager._track(OrderHandle(1, "AAPL", "buy", 5))
+
+    handle.set_status("Submitted", filled=2)
+    assert manager.symbol_positions["AAPL"] == 2
+    assert manager.pending_quantity("AAPL") == 3
+
+    handle.add_fill(2, 100.0)
+    assert manager.symbol_positions["AAPL"] == 2
+
+    handle.add_fill(3, 100.0)
+    handle.set_status("Filled", filled=5)
+    assert manager.symbol_positions["AAPL"] == 5
+    assert manager.pending_orders["AAPL"] == []
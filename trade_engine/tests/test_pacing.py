@@ -0,0 +1,81 @@
+import asyncio
+import time
+from datetime import datetime
+
+from ib_insync import BarData, Future
+
+from src.data.data_loader import IBKRData
+from src.data.pacing import HistoricalPacer
+
+
+def test_pacer_limits_requests_per_contract():
+    """같은 계약은 contract_window 동안 per_contract 건까지만 - 다른 계약은 대기하지 않음"""
+    pacer = HistoricalPacer(per_contract=2, contract_window=0.2, identical_window=0.0)
+
+    async def run():
+        started = time.monotonic()
+        times = {}
+
+        async def request(contract, i):
+            await pacer.pace(contract, (contract, i))
+            times[(contract, i)] = time.monotonic() - started
+
+        await asyncio.gather(*(request("ES", i) for i in range(3)), request("NQ", 0))
+        return times
+
+    times = asyncio.run(run())
+    assert times[("ES", 0)] < 0.05 and times[("ES", 1)] < 0.05
+    assert times[("ES", 2)] >= 0.19
+    assert times[("NQ", 0)] < 0.05
+
+
+def test_pacer_paces_before_taking_slot():
+    """pacing 대기 중인 요청은 동시 진행 슬롯을 잡지 않아 다른 요청을 막지 않음"""
+    pacer = HistoricalPacer(identical_window=0.3, max_concurrent=2)
+
+    async def run():
+        await pacer.acquire("ES", "same")                     # 슬롯 1 사용 중
+        waiting = asyncio.create_task(pacer.acquire("ES", "same"))  # 동일 요청 - 0.3s pacing 대기
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        # 대기 중인 요청이 슬롯을 잡고 있다면 여기서 막힘
+        await asyncio.wait_for(pacer.acquire("NQ", "other"), timeout=0.1)
+        pacer.release()
+        await asyncio.wait_for(waiting, timeout=1.0)
+        pacer.release()
+        pacer.release()
+        return pacer._concurrent._value
+
+    assert asyncio.run(run()) == 2
+
+
+class FakeIB:
+    def __init__(self):
+        self.requests = []
+        self.running = 0
+        self.peak = 0
+
+    async def reqHistoricalDataAsync(self, contract, endDateTime, **kwargs):
+        self.requests.append((contract.symbol, endDateTime))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        end = datetime.strptime(endDateTime, "%Y%m%d %H:%M:%S")
+        return [BarData(date=end.replace(hour=h), open=1.0, high=1.0, low=1.0, close=float(h), volume=1.0,
+                        average=1.0, barCount=1) for h in range(end.hour - 3, end.hour)]
+
+
+def test_download_async_shares_pacer_and_bounds_concurrency():
+    ib = FakeIB()
+    data = IBKRData(ib, pacer=HistoricalPacer(identical_window=0.0))
+    contracts = [Future("ES", conId=1), Future("NQ", conId=2)]
+    # 1h 봉 청크 = 1 M - 석 달이면 계약당 청크 3~4개
+    result = asyncio.run(data.download_async(contracts, datetime(2024, 1, 1), datetime(2024, 3, 31, 12), "1h",
+                                             max_concurrency=2))
+
+    assert set(result) == {"ES", "NQ"}
+    assert ib.peak <= 2
+    assert len(data.pacer._sent) == len(ib.requests) >= 6   # 모든 요청이 같은 pacer 를 거침
+    assert data.pacer._concurrent._value == 50               # 슬롯 모두 반환
+    assert result["ES"]["timestamp"].is_monotonic_increasing
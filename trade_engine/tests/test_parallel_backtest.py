@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.order import parallel_backtest
+from src.order.parallel_backtest import BacktestJob, SharedPriceBlock, run_parallel_backtest
+
+
+class FailingStrategy:
+    def __init__(self, price, direction="both"):
+        self.price = price
+
+    def run(self):
+        raise ZeroDivisionError("boom")
+
+
+def make_prices():
+    index = pd.date_range("2024-01-02", periods=50, freq="1min", tz="US/Eastern")
+    return {"ES": pd.Series(np.arange(50, dtype=float), index=index),
+            "NQ": pd.Series(np.arange(20, dtype=float) * 2)}
+
+
+def test_shared_price_block_round_trip():
+    """공유 메모리로 넘긴 종가/인덱스(타임존 포함)를 워커에서 그대로 복원"""
+    prices = make_prices()
+    block = SharedPriceBlock(prices)
+    try:
+        parallel_backtest._init_worker(block.spec())
+        es = parallel_backtest._shared_series("ES", "job")
+        pd.testing.assert_series_equal(es, prices["ES"].rename("job"), check_freq=False, check_index_type=False)
+        assert es.index.tz is not None
+        nq = parallel_backtest._shared_series("NQ", "job")
+        assert isinstance(nq.index, pd.RangeIndex) and nq.tolist() == prices["NQ"].tolist()
+    finally:
+        for key in ("values", "index"):
+            parallel_backtest._WORKER_BLOCK.pop(key).close()
+        block.close()
+
+
+def test_failed_job_raises():
+    """잡 실패는 조용히 빠지지 않고 RuntimeError (원인 예외 연결)"""
+    with pytest.raises(RuntimeError, match="ES") as info:
+        run_parallel_backtest(make_prices(), [BacktestJob("ES", FailingStrategy)], max_workers=1)
+    assert isinstance(info.value.__cause__, ZeroDivisionError)
@@ -0,0 +1,82 @@
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.order.param_sweep import rolling_means, sweep_ma_windows, window_grid
+from src.order.runner import Runner
+from src.strategies.example1_strategy import Example1Strategy
+
+
+class FakePortfolio:
+    """vectorbtpro.Portfolio.from_signals 대역 - 호출 인자를 기록하고 열별 지표를 시그널 수로 계산"""
+    calls = []
+
+    def __init__(self, close, entries, exits, direction, **kwargs):
+        self.entries, self.exits = entries, exits
+        columns = entries.columns if isinstance(entries, pd.DataFrame) else None
+        count = entries.sum()
+        self.total_return = count.astype(float)
+        self.sharpe_ratio = -count.astype(float)
+        self.max_drawdown = exits.sum().astype(float)
+        self.trades = types.SimpleNamespace(count=lambda: count)
+        FakePortfolio.calls.append({"close": close, "direction": direction, "columns": columns, **kwargs})
+
+    @classmethod
+    def from_signals(cls, **kwargs):
+        return cls(**kwargs)
+
+
+@pytest.fixture
+def fake_vbt(monkeypatch):
+    FakePortfolio.calls = []
+    monkeypatch.setitem(sys.modules, "vectorbtpro", types.SimpleNamespace(Portfolio=FakePortfolio))
+    return FakePortfolio
+
+
+def make_price(n: int = 300) -> pd.Series:
+    rng = np.random.default_rng(0)
+    return pd.Series(100 + rng.normal(0, 1, n).cumsum(), index=pd.date_range("2024-01-02", periods=n, freq="1min"))
+
+
+def test_window_grid_and_rolling_means():
+    assert window_grid([5, 10, 20], [10, 20]) == [(5, 10), (5, 20), (10, 20)]
+    price = make_price()
+    means = rolling_means(price, [5, 10, 5])
+    assert sorted(means) == [5, 10]
+    np.testing.assert_allclose(means[10], price.rolling(10).mean().to_numpy())
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_sweep_matches_per_combo_strategy(fake_vbt, chunk_size):
+    """브로드캐스트 시그널 열이 조합별 전략 인스턴스의 시그널과 동일 (chunk 여부 무관)"""
+    price = make_price()
+    result = sweep_ma_windows(price, Example1Strategy, [3, 5, 8], [8, 13], chunk_size=chunk_size,
+                              metric="total_return")
+
+    assert len(result) == 5
+    for (fast, slow), row in result.iterrows():
+        strategy = Example1Strategy(price, fast_window=fast, slow_window=slow)
+        strategy.run()
+        entries, exits, _ = strategy.get_signals()
+        assert row["total_return"] == entries.sum()
+        assert row["max_drawdown"] == exits.sum()
+    assert result["total_return"].is_monotonic_decreasing
+    assert len(fake_vbt.calls) == (1 if chunk_size is None else 3)
+
+
+def test_sweep_rejects_unknown_metric():
+    with pytest.raises(ValueError):
+        sweep_ma_windows(make_price(), Example1Strategy, [3], [8], metric="profit")
+
+
+def test_runner_passes_fees_and_slippage_once(fake_vbt):
+    """fees/slippage 를 kwargs 로 넘겨도 중복 인자 오류 없이 한 번만 전달"""
+    price = make_price(20)
+    signals = pd.Series(False, index=price.index)
+    Runner(price=price).analyze_portfolio(signals, signals, "both", fees=0.001, slippage=0.0005, init_cash=1e6)
+    call = fake_vbt.calls[-1]
+    assert (call["fees"], call["slippage"], call["init_cash"]) == (0.001, 0.0005, 1e6)
+    assert call["close"] is price
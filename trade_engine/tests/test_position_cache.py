@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+from ib_insync import CommissionReport, Execution, Fill, Position, Stock
+
+from src.order.position_cache import PositionCache
+
+
+def _contract(symbol: str = "AAPL", con_id: int = 265598):
+    contract = Stock(symbol, "SMART", "USD")
+    contract.conId = con_id
+    return contract
+
+
+def _position(size: float, avg: float = 100.0, account: str = "DU1", contract=None) -> Position:
+    return Position(account, contract or _contract(), size, avg)
+
+
+def _fill(exec_id: str, side: str, shares: float, account: str = "DU1", contract=None,
+          time: datetime = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)) -> Fill:
+    execution = Execution(execId=exec_id, acctNumber=account, side=side, shares=shares, price=100.0)
+    return Fill(contract or _contract(), execution, CommissionReport(), time)
+
+
+def test_execution_after_snapshot_is_applied_regardless_of_fill_time():
+    # 체결 시각(서버 시각, 1초 단위)이 스냅샷 수신 시각보다 이르더라도 이벤트 순서로 반영
+    cache = PositionCache()
+    cache.on_position(_position(10))
+    cache.on_execution(None, _fill("e1", "BOT", 5, time=datetime(2000, 1, 1, tzinfo=timezone.utc)))
+    assert cache.get("AAPL")["size"] == 15
+
+
+def test_snapshot_replaces_execution_deltas_and_prunes_exec_ids():
+    cache = PositionCache()
+    cache.on_position(_position(10))
+    cache.on_execution(None, _fill("e1", "BOT", 5))
+    cache.on_execution(None, _fill("e1", "BOT", 5))  # 중복 execId
+    assert cache.get("AAPL")["size"] == 15
+
+    cache.on_position(_position(15, 101.0))
+    assert cache.get("AAPL") == {"size": 15, "avg_price": 101.0}
+    assert cache._exec_ids == {}
+
+    cache.on_execution(None, _fill("e2", "SLD", 15))
+    assert cache.get(con_id=265598)["size"] == 0
+    assert cache.all() == {}
+
+
+def test_lookup_by_con_id_and_symbol_across_accounts():
+    cache = PositionCache()
+    cache.on_position(_position(10, 100.0, account="DU1"))
+    cache.on_position(_position(30, 200.0, account="DU2"))
+    cache.on_position(_position(-2, 50.0, contract=_contract("MSFT", 272093)))
+
+    assert cache.get("AAPL") == {"size": 40, "avg_price": 175.0}
+    assert cache.get(con_id=265598) == cache.get("AAPL")
+    assert cache.get(con_id=272093)["size"] == -2
+    assert cache.get("TSLA") is None
+    assert set(cache.all()) == {"AAPL", "MSFT"}
+
+
+def test_execution_before_any_snapshot_creates_entry():
+    cache = PositionCache()
+    cache.on_execution(None, _fill("e1", "SLD", 3, contract=_contract("MSFT", 272093)))
+    assert cache.get("MSFT")["size"] == -3
+    assert cache.get(con_id=272093)["size"] == -3
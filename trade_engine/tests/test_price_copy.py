@@ -0,0 +1,40 @@
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infra.postgresql.price_copy import PRICE_FIELDS, decode_copy_binary
+
+PG_EPOCH = pd.Timestamp("2000-01-01")
+
+
+def encode_copy_binary(rows) -> bytes:
+    """PostgreSQL 바이너리 COPY 형식으로 인코딩 (헤더 + 행 + 트레일러)"""
+    out = [b"PGCOPY\n\xff\r\n\x00", struct.pack(">ii", 0, 0)]
+    for row in rows:
+        out.append(struct.pack(">h", len(PRICE_FIELDS)))
+        for (_, _, dtype), value in zip(PRICE_FIELDS, row):
+            fmt = ">q" if dtype == ">i8" else ">d"
+            out.append(struct.pack(">i", 8) + struct.pack(fmt, value))
+    out.append(struct.pack(">h", -1))
+    return b"".join(out)
+
+
+def test_decode_copy_binary():
+    times = pd.to_datetime(["2024-01-02 09:30", "2024-01-02 10:30"])
+    rows = [((t - PG_EPOCH) // pd.Timedelta("1us"), 1.0 + i, 2.0, 0.5, 1.5, 10.0, 7, float("nan"))
+            for i, t in enumerate(times)]
+    columns = decode_copy_binary(encode_copy_binary(rows))
+
+    np.testing.assert_array_equal(columns["timestamp"], times.to_numpy())
+    np.testing.assert_array_equal(columns["open"], [1.0, 2.0])
+    assert columns["count"].dtype == np.int64 and columns["count"].tolist() == [7, 7]
+    assert np.isnan(columns["vwap"]).all()
+    assert columns["close"].dtype.byteorder in ("=", "|")  # native 바이트 순서로 변환
+
+
+def test_decode_copy_binary_empty_and_invalid():
+    assert len(decode_copy_binary(encode_copy_binary([]))["timestamp"]) == 0
+    with pytest.raises(ValueError):
+        decode_copy_binary(b"COPY" + b"\x00" * 30)
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from ib_insync import Future
+
+from src.order.broker_sim import SimBroker
+from src.order.live_pipeline import LivePipeline
+from src.order.replay import ReplayEngine
+
+
+class AlwaysBuy:
+    """봉마다 매수 시그널 - 닫힌 봉 수/타임스탬프 확인용"""
+    incremental = True
+    price = None
+
+    def __init__(self):
+        self.timestamps = []
+
+    def prepare_live(self):
+        pass
+
+    def on_bar(self, price, timestamp=None):
+        self.timestamps.append(timestamp)
+        return True, False, "longonly"
+
+
+class RecordingOrders:
+    def __init__(self):
+        self.calls = []
+
+    def handle_signal(self, contract, signal, quantity):
+        self.calls.append((contract, signal, quantity))
+
+
+def make_bars(n: int) -> pd.DataFrame:
+    close = 100 + np.arange(n, dtype=float) * 0.01
+    return pd.DataFrame({"timestamp": pd.date_range("2024-01-02 09:30", periods=n, freq="5s", tz="UTC"),
+                         "open": close, "high": close, "low": close, "close": close, "volume": 1.0})
+
+
+def test_replay_flushes_last_partial_bar_with_given_contract():
+    orders = RecordingOrders()
+    pipeline = LivePipeline(interval="1min", source_seconds=5, order_manager=orders)
+    strategy = AlwaysBuy()
+    registered, replayed = Future("ES", exchange="CME"), Future("ES", "202412", exchange="CME")
+    pipeline.add_symbol("ES", strategy, registered)
+
+    # replay 는 ns 정수 시각을 넘기므로 봉 시각은 tz 없는 UTC
+    # 2분 30초 분량 → 닫힌 봉 2개 + 세션 종료 시 미완성 봉 1개
+    result = ReplayEngine(pipeline, SimBroker()).run({"ES": make_bars(30)}, {"ES": replayed})
+
+    assert result["bars"] == 30
+    assert strategy.timestamps == list(pd.date_range("2024-01-02 09:30", periods=3, freq="1min"))
+    assert result["stages"]["signal"]["calls"] == 3
+    assert [contract for contract, *_ in orders.calls] == [replayed] * 3
+    assert pipeline.flush() == 0
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.resampler import RangeBarBuilder, dollar_bar, range_bar, tick_bar, time_bar, volume_bar
+
+
+def make_ohlcv(n: int = 2000, seed: int = 0, gaps: bool = True) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq="1s")
+    if gaps:
+        index = index[np.sort(rng.choice(n, size=n * 3 // 4, replace=False))]
+    close = 100 + rng.normal(0, 0.3, len(index)).cumsum()
+    spread = rng.random(len(index))
+    return pd.DataFrame({"Open": close + rng.normal(0, 0.1, len(index)), "High": close + spread,
+                         "Low": close - spread, "Close": close,
+                         "Volume": rng.integers(1, 100, len(index)).astype(float)}, index=index)
+
+
+# ───── 기존(iterrows/resample) 구현 - 벡터 구현과 결과 비교용 ─────
+def baseline_time_bar(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    ohlcv = pd.DataFrame()
+    ohlcv['Open'] = df['Open'].resample(timeframe).first()
+    ohlcv['High'] = df['High'].resample(timeframe).max()
+    ohlcv['Low'] = df['Low'].resample(timeframe).min()
+    ohlcv['Close'] = df['Close'].resample(timeframe).last()
+    ohlcv['Volume'] = df['Volume'].resample(timeframe).sum()
+    return ohlcv.dropna()
+
+
+def baseline_range_bar(df: pd.DataFrame, price_column: str = 'Close', range_size: float = 1.0) -> pd.DataFrame:
+    bars = []
+    last_price = None
+    bar = {}
+    for ts, row in df.iterrows():
+        price = row[price_column]
+        if last_price is None:
+            last_price = price
+            bar = {'timestamp': ts, 'Open': price, 'High': price, 'Low': price, 'Close': price,
+                   'Volume': row['Volume']}
+            continue
+        bar['High'] = max(bar['High'], price)
+        bar['Low'] = min(bar['Low'], price)
+        bar['Close'] = price
+        bar['Volume'] += row['Volume']
+        if abs(price - bar['Open']) >= range_size:
+            bars.append(bar)
+            last_price = price
+            bar = {'timestamp': ts, 'Open': price, 'High': price, 'Low': price, 'Close': price, 'Volume': 0.0}
+    bars_df = pd.DataFrame(bars)
+    bars_df.set_index('timestamp', inplace=True)
+    return bars_df
+
+
+def baseline_bucket_bars(df: pd.DataFrame, closes_bar, include_partial: bool) -> pd.DataFrame:
+    """행 단위 참조 구현 - closes_bar(행, 봉에 넣은 행 수, 누적량) 가 True 인 행에서 봉을 닫음"""
+    bars, bar, count, amount = [], None, 0, 0.0
+    for ts, row in df.iterrows():
+        if bar is None:
+            bar = {'timestamp': ts, 'Open': row['Open'], 'High': row['High'], 'Low': row['Low'],
+                   'Close': row['Close'], 'Volume': 0.0}
+            count = 0
+        bar['High'] = max(bar['High'], row['High'])
+        bar['Low'] = min(bar['Low'], row['Low'])
+        bar['Close'] = row['Close']
+        bar['Volume'] += row['Volume']
+        count += 1
+        amount, closed = closes_bar(row, count, amount)
+        if closed:
+            bars.append(bar)
+            bar = None
+    if include_partial and bar is not None:
+        bars.append(bar)
+    if not bars:
+        return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+    return pd.DataFrame(bars).set_index('timestamp')
+
+
+def threshold_closer(threshold: float, dollar: bool):
+    def closes_bar(row, count, amount):
+        before = amount
+        amount += row['Volume'] * (row['Close'] if dollar else 1.0)
+        return amount, np.floor(amount / threshold) > np.floor(before / threshold)
+    return closes_bar
+
+
+@pytest.mark.parametrize("timeframe", ["5s", "1min", "7min"])
+def test_time_bar_matches_baseline(timeframe):
+    df = make_ohlcv()
+    result = time_bar(df, timeframe)
+    expected = baseline_time_bar(df, timeframe)
+    pd.testing.assert_frame_equal(result, expected, check_names=False, check_freq=False)
+
+
+@pytest.mark.parametrize("range_size", [0.5, 1.0, 3.0, 1000.0])
+def test_range_bar_matches_baseline(range_size):
+    """레인지 바가 기존 행 단위 구현과 값까지 동일 (거래량 합산 순서 포함)"""
+    df = make_ohlcv(5000, gaps=False)
+    result = range_bar(df, range_size=range_size)
+    if range_size == 1000.0:
+        assert len(result) == 0  # 완성된 봉 없음
+        return
+    expected = baseline_range_bar(df, range_size=range_size)
+    assert len(result) > 10
+    pd.testing.assert_frame_equal(result, expected, check_exact=True, check_index_type=False)
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 333, 5000])
+def test_range_bar_builder_chunks_match_baseline(chunk):
+    """청크 단위 RangeBarBuilder 결과를 이어 붙이면 전체 데이터의 기존 구현과 동일"""
+    df = make_ohlcv(3000, seed=1, gaps=False)
+    builder = RangeBarBuilder(range_size=1.0)
+    parts = [builder.update(df.iloc[i:i + chunk]) for i in range(0, len(df), chunk)]
+    result = pd.concat([part for part in parts if len(part)])
+    expected = baseline_range_bar(df, range_size=1.0)
+    pd.testing.assert_frame_equal(result, expected, check_exact=True, check_index_type=False)
+
+    tail = builder.flush()
+    assert len(tail) == 1 and tail["Close"].iloc[0] == df["Close"].iloc[-1]
+    assert builder.carry is None
+
+
+@pytest.mark.parametrize("include_partial", [False, True])
+@pytest.mark.parametrize("ticks", [1, 7, 100])
+def test_tick_bar_matches_reference(ticks, include_partial):
+    df = make_ohlcv(1000)
+    result = tick_bar(df, ticks=ticks, include_partial=include_partial)
+    expected = baseline_bucket_bars(df, lambda row, count, amount: (amount, count == ticks), include_partial)
+    pd.testing.assert_frame_equal(result, expected, check_names=False, check_index_type=False)
+    assert len(result) == (len(df) + ticks - 1) // ticks if include_partial else len(df) // ticks
+
+
+def test_tick_bar_keeps_old_argument_order():
+    """기존 시그니처 tick_bar(df, price_column, ...) 와 같은 위치 인자 순서"""
+    df = make_ohlcv(50, gaps=False).drop(columns=['Open', 'High', 'Low'])
+    result = tick_bar(df, 'Close', 10)
+    assert len(result) == 5
+    np.testing.assert_array_equal(result['High'], df['Close'].to_numpy().reshape(5, 10).max(axis=1))
+
+
+@pytest.mark.parametrize("include_partial", [False, True])
+@pytest.mark.parametrize("bar_func, dollar, threshold", [(volume_bar, False, 500.0), (volume_bar, False, 37.0),
+                                                          (dollar_bar, True, 50_000.0)])
+def test_cumsum_bars_match_reference(bar_func, dollar, threshold, include_partial):
+    df = make_ohlcv(1000, seed=2)
+    result = bar_func(df, threshold, include_partial=include_partial)
+    expected = baseline_bucket_bars(df, threshold_closer(threshold, dollar), include_partial)
+    pd.testing.assert_frame_equal(result, expected, check_names=False, check_index_type=False)
+
+
+def test_cumsum_bar_drops_only_incomplete_last_bar():
+    """마지막 행이 정확히 threshold 를 채우면 완성된 봉이므로 버리지 않음"""
+    df = make_ohlcv(4, gaps=False).assign(Volume=[5.0, 5.0, 5.0, 5.0])
+    assert len(volume_bar(df, 10.0)) == 2
+    assert len(volume_bar(df.iloc[:3], 10.0)) == 1
+    assert len(volume_bar(df.iloc[:3], 10.0, include_partial=True)) == 2
+
+
+def test_range_bar_include_partial():
+    df = make_ohlcv(2000, seed=3, gaps=False)
+    complete = range_bar(df, range_size=1.0)
+    with_partial = range_bar(df, range_size=1.0, include_partial=True)
+    builder = RangeBarBuilder(range_size=1.0)
+    expected = pd.concat([builder.update(df), builder.flush()])
+    pd.testing.assert_frame_equal(with_partial, expected)
+    pd.testing.assert_frame_equal(with_partial.iloc[:-1], complete)
+    assert with_partial['Close'].iloc[-1] == df['Close'].iloc[-1]
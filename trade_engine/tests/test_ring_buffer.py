@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.ring_buffer import PriceStore, RingBuffer
+from src.strategies.example1_strategy import Example1Strategy
+
+
+def make_price(n: int, tz=None) -> pd.Series:
+    return pd.Series(np.arange(n, dtype=float), index=pd.date_range("2024-01-02", periods=n, freq="1min", tz=tz, unit="ns"))
+
+
+def test_ring_buffer_view_is_contiguous():
+    buf = RingBuffer(4)
+    buf.extend(range(6))
+    np.testing.assert_array_equal(buf.view(), [2, 3, 4, 5])
+    assert buf.last() == 5
+    with pytest.raises(ValueError):
+        buf.view()[0] = 0  # 읽기 전용
+
+
+@pytest.mark.parametrize("tz", [None, "US/Eastern"])
+def test_price_store_matches_concat_last(tz):
+    """추가 후 Series 가 기존 concat + .last("2h") 결과와 같고 타임존 유지"""
+    price = make_price(300, tz)
+    store = PriceStore(capacity=256, retention="2h")
+    store.extend(price.iloc[:200])
+    for timestamp, value in price.iloc[200:].items():
+        store.append(timestamp, close=value)
+
+    series = store.to_series("close")
+    expected = price.loc[price.index > price.index[-1] - pd.Timedelta("2h")]
+    pd.testing.assert_series_equal(series, expected.rename("close"), check_freq=False)
+    assert series.index.tz == price.index.tz
+    np.testing.assert_array_equal(store.window("close", 3), price.iloc[-3:].to_numpy())
+
+
+def test_to_series_copy_is_independent():
+    store = PriceStore(capacity=4, retention=None)
+    store.extend(make_price(4))
+    copied = store.to_series()
+    store.append(pd.Timestamp("2024-01-03"), close=99.0)
+    assert copied.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_strategy_price_is_materialized_lazily():
+    """store 사용 시 봉 추가마다 Series 를 만들지 않고 price 를 읽을 때 1회만 생성"""
+    price = make_price(100, "US/Eastern")
+    strategy = Example1Strategy(price.iloc[:50])
+    strategy.use_price_store(capacity=64, retention=None)
+    for timestamp, value in price.iloc[50:].items():
+        strategy.update_price(pd.Series([value], index=[timestamp]))
+        assert strategy.price_window(1)[0] == value
+
+    assert strategy._stale
+    first = strategy.price
+    assert strategy.price is first  # 추가된 봉이 없으면 다시 만들지 않음
+    pd.testing.assert_series_equal(first, price.iloc[-64:].rename("close"), check_freq=False)
+    assert np.shares_memory(strategy.price_window(), strategy.store.view("close"))
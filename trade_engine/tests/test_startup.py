@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ENGINE_DIR = Path(__file__).resolve().parents[1]
+
+# 새 인터프리터에서 src.trade 를 import - IB 연결과 vectorbt import 를 기록
+SCRIPT = """
+import sys
+import ib_insync
+
+connects = []
+ib_insync.IB.connect = lambda self, *args, **kwargs: connects.append(args)
+ib_insync.IB.isConnected = lambda self: bool(connects)
+
+
+class BlockVectorbt:
+    imported = []
+
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in ("vectorbt", "vectorbtpro"):
+            self.imported.append(name)
+        return None
+
+
+sys.meta_path.insert(0, BlockVectorbt())
+
+from src.trade import tradeApp
+assert connects == [], connects
+assert BlockVectorbt.imported == [], BlockVectorbt.imported
+assert tradeApp._broker is None
+
+tradeApp.broker  # 처음 사용할 때 연결
+assert len(connects) == 1, connects
+assert tradeApp.broker is tradeApp.broker and len(connects) == 1
+print("ok")
+"""
+
+
+def test_import_trade_does_not_connect_or_import_vectorbt():
+    result = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ENGINE_DIR, capture_output=True, text=True,
+                            timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
@@ -0,0 +1,9 @@
+from utils import strategy_manifest
+
+
+def test_manifest_round_trips_through_tradelib(tmp_path):
+    output = tmp_path / "manifest" / "strategies.json"
+    assert strategy_manifest.main(["--output", str(output)]) == 0
+
+    from tradelib.strategies import load_strategies  # main() 이 모노레포 경로를 추가
+    assert load_strategies(output) == strategy_manifest.build_manifest()
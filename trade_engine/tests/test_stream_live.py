@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from ib_insync import Future, RealTimeBar, RealTimeBarList
+
+from src.data.data_loader import IBKRData
+
+
+class FakeIB:
+    """reqRealTimeBars 구독을 RealTimeBarList 로 흉내 - push() 로 새 5초봉 이벤트 발생"""
+
+    def __init__(self):
+        self.subscriptions = {}
+        self.cancelled = []
+
+    async def qualifyContractsAsync(self, contract):
+        return [contract]
+
+    def reqRealTimeBars(self, contract, bar_size, what_to_show, use_rth):
+        bars = RealTimeBarList()
+        self.subscriptions[contract.symbol] = bars
+        return bars
+
+    def cancelRealTimeBars(self, bars):
+        self.cancelled.append(bars)
+
+    def push(self, symbol: str, close: float):
+        bars = self.subscriptions[symbol]
+        time = datetime(2024, 1, 2, 9, 30) + timedelta(seconds=5 * len(bars))
+        bars.append(RealTimeBar(time=time, endTime=-1, open_=close, high=close, low=close, close=close,
+                                volume=1.0, wap=close, count=1))
+        bars.updateEvent.emit(bars, True)
+
+
+def run_stream(ib, contracts, scenario, **kwargs):
+    async def main():
+        stop = asyncio.Event()
+        task = asyncio.create_task(IBKRData(ib).stream_live(contracts, stop_event=stop, **kwargs))
+        await asyncio.sleep(0.01)  # 구독 완료 대기
+        await scenario()
+        stop.set()
+        return await task
+    return asyncio.run(main())
+
+
+def test_stream_live_delivers_each_new_bar():
+    ib = FakeIB()
+    received = []
+    ticks = []
+
+    async def handler(symbol, contract, bar):
+        received.append((symbol, bar.close))
+
+    async def scenario():
+        for i in range(5):
+            ib.push("ES", float(i))
+            ib.push("NQ", float(i) * 10)
+            await asyncio.sleep(0)
+        ib.subscriptions["ES"].updateEvent.emit(ib.subscriptions["ES"], False)  # 새 봉 없음 - 무시
+        await asyncio.sleep(0.05)
+
+    dropped = run_stream(ib, [Future("ES"), Future("NQ")], scenario, handler=handler, keep_bars=3,
+                         on_timer=lambda: ticks.append(1), timer_seconds=0.01)
+
+    assert [close for symbol, close in received if symbol == "ES"] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert [close for symbol, close in received if symbol == "NQ"] == [0.0, 10.0, 20.0, 30.0, 40.0]
+    assert dropped == {"ES": 0, "NQ": 0}
+    assert len(ib.subscriptions["ES"]) == 3                 # 최근 keep_bars 개만 유지
+    assert ticks                                           # 같은 루프에서 타이머 호출
+    assert len(ib.cancelled) == 2                          # 종료 시 구독 해제
+    assert len(ib.subscriptions["ES"].updateEvent) == 0     # 핸들러 제거
+
+
+def test_stream_live_drops_oldest_when_queue_full():
+    """소비가 밀리면 가장 오래된 봉부터 버리고 버린 수를 반환 - 다른 심볼은 영향 없음"""
+    ib = FakeIB()
+    received = []
+
+    def handler(symbol, contract, bar):
+        received.append((symbol, bar.close))
+
+    async def scenario():
+        for i in range(5):   # 소비 태스크가 돌기 전에 한꺼번에 도착
+            ib.push("ES", float(i))
+        ib.push("NQ", 1.0)
+        await asyncio.sleep(0.05)
+
+    dropped = run_stream(ib, [Future("ES"), Future("NQ")], scenario, handler=handler, queue_size=2)
+
+    assert dropped == {"ES": 3, "NQ": 0}
+    assert [close for symbol, close in received if symbol == "ES"] == [3.0, 4.0]
+    assert ("NQ", 1.0) in received
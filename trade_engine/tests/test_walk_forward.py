@@ -0,0 +1,72 @@
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.order import walk_forward as wf
+from src.strategies.example1_strategy import Example1Strategy
+
+
+class FakePortfolio:
+    """vectorbtpro.Portfolio.from_signals 대역 - 시그널 수로 지표, 가격 변화율로 수익률 계산"""
+
+    def __init__(self, close, entries, exits, direction, **kwargs):
+        count = entries.sum()
+        self.total_return = count.astype(float) if isinstance(count, pd.Series) else float(count)
+        self.sharpe_ratio = self.total_return
+        self.max_drawdown = exits.sum()
+        self.trades = types.SimpleNamespace(count=lambda: count)
+        self.returns = close.pct_change().fillna(0.0)
+
+    @classmethod
+    def from_signals(cls, **kwargs):
+        return cls(**kwargs)
+
+
+@pytest.fixture
+def fake_vbt(monkeypatch):
+    # 워커는 fork 로 만들어지므로 대역 모듈이 그대로 전달됨
+    monkeypatch.setitem(sys.modules, "vectorbtpro", types.SimpleNamespace(Portfolio=FakePortfolio))
+
+
+def make_price(n: int = 200) -> pd.Series:
+    rng = np.random.default_rng(0)
+    return pd.Series(100 + rng.normal(0, 1, n).cumsum(), index=pd.date_range("2024-01-02", periods=n, freq="1min"))
+
+
+def _fail_second_window(train, test, *args):
+    if train.index[0] != wf._FIRST_TRAIN_START:
+        raise ValueError("boom")
+    return wf._ORIGINAL_RUN_WINDOW(train, test, *args)
+
+
+def test_walk_forward_stitches_and_caches(fake_vbt, tmp_path):
+    price = make_price()
+    windows, returns, equity = wf.walk_forward(price, Example1Strategy, [3, 5], [8, 13], train_bars=100,
+                                               test_bars=50, max_workers=2, cache_dir=tmp_path)
+
+    assert len(windows) == 2 and not windows["cached"].any()
+    assert returns.index.equals(price.index[100:])
+    np.testing.assert_allclose(equity.to_numpy(), (1 + returns).cumprod().to_numpy())
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == [".pkl", ".pkl"]
+
+    cached, cached_returns, _ = wf.walk_forward(price, Example1Strategy, [3, 5], [8, 13], train_bars=100,
+                                                test_bars=50, cache_dir=tmp_path)
+    assert cached["cached"].all()
+    pd.testing.assert_series_equal(cached_returns, returns)
+
+
+def test_failed_window_raises_instead_of_stitching(fake_vbt, tmp_path, monkeypatch):
+    price = make_price()
+    monkeypatch.setattr(wf, "_FIRST_TRAIN_START", price.index[0], raising=False)
+    monkeypatch.setattr(wf, "_ORIGINAL_RUN_WINDOW", wf._run_window, raising=False)
+    monkeypatch.setattr(wf, "_run_window", _fail_second_window)
+
+    with pytest.raises(RuntimeError) as info:
+        wf.walk_forward(price, Example1Strategy, [3, 5], [8, 13], train_bars=100, test_bars=50,
+                        max_workers=1, cache_dir=tmp_path)
+    assert isinstance(info.value.__cause__, ValueError)
+    # 성공한 구간만 캐시에 남고 임시 파일은 없음
+    assert [p.suffix for p in tmp_path.iterdir()] == [".pkl"]
@@ -1 +1,275 @@
-#benchmark
\ No newline at end of file
+"""핫패스 벤치마크 - 재현 가능한 합성 OHLCV 로 측정하고 JSON 으로 저장/기준선 비교
+
+    python -m utils.benchmarks --output storage/bench.json
+    python -m utils.benchmarks --baseline storage/bench.json --threshold 0.2   # 회귀 시 종료 코드 1
+    python -m utils.benchmarks --only resampler --repeat 10
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def register(name: str):
+    """setup(size) -> 측정할 인자 없는 함수 를 반환하는 벤치마크 등록"""
+    def decorator(setup: Callable):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+class SkipBenchmark(Exception):
+    """선택 의존성이 없어 건너뛰는 벤치마크"""
+
+
+# ───── 합성 데이터 ─────
+def make_ohlcv(n: int, freq: str = "1min", seed: int = 42, start: str = "2024-01-02") -> pd.DataFrame:
+    """재현 가능한 합성 OHLCV (timestamp, open, high, low, close, volume) - 시드가 같으면 항상 같은 데이터"""
+    rng = np.random.default_rng(seed)
+    close = 4000 + np.cumsum(rng.normal(0, 0.5, n)).round(2)
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.3, n)).round(2)
+    return pd.DataFrame({
+        "timestamp": pd.date_range(start, periods=n, freq=freq),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": rng.integers(1, 500, n).astype(float),
+    })
+
+
+def _resampler_frame(n: int) -> pd.DataFrame:
+    df = make_ohlcv(n, freq="5s").set_index("timestamp")
+    return df.rename(columns=str.capitalize)
+
+
+# ───── 벤치마크 ─────
+@register("resampler.time_bar")
+def bench_time_bar(size: int):
+    from src.data.resampler import time_bar
+    df = _resampler_frame(size)
+    return lambda: time_bar(df, timeframe="5min")
+
+
+@register("resampler.range_bar")
+def bench_range_bar(size: int):
+    from src.data.resampler import range_bar
+    df = _resampler_frame(size)
+    return lambda: range_bar(df, range_size=2.0)
+
+
+@register("strategy.update_price")
+def bench_update_price(size: int):
+    from src.strategies.example1_strategy import Example1Strategy
+    df = make_ohlcv(size + 1000)
+    history = df.iloc[:size].set_index("timestamp")["close"]
+    new_bars = [df.iloc[i:i + 1].set_index("timestamp")["close"] for i in range(size, size + 1000)]
+
+    def run():
+        strategy = Example1Strategy(history, direction="both")
+        strategy.use_price_store(retention="2h")
+        for bar in new_bars:
+            strategy.update_price(bar)
+    return run
+
+
+@register("strategy.generate_signals")
+def bench_generate_signals(size: int):
+    from src.strategies.example1_strategy import Example1Strategy
+    price = make_ohlcv(size).set_index("timestamp")["close"]
+    strategy = Example1Strategy(price.iloc[:50], direction="both")
+    strategy.price = price
+    return strategy.run
+
+
+@register("strategy.on_bar")
+def bench_on_bar(size: int):
+    from src.strategies.example1_strategy import Example1Strategy
+    closes = make_ohlcv(size)["close"].tolist()
+    strategy = Example1Strategy(pd.Series(closes[:50]), direction="both")
+
+    def run():
+        for close in closes:
+            strategy.on_bar(close)
+    return run
+
+
+@register("runner.analyze_portfolio")
+def bench_analyze_portfolio(size: int):
+    try:
+        import vectorbtpro  # noqa: F401 - Runner 는 분석 시점에 import
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    from src.order.runner import Runner
+    from src.strategies.example1_strategy import Example1Strategy
+    price = make_ohlcv(size).set_index("timestamp")["close"]
+    strategy = Example1Strategy(price.iloc[:50], direction="both")
+    strategy.price = price
+    strategy.run()
+    runner = Runner(strategy)
+    entries, exits, direction = runner.run_back_signal()
+    return lambda: runner.analyze_portfolio(entries, exits, direction)
+
+
+@register("data_loader.assemble_chunks")
+def bench_assemble_chunks(size: int):
+    """IBKRData.download 의 청크 병합 - BarDataList → bars_to_columns → _assemble_chunks"""
+    from ib_insync import BarData
+    from src.data.bar_columns import bars_to_columns
+    from src.data.data_loader import _assemble_chunks
+    df = make_ohlcv(size)
+    rows = df.itertuples(index=False)
+    bars = [BarData(date=r.timestamp.to_pydatetime(), open=r.open, high=r.high, low=r.low, close=r.close,
+                    volume=r.volume, average=r.close, barCount=1) for r in rows]
+    chunk = max(1, len(bars) // 10)
+    chunks = [bars[i:i + chunk] for i in range(0, len(bars), chunk)][::-1]  # 최신 청크부터 수신
+    stt, end = df["timestamp"].iloc[0].to_pydatetime(), df["timestamp"].iloc[-1].to_pydatetime()
+    return lambda: _assemble_chunks([bars_to_columns(c) for c in chunks], stt, end)
+
+
+@register("order_manager.handle_signal")
+def bench_handle_signal(size: int):
+    import logging
+    from ib_insync import Future
+    from src.order.broker_sim import SimBroker
+    from src.order.order_manager import OrderManager
+    contracts = [Future(symbol) for symbol in ("ES", "NQ", "RTY", "YM")]
+    # 심볼마다 buy/sell 이 번갈아 나와 매번 반대 포지션 진입 주문이 발생
+    signals = [(contracts[i % len(contracts)], "buy" if (i // len(contracts)) % 2 == 0 else "sell")
+               for i in range(size)]
+
+    def run():
+        broker = SimBroker()
+        for contract in contracts:
+            broker.update_price(contract.symbol, 100.0)
+        manager = OrderManager(broker)
+        for contract, signal in signals:
+            manager.handle_signal(contract, signal, 1)
+
+    logging.getLogger("OrderManager").setLevel(logging.WARNING)
+    return run
+
+
+@register("tradelib.ibkr_to_dict")
+def bench_ibkr_to_dict(size: int):
+    try:
+        from tradelib.ibkr.converters import ibkr_to_dict
+    except ImportError:
+        # 모노레포 libs/common-py 경로에서 재시도
+        sys.path.append(str(Path(__file__).resolve().parents[2] / "libs" / "common-py"))
+        try:
+            from tradelib.ibkr.converters import ibkr_to_dict
+        except ImportError as e:
+            raise SkipBenchmark(str(e))
+    from ib_insync import ContractDetails, Future
+    details = [ContractDetails(contract=Future("ES", f"2024{m:02d}", "CME"), marketName="ES", minTick=0.25,
+                               longName="E-mini S&P 500") for m in range(1, 13)] * max(1, size // 12)
+    return lambda: [ibkr_to_dict(d) for d in details]
+
+
+DEFAULT_SIZES = {
+    "resampler.time_bar": 200_000,
+    "resampler.range_bar": 200_000,
+    "strategy.update_price": 5_000,
+    "strategy.generate_signals": 200_000,
+    "strategy.on_bar": 100_000,
+    "runner.analyze_portfolio": 200_000,
+    "data_loader.assemble_chunks": 50_000,
+    "order_manager.handle_signal": 20_000,
+    "tradelib.ibkr_to_dict": 2_000,
+}
+
+
+# ───── 실행/비교 ─────
+def measure(func: Callable, repeat: int = 5, warmup: int = 1) -> Dict:
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return {"min": min(times), "median": statistics.median(times), "mean": statistics.fmean(times),
+            "repeat": repeat}
+
+
+def run_benchmarks(only: Optional[List[str]] = None, repeat: int = 5, scale: float = 1.0) -> Dict:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        size = max(1, int(DEFAULT_SIZES.get(name, 10_000) * scale))
+        try:
+            func = setup(size)
+        except SkipBenchmark as e:
+            print(f"[SKIP] {name}: {e}")
+            results[name] = {"skipped": str(e)}
+            continue
+        results[name] = {"size": size, **measure(func, repeat)}
+        print(f"[BENCH] {name:<32} {results[name]['median'] * 1e3:10.2f} ms (n={size})")
+    return {
+        "meta": {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "numpy": np.__version__, "pandas": pd.__version__, "machine": platform.machine(),
+                 "scale": scale},
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2) -> Dict[str, Dict]:
+    """기준선 대비 median 비율 - ratio > 1 + threshold 이면 회귀"""
+    report = {}
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if "median" not in result or not base or "median" not in base or base.get("size") != result.get("size"):
+            continue
+        ratio = result["median"] / base["median"]
+        report[name] = {"baseline": base["median"], "current": result["median"], "ratio": ratio,
+                        "regression": ratio > 1 + threshold}
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="trade_engine 핫패스 벤치마크")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 허용 비율 (0.2 = 20%% 느려짐)")
+    parser.add_argument("--only", nargs="*", help="이름 접두사로 벤치마크 선택")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="데이터 크기 배율")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.only, args.repeat, args.scale)
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            report = compare(current, json.load(f), args.threshold)
+        current["comparison"] = report
+        for name, item in report.items():
+            mark = "REGRESSION" if item["regression"] else "ok"
+            print(f"[COMPARE] {name:<32} x{item['ratio']:.2f} {mark}")
+        if any(item["regression"] for item in report.values()):
+            exit_code = 1
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(current, indent=2, ensure_ascii=False))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,11 @@
 from typing import Dict
-from src.order.broker_IBKR import BrokerIBKR
+from src.order.broker_sim import SimBroker
 
-def generate_report(broker: BrokerIBKR, starting_cash: float = 100_000) -> Dict:
+def generate_report(broker: SimBroker, starting_cash: float = 100_000) -> Dict:
     """
     모의 브로커로부터 실행 결과 요약 리포트 생성
 
-    :param broker: MockBroker 인스턴스
+    :param broker: SimBroker 인스턴스
     :param starting_cash: 초기 자본금
     :return: 리포트 딕셔너리
     """
@@ -33,7 +33,7 @@ def generate_report(broker: BrokerIBKR, starting_cash: float = 100_000) -> Dict:
         "최종 포지션": positions
     }
 
-def simulate_balance_curve(broker: MockBroker, starting_cash: float):
+def simulate_balance_curve(broker: SimBroker, starting_cash: float):
     """
     체결된 주문 순서대로 가상의 잔고 흐름 생성
     """
@@ -0,0 +1,78 @@
+"""시작 시간 리포트 - 모듈 import 비용을 `python -X importtime` 으로 측정
+
+    python -m utils.startup_report                       # src.trade import 비용 상위 20개
+    python -m utils.startup_report main --top 30 --output storage/startup.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ENGINE_DIR = Path(__file__).resolve().parents[1]
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """`-X importtime` 출력 → [{"module", "self_us", "cumulative_us", "depth"}]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us),
+                     "depth": (len(name) - len(name.lstrip())) // 2})
+    return rows
+
+
+def measure_startup(module: str = "src.trade", python: str = sys.executable) -> Dict:
+    """새 인터프리터에서 module 을 import 하고 전체 소요 시간과 모듈별 import 비용 반환"""
+    started = time.perf_counter()
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], cwd=ENGINE_DIR,
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - started
+    rows = parse_importtime(proc.stderr)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode else None,
+        "wall_seconds": wall,
+        "import_seconds": sum(row["self_us"] for row in rows) / 1e6,
+        "modules": rows,
+    }
+
+
+def top_level(rows: List[Dict]) -> Dict[str, int]:
+    """최상위 패키지별 self 시간 합계(us) - 어떤 의존성이 무거운지 요약"""
+    totals: Dict[str, int] = {}
+    for row in rows:
+        package = row["module"].split(".")[0]
+        totals[package] = totals.get(package, 0) + row["self_us"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="trade_engine 시작(import) 시간 리포트")
+    parser.add_argument("module", nargs="?", default="src.trade", help="측정할 모듈 (기본 src.trade)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 패키지 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = measure_startup(args.module)
+    if not report["ok"]:
+        print(f"[Startup] {args.module} import 실패: {report['error']}")
+    print(f"[Startup] {args.module}: 전체 {report['wall_seconds']:.3f}s (import {report['import_seconds']:.3f}s)")
+    packages = top_level(report["modules"])
+    for package, self_us in list(packages.items())[:args.top]:
+        print(f"  {package:<32} {self_us / 1e3:10.1f} ms")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({**report, "packages": packages}, f, indent=2, ensure_ascii=False)
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
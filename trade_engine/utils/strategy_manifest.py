@@ -0,0 +1,42 @@
+"""전략 매니페스트 생성 - 레지스트리(entry point 포함) 전략 정보를 tradelib 매니페스트 JSON 으로 저장
+
+    python -m utils.strategy_manifest                     # libs/common-py/tradelib/strategies.json 갱신
+    python -m utils.strategy_manifest --output /tmp/strategies.json
+
+전략을 추가/변경하면 다시 실행해 커밋한다. 대시보드는 tradelib.strategies 로 이 파일만 읽는다.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.strategies.registry import strategy_registry
+
+MANIFEST_PATH = Path(__file__).resolve().parents[2] / "libs" / "common-py" / "tradelib" / "strategies.json"
+
+
+def build_manifest() -> List[Dict]:
+    """등록된 전략별 describe() - 파라미터 스키마 계산을 위해 여기서만 전략 모듈을 import"""
+    return [strategy_registry.describe(name) for name in strategy_registry.names()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="trade_engine 전략 매니페스트 생성")
+    parser.add_argument("--output", default=str(MANIFEST_PATH), help="매니페스트 JSON 경로")
+    args = parser.parse_args(argv)
+
+    try:
+        from tradelib.strategies import write_strategies
+    except ImportError:
+        # 모노레포 libs/common-py 경로에서 재시도
+        sys.path.append(str(MANIFEST_PATH.parents[1]))
+        from tradelib.strategies import write_strategies
+
+    strategies = build_manifest()
+    output = write_strategies(strategies, Path(args.output))
+    print(f"[Manifest] 전략 {len(strategies)}개 → {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
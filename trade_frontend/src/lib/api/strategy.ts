@@ -4,10 +4,10 @@ export interface StrategyInfo {
   name: string;
   description: string;
   version: string;
-  is_active: boolean;
+  is_active: boolean | null;
   parameters: Record<string, any>;
-  created_at: string;
-  updated_at: string;
+  created_at: string | null;
+  updated_at: string | null;
 }
 
 export interface StrategyPerformance {